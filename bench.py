@@ -0,0 +1,458 @@
+#!/usr/bin/env python
+#
+# Copyright (c) 2011, SmartFile <btimby@smartfile.com>
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#     * Redistributions of source code must retain the above copyright
+#       notice, this list of conditions and the following disclaimer.
+#     * Redistributions in binary form must reproduce the above copyright
+#       notice, this list of conditions and the following disclaimer in the
+#       documentation and/or other materials provided with the distribution.
+#     * Neither the name of the organization nor the
+#       names of its contributors may be used to endorse or promote products
+#       derived from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER BE LIABLE FOR ANY
+# DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES
+# (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND
+# ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+'''Benchmarks for python-libarchive.
+
+Generates synthetic data sets, archives them with every writable format and
+filter and times the read, write, seek and extract hot paths. Results are
+written as JSON so that runs can be compared.
+
+Run with: python bench.py [-o results.json] [--scale 0.1] [-n THREADS]'''
+
+import os, sys, time, json, random, shutil, platform, tempfile, threading, optparse
+
+from libarchive import Archive, SeekableArchive, FORMATS, FILTERS, BLOCK_SIZE
+from libarchive.parallel import ParallelGzipWriter, ParallelGzipArchive
+
+WORDS = ('lorem', 'ipsum', 'dolor', 'sit', 'amet', 'consectetur', 'adipiscing',
+         'elit', 'sed', 'do', 'eiusmod', 'tempor', 'incididunt', 'labore')
+
+# name: (number of files, size of each file, directory depth)
+DATASETS = {
+    'tiny': (2000, 100, 1),
+    'huge': (2, 32 * 1024 * 1024, 1),
+    'deep': (200, 4096, 24),
+}
+
+# Number of members read by the random access benchmark.
+RANDOM_READS = 100
+
+# Bytes written by the parallel gzip benchmark.
+PARALLEL_SIZE = 64 * 1024 * 1024
+
+# Size of the uncompressed tar read by the block size benchmark.
+BLOCKSIZE_SIZE = 256 * 1024 * 1024
+
+# (dataset, format) pairs that are not benchmarked. Libarchive's iso9660 writer
+# crashes when closing an archive with a directory tree this deep.
+SKIP = set([('deep', 'iso')])
+
+
+def make_data(size):
+    '''Returns size bytes of compressible pseudo-random text.'''
+    words = []
+    total = 0
+    while total < size:
+        word = random.choice(WORDS)
+        words.append(word)
+        total += len(word) + 1
+    return ' '.join(words)[:size]
+
+
+def make_dataset(path, files, size, depth):
+    '''Writes files of the given size below path, spread over a tree of the given
+    depth. Returns the relative paths.'''
+    data = make_data(size)
+    names = []
+    for i in range(files):
+        parts = ['d%d' % ((i + level) % 3) for level in range(depth - 1)]
+        name = os.path.join(*(parts + ['file%d.txt' % i]))
+        fullpath = os.path.join(path, name)
+        if not os.path.isdir(os.path.dirname(fullpath)):
+            os.makedirs(os.path.dirname(fullpath))
+        f = open(fullpath, 'wb')
+        f.write(data)
+        f.close()
+        names.append(name)
+    return names
+
+
+def make_archive(path, files, size, format='tar', filter='gz'):
+    f = open(path, 'wb')
+    a = Archive(f, 'w', format=format, filter=filter)
+    try:
+        for i in range(files):
+            data = make_data(size)
+            s = a.writestream('file%d.txt' % i, len(data))
+            s.write(data)
+            s.close()
+    finally:
+        a.close()
+        f.close()
+
+
+def read_archive(path, blocksize=None):
+    '''Reads every entry of an archive, returns the number of bytes read.'''
+    total = 0
+    a = Archive(path, blocksize=blocksize)
+    try:
+        for entry in a:
+            total += len(a.read(entry.size))
+    finally:
+        a.close()
+    return total
+
+
+def timed(func, *args):
+    start = time.time()
+    result = func(*args)
+    return time.time() - start, result
+
+
+def bench_writepath(path, format, filter, root, names):
+    f = open(path, 'wb')
+    a = Archive(f, 'w', format=format, filter=filter)
+    try:
+        for name in names:
+            a.writepath(os.path.join(root, name), name)
+    finally:
+        a.close()
+        f.close()
+    return len(names)
+
+
+def bench_writestream(path, format, filter, root, names):
+    f = open(path, 'wb')
+    a = Archive(f, 'w', format=format, filter=filter)
+    try:
+        for name in names:
+            data = open(os.path.join(root, name), 'rb').read()
+            s = a.writestream(name, len(data))
+            s.write(data)
+            s.close()
+    finally:
+        a.close()
+        f.close()
+    return len(names)
+
+
+def bench_iterate(path):
+    a = Archive(path)
+    try:
+        return len(list(a))
+    finally:
+        a.close()
+
+
+def bench_random_reads(path, names):
+    a = SeekableArchive(path)
+    try:
+        total = 0
+        for name in names:
+            total += len(a.read(name))
+        return total
+    finally:
+        a.close()
+
+
+def bench_stream(path):
+    a = SeekableArchive(path)
+    try:
+        total = 0
+        for entry in list(a):
+            if not entry.isfile():
+                continue
+            for data in a.readstream(entry.pathname):
+                total += len(data)
+        return total
+    finally:
+        a.close()
+
+
+def rss():
+    '''Returns the resident set size of this process in bytes, None when unknown.'''
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (IOError, OSError, ValueError):
+        return None
+
+
+def bench_entry_memory(path):
+    '''Returns the number of bytes of memory used per entry by a scanned archive.'''
+    before = rss()
+    a = SeekableArchive(path)
+    try:
+        for entry in a:
+            pass
+        after = rss()
+        if before is None or after is None or not a.entries:
+            return None
+        return float(after - before) / len(a.entries)
+    finally:
+        a.close()
+
+
+def read_syscalls():
+    '''Returns the number of read system calls made by this process, None when
+    unknown.'''
+    try:
+        with open('/proc/self/io') as f:
+            for line in f:
+                if line.startswith('syscr:'):
+                    return int(line.split()[1])
+    except (IOError, OSError, ValueError):
+        pass
+    return None
+
+
+def bench_blocksize(tmpdir, size):
+    '''Reads an uncompressed tar of size bytes with the fixed BLOCK_SIZE and with the
+    block size picked for the file, counting the read system calls.'''
+    path = os.path.join(tmpdir, 'blocksize.tar')
+    make_archive(path, 64, max(1, size // 64), 'tar', None)
+    results = []
+    try:
+        for blocksize in (BLOCK_SIZE, None):
+            result = {'op': 'read_blocksize', 'blocksize': blocksize or 'adaptive'}
+            before = read_syscalls()
+            result['seconds'], result['bytes'] = timed(read_archive, path, blocksize)
+            after = read_syscalls()
+            if before is not None and after is not None:
+                result['syscalls'] = after - before
+            if result['seconds']:
+                result['throughput'] = result['bytes'] / result['seconds']
+            results.append(result)
+    finally:
+        os.remove(path)
+    return results
+
+
+def view_archive(path):
+    '''Maps an archive and views every entry in place, returns the number of bytes
+    viewed.'''
+    total = 0
+    a = Archive(path, mmap=True)
+    try:
+        for entry in a:
+            total += len(a.readview())
+    finally:
+        a.close()
+    return total
+
+
+def bench_mmap(tmpdir, size):
+    '''Reads the entries of an uncompressed tar of size bytes into strings, and views
+    them in a mapping of the file without copying.'''
+    path = os.path.join(tmpdir, 'mmap.tar')
+    make_archive(path, 64, max(1, size // 64), 'tar', None)
+    results = []
+    try:
+        for op, func in (('read_copy', read_archive), ('read_mmap', view_archive)):
+            result = {'op': op}
+            before = read_syscalls()
+            result['seconds'], result['bytes'] = timed(func, path)
+            after = read_syscalls()
+            if before is not None and after is not None:
+                result['syscalls'] = after - before
+            if result['seconds']:
+                result['throughput'] = result['bytes'] / result['seconds']
+            results.append(result)
+    finally:
+        os.remove(path)
+    return results
+
+
+def bench_extractall(path, dest):
+    a = Archive(path)
+    try:
+        return a.extractall(dest)[0]
+    finally:
+        a.close()
+        shutil.rmtree(dest)
+
+
+def bench_formats(tmpdir, datasets, formats, filters):
+    '''Yields a result dict for every operation on every data set, format and filter.'''
+    for dataset in datasets:
+        files, size, depth = DATASETS[dataset]
+        root = os.path.join(tmpdir, dataset)
+        names = make_dataset(root, files, size, depth)
+        sample = [random.choice(names) for i in range(min(RANDOM_READS, len(names)))]
+        for format in formats:
+            if (dataset, format) in SKIP:
+                continue
+            for filter in filters:
+                path = os.path.join(tmpdir, 'bench-%s-%s-%s' % (dataset, format, filter))
+                ops = (
+                    ('writepath', bench_writepath, (path, format, filter, root, names)),
+                    ('writestream', bench_writestream, (path, format, filter, root, names)),
+                    ('iterate', bench_iterate, (path, )),
+                    ('random_reads', bench_random_reads, (path, sample)),
+                    ('stream', bench_stream, (path, )),
+                    ('entry_memory', bench_entry_memory, (path, )),
+                    ('extractall', bench_extractall, (path, path + '.out')),
+                )
+                for op, func, args in ops:
+                    result = {
+                        'dataset': dataset, 'format': format, 'filter': filter, 'op': op,
+                        'files': files, 'bytes': files * size,
+                    }
+                    try:
+                        result['seconds'], result['result'] = timed(func, *args)
+                    except Exception as e:
+                        result['error'] = str(e)
+                    yield result
+                if os.path.exists(path):
+                    result = {'dataset': dataset, 'format': format, 'filter': filter,
+                              'op': 'archive_size', 'result': os.path.getsize(path)}
+                    yield result
+                    os.remove(path)
+        shutil.rmtree(root)
+
+
+def bench_threads(tmpdir, num):
+    '''Reads num independent archives using 1..num threads. When the GIL is
+    released around libarchive calls the wall time should drop close to
+    linearly with the number of threads (up to the number of cores).'''
+    paths = []
+    for i in range(num):
+        path = os.path.join(tmpdir, 'threads%d.tar.gz' % i)
+        make_archive(path, 4, 1024 * 1024)
+        paths.append(path)
+    results = []
+    base = None
+    for threads in range(1, num + 1):
+        chunks = [paths[i::threads] for i in range(threads)]
+        workers = [threading.Thread(target=lambda c: [read_archive(p) for p in c], args=(c, )) for c in chunks]
+        start = time.time()
+        for w in workers:
+            w.start()
+        for w in workers:
+            w.join()
+        elapsed = time.time() - start
+        if base is None:
+            base = elapsed
+        results.append({'op': 'threads', 'threads': threads, 'archives': num,
+                        'seconds': elapsed, 'speedup': base / elapsed})
+    for path in paths:
+        os.remove(path)
+    return results
+
+
+def write_gzip(path, data, workers):
+    '''Writes data as a single member, with libarchive's gzip filter if workers is
+    None, else with a ParallelGzipWriter.'''
+    f = open(path, 'wb')
+    if workers is None:
+        a = Archive(f, 'w', format='tar', filter='gz')
+    else:
+        a = ParallelGzipWriter(f, workers, format='tar')
+    try:
+        s = a.writestream('data', len(data))
+        s.write(data)
+        s.close()
+    finally:
+        a.close()
+        f.close()
+    return os.path.getsize(path)
+
+
+def read_gzip(path, workers):
+    if workers is None:
+        a = Archive(path)
+    else:
+        a = ParallelGzipArchive(path, workers)
+    try:
+        return sum(len(a.read(e.size)) for e in a)
+    finally:
+        a.close()
+
+
+def bench_parallel_gzip(tmpdir, num, size):
+    '''Writes and reads size bytes with libarchive's gzip filter (workers is None) and
+    with the parallel block gzip writer and reader using 1..num workers.'''
+    data = make_data(size)
+    results = []
+    for workers in [None] + range(1, num + 1):
+        path = os.path.join(tmpdir, 'parallel.tar.gz')
+        for op, func, args in (('parallel_gzip_write', write_gzip, (path, data, workers)),
+                               ('parallel_gzip_read', read_gzip, (path, workers))):
+            result = {'op': op, 'workers': workers, 'bytes': size}
+            try:
+                result['seconds'], result['result'] = timed(func, *args)
+            except Exception as e:
+                result['error'] = str(e)
+            results.append(result)
+        os.remove(path)
+    for op in ('parallel_gzip_write', 'parallel_gzip_read'):
+        base = [r for r in results if r['op'] == op and r['workers'] is None][0]
+        for result in results:
+            if result['op'] == op and 'seconds' in result and 'seconds' in base:
+                result['speedup'] = base['seconds'] / result['seconds']
+    return results
+
+
+def writable(items):
+    return sorted(name for name, funcs in items.items() if funcs[1] is not None)
+
+
+def main():
+    parser = optparse.OptionParser()
+    parser.add_option('-o', '--output', help='write the JSON results to this file')
+    parser.add_option('-n', '--num', type='int', default=4,
+                      help='number of archives and maximum number of threads')
+    parser.add_option('--scale', type='float', default=1.0,
+                      help='multiply the number and size of files by this factor')
+    parser.add_option('--datasets', default=','.join(sorted(DATASETS)),
+                      help='comma separated data sets (%s)' % ', '.join(sorted(DATASETS)))
+    parser.add_option('--formats', default=','.join(writable(FORMATS)),
+                      help='comma separated formats')
+    parser.add_option('--filters', default=','.join(str(f) for f in writable(FILTERS)),
+                      help='comma separated filters, None for no compression')
+    options, args = parser.parse_args()
+    for name, (files, size, depth) in DATASETS.items():
+        DATASETS[name] = (max(1, int(files * options.scale)), max(1, int(size * options.scale)), depth)
+    filters = [None if f == 'None' else f for f in options.filters.split(',')]
+    tmpdir = tempfile.mkdtemp()
+    try:
+        results = list(bench_formats(tmpdir, options.datasets.split(','), options.formats.split(','), filters))
+        results.extend(bench_threads(tmpdir, options.num))
+        results.extend(bench_blocksize(tmpdir, max(1, int(BLOCKSIZE_SIZE * options.scale))))
+        results.extend(bench_mmap(tmpdir, max(1, int(BLOCKSIZE_SIZE * options.scale))))
+        results.extend(bench_parallel_gzip(tmpdir, options.num, max(1, int(PARALLEL_SIZE * options.scale))))
+    finally:
+        shutil.rmtree(tmpdir)
+    report = {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'time': time.time(),
+        'scale': options.scale,
+        'results': results,
+    }
+    if options.output:
+        f = open(options.output, 'w')
+    else:
+        f = sys.stdout
+    json.dump(report, f, indent=1, sort_keys=True)
+    f.write('\n')
+    if f is not sys.stdout:
+        f.close()
+
+
+if __name__ == '__main__':
+    main()
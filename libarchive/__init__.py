@@ -24,21 +24,52 @@
 # SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 import os
+import errno
+import json
+import mmap
 import stat
+import struct
 import sys
 import time
+import tempfile
 import warnings
+import weakref
+import zlib
+from array import array
 
 from libarchive import _libarchive
-try:
-    from cStringIO import StringIO
-except ImportError:
-    from StringIO import StringIO
 
 # Suggested block size for libarchive. Libarchive may adjust it.
 BLOCK_SIZE = 10240
 
-MTIME_FORMAT = ''
+# Bounds of the block size used to read regular files when none is given, it grows
+# with the size of the file. See _read_blocksize().
+MIN_READ_BLOCK_SIZE = 1024 * 1024
+MAX_READ_BLOCK_SIZE = 4 * 1024 * 1024
+
+# Regular files up to this size are prefetched as a whole when opened for reading.
+WILLNEED_SIZE = 32 * 1024 * 1024
+
+# Chunk size used when copying files into an archive.
+COPY_BUFFER_SIZE = 64 * 1024
+
+# Amount of data EntryWriteStream keeps in memory when the entry size is unknown.
+SPOOL_SIZE = 1024 * 1024
+
+# Default flags for Archive.extractall(), see the ARCHIVE_EXTRACT_* constants.
+EXTRACT_FLAGS = (_libarchive.ARCHIVE_EXTRACT_TIME | _libarchive.ARCHIVE_EXTRACT_PERM |
+                 _libarchive.ARCHIVE_EXTRACT_SECURE_NODOTDOT | _libarchive.ARCHIVE_EXTRACT_SECURE_SYMLINKS |
+                 _libarchive.ARCHIVE_EXTRACT_SECURE_NOABSOLUTEPATHS)
+
+MTIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+# Suffix and version of the sidecar entry index written by SeekableArchive.
+INDEX_SUFFIX = '.idx'
+INDEX_VERSION = 1
+
+# Array type used for the 64 bit columns of EntryTable, 'l' is only 32 bits wide
+# on some platforms.
+INT64_TYPECODE = 'l' if array('l').itemsize >= 8 else 'd'
 
 # Default encoding scheme.
 ENCODING = 'utf-8'
@@ -64,8 +95,32 @@ FILTERS = {
     None: (_libarchive.archive_read_support_filter_all, _libarchive.archive_write_add_filter_none),
     'gz': (_libarchive.archive_read_support_filter_gzip, _libarchive.archive_write_add_filter_gzip),
     'bz2': (_libarchive.archive_read_support_filter_bzip2, _libarchive.archive_write_add_filter_bzip2),
+    'xz': (_libarchive.archive_read_support_filter_xz, _libarchive.archive_write_add_filter_xz),
+    'lzma': (_libarchive.archive_read_support_filter_lzma, _libarchive.archive_write_add_filter_lzma),
+    'lzip': (_libarchive.archive_read_support_filter_lzip, _libarchive.archive_write_add_filter_lzip),
+    'compress': (_libarchive.archive_read_support_filter_compress, _libarchive.archive_write_add_filter_compress),
 }
 
+
+def _write_filter(code):
+    '''Returns a function adding the filter with the given code to an archive being
+    written, None if the system libarchive does not have it.'''
+    a = _libarchive.archive_write_new()
+    try:
+        if _libarchive.archive_write_add_filter(a, code) != _libarchive.ARCHIVE_OK:
+            return None
+    finally:
+        _libarchive.archive_write_free(a)
+    return lambda a: _libarchive.archive_write_add_filter(a, code)
+
+# Newer filters are only available when the system libarchive was built with them,
+# archive_read_support_filter_all() covers them for reading.
+for name, code in (('zstd', _libarchive.ARCHIVE_FILTER_ZSTD), ('lz4', _libarchive.ARCHIVE_FILTER_LZ4)):
+    func = _write_filter(code)
+    if func is not None:
+        FILTERS[name] = (_libarchive.archive_read_support_filter_all, func)
+del name, code, func
+
 # Map file extensions to formats and filters. To support quick detection.
 FORMAT_EXTENSIONS = {
     '.tar': 'tar',
@@ -83,6 +138,83 @@ FORMAT_EXTENSIONS = {
 FILTER_EXTENSIONS = {
     '.gz': 'gz',
     '.bz2': 'bz2',
+    '.xz': 'xz',
+    '.lzma': 'lzma',
+    '.lz': 'lzip',
+    '.Z': 'compress',
+    '.zst': 'zstd',
+    '.lz4': 'lz4',
+}
+
+# Number of bytes read from the start of a file by sniff_format().
+SNIFF_SIZE = 4096
+
+# Number of sniff_format() results to remember.
+SNIFF_CACHE_SIZE = 10000
+
+# (offset, magic, name) matched against the start of a file by sniff_format(). Format
+# magic is matched against the decompressed data if a filter was found.
+FILTER_MAGIC = (
+    (0, '\x1f\x8b', 'gz'),
+    (0, 'BZh', 'bz2'),
+    (0, '\xfd7zXZ\x00', 'xz'),
+    (0, 'LZIP', 'lzip'),
+    (0, '\x1f\x9d', 'compress'),
+    (0, '\x28\xb5\x2f\xfd', 'zstd'),
+    (0, '\x04\x22\x4d\x18', 'lz4'),
+)
+FORMAT_MAGIC = (
+    (257, 'ustar\x0000', 'tar'),
+    (257, 'ustar  \x00', 'gnu'),
+    (0, 'PK\x03\x04', 'zip'),
+    (0, 'PK\x05\x06', 'zip'),
+    (0, 'PK\x07\x08', 'zip'),
+    (0, 'Rar!\x1a\x07', 'rar'),
+    (0, '7z\xbc\xaf\x27\x1c', '7zip'),
+    (0, '!<arch>\n', 'ar'),
+    (0, 'MSCF\x00\x00\x00\x00', 'cab'),
+    (0, '070701', 'cpio'),
+    (0, '070702', 'cpio'),
+    (0, '070707', 'cpio'),
+    (0, '\xc7\x71', 'cpio'),
+    (0, '\x71\xc7', 'cpio'),
+    # rpm, libarchive reads the cpio archive within.
+    (0, '\xed\xab\xee\xdb', 'cpio'),
+    (0, 'xar!', 'xar'),
+)
+# Dictionary sizes of lzma-alone streams written by common tools, powers of two from
+# 4K to 128M.
+LZMA_DICT_SIZES = frozenset(1 << n for n in range(12, 28))
+# iso9660 volume descriptors follow 32K of system area, beyond the first read.
+ISO_MAGIC = (32769, 'CD001')
+# lha headers carry the compression method at offset 2.
+LHA_METHODS = ('-lh0-', '-lh1-', '-lh4-', '-lh5-', '-lh6-', '-lh7-', '-lhd-', '-lzs-', '-lz4-', '-lz5-')
+
+# Map libarchive's format and filter codes to FORMATS and FILTERS.
+FORMAT_CODES = {
+    _libarchive.ARCHIVE_FORMAT_TAR: 'tar',
+    _libarchive.ARCHIVE_FORMAT_TAR_PAX_INTERCHANGE: 'pax',
+    _libarchive.ARCHIVE_FORMAT_TAR_PAX_RESTRICTED: 'pax',
+    _libarchive.ARCHIVE_FORMAT_TAR_GNUTAR: 'gnu',
+    _libarchive.ARCHIVE_FORMAT_ZIP: 'zip',
+    _libarchive.ARCHIVE_FORMAT_RAR: 'rar',
+    _libarchive.ARCHIVE_FORMAT_7ZIP: '7zip',
+    _libarchive.ARCHIVE_FORMAT_AR: 'ar',
+    _libarchive.ARCHIVE_FORMAT_CAB: 'cab',
+    _libarchive.ARCHIVE_FORMAT_CPIO: 'cpio',
+    _libarchive.ARCHIVE_FORMAT_ISO9660: 'iso',
+    _libarchive.ARCHIVE_FORMAT_LHA: 'lha',
+    _libarchive.ARCHIVE_FORMAT_XAR: 'xar',
+}
+FILTER_CODES = {
+    _libarchive.ARCHIVE_FILTER_GZIP: 'gz',
+    _libarchive.ARCHIVE_FILTER_BZIP2: 'bz2',
+    _libarchive.ARCHIVE_FILTER_XZ: 'xz',
+    _libarchive.ARCHIVE_FILTER_LZMA: 'lzma',
+    _libarchive.ARCHIVE_FILTER_LZIP: 'lzip',
+    _libarchive.ARCHIVE_FILTER_COMPRESS: 'compress',
+    _libarchive.ARCHIVE_FILTER_ZSTD: 'zstd',
+    _libarchive.ARCHIVE_FILTER_LZ4: 'lz4',
 }
 
 
@@ -110,6 +242,15 @@ def call_and_check(func, archive, *args):
         raise Exception('Fatal error executing function, message is: %s.' % get_error(archive))
 
 
+def _option_value(value):
+    '''Converts an option value for libarchive. None and False unset the option.'''
+    if value is None or value is False:
+        return None
+    if value is True:
+        return '1'
+    return str(value)
+
+
 def get_func(name, items, index):
     item = items.get(name, None)
     if item is None:
@@ -148,8 +289,8 @@ def is_archive(f, formats=(None, ), filters=(None, )):
 
     This procedure is quite costly, so you should avoid calling it unless you are reasonably
     sure that the given file is an archive. In other words, you may wish to filter large
-    numbers of file names using is_archive_name() before double-checking the positives with
-    this function.
+    numbers of file names using is_archive_name() or sniff_format() before double-checking
+    the positives with this function.
 
     This function will return True if the file can be opened as an archive using the given
     format(s)/filter(s).'''
@@ -177,6 +318,242 @@ def is_archive(f, formats=(None, ), filters=(None, )):
         _libarchive.archive_read_free(a)
 
 
+def _fileno(f):
+    '''Returns the fd of the file object f, None if it has none.'''
+    try:
+        return f.fileno()
+    except (AttributeError, IOError, ValueError):
+        return None
+
+
+def _read_blocksize(fd):
+    '''Returns the block size for reading fd. Pipes and sockets return at most a few
+    pages per read. Regular files are read in blocks of MIN_READ_BLOCK_SIZE (or the
+    whole file if smaller), doubled while the file holds more than 1024 of them, up to
+    MAX_READ_BLOCK_SIZE.'''
+    if fd is None:
+        return COPY_BUFFER_SIZE
+    try:
+        st = os.fstat(fd)
+    except OSError:
+        return BLOCK_SIZE
+    if not stat.S_ISREG(st.st_mode):
+        return COPY_BUFFER_SIZE
+    blocksize = MIN_READ_BLOCK_SIZE
+    while blocksize < MAX_READ_BLOCK_SIZE and blocksize * 1024 < st.st_size:
+        blocksize *= 2
+    # No need for a buffer larger than the file.
+    size = -(-st.st_size // COPY_BUFFER_SIZE) * COPY_BUFFER_SIZE
+    return min(blocksize, max(size, COPY_BUFFER_SIZE))
+
+
+def _advise_sequential(fd):
+    '''Tells the kernel that fd will be read sequentially, which enlarges its
+    read-ahead. Small files are prefetched as a whole.'''
+    try:
+        st = os.fstat(fd)
+    except OSError:
+        return
+    if not stat.S_ISREG(st.st_mode):
+        return
+    _libarchive.fadvise(fd, 0, 0, _libarchive.POSIX_FADV_SEQUENTIAL)
+    if st.st_size <= WILLNEED_SIZE:
+        _libarchive.fadvise(fd, 0, st.st_size, _libarchive.POSIX_FADV_WILLNEED)
+
+
+def _map_file(fd):
+    '''Maps the regular file fd for reading and tells the kernel it will be read
+    sequentially. Returns None if it can not be mapped (empty files, pipes).'''
+    try:
+        st = os.fstat(fd)
+        if not stat.S_ISREG(st.st_mode) or not st.st_size:
+            return None
+        m = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+    except (EnvironmentError, ValueError, OverflowError):
+        return None
+    _libarchive.madvise_buffer(m, 0, 0, _libarchive.MADV_SEQUENTIAL)
+    if st.st_size <= WILLNEED_SIZE:
+        _libarchive.madvise_buffer(m, 0, 0, _libarchive.MADV_WILLNEED)
+    return m
+
+
+def _bytes_at(data, offset, size):
+    '''Returns size bytes at offset in a str, bytearray, memoryview or mmap.'''
+    chunk = data[offset:offset + size]
+    return chunk.tobytes() if isinstance(chunk, memoryview) else str(chunk)
+
+
+def _view(data, offset, size):
+    '''Returns a memoryview of size bytes at offset in a str, bytearray, memoryview or
+    mmap, without copying.'''
+    try:
+        view = memoryview(data)
+    except TypeError:
+        # mmap only has the old buffer interface.
+        view = memoryview(buffer(data))
+    return view[offset:offset + size]
+
+
+class _Buffer(object):
+    '''Wraps the data passed to Archive.from_buffer().'''
+    def __init__(self, data):
+        self.data = data
+
+
+def _seekable(f):
+    if hasattr(f, 'seekable'):
+        try:
+            return bool(f.seekable())
+        except (IOError, ValueError):
+            return False
+    return hasattr(f, 'seek') and hasattr(f, 'tell')
+
+
+def _pread(fd, offset, size):
+    '''Reads up to size bytes at offset from fd. Moves the fd's position.'''
+    os.lseek(fd, offset, os.SEEK_SET)
+    data = []
+    while size > 0:
+        chunk = os.read(fd, size)
+        if not chunk:
+            break
+        data.append(chunk)
+        size -= len(chunk)
+    return ''.join(data)
+
+
+def _match_magic(data, magic):
+    for offset, value, name in magic:
+        if data[offset:offset + len(value)] == value:
+            return name
+
+
+def _is_tar_header(data):
+    '''Old style tar headers have no magic, but do have a checksum.'''
+    if len(data) < 512:
+        return False
+    try:
+        checksum = int(data[148:156].strip(' \x00') or '-1', 8)
+    except ValueError:
+        return False
+    header = data[:512]
+    return checksum == sum(bytearray(header[:148] + ' ' * 8 + header[156:]))
+
+
+def _is_lzma_header(data):
+    '''lzma-alone streams have no magic, check their header like libarchive's bidder:
+    a valid properties byte and a usual dictionary size.'''
+    if len(data) < 13 or ord(data[0]) > (4 * 5 + 4) * 9 + 8:
+        return False
+    dictsize, = struct.unpack('<L', data[1:5])
+    if dictsize in LZMA_DICT_SIZES:
+        return True
+    # Sizes in whole MiB are only accepted with the usual properties and no
+    # uncompressed size, see lzma_bidder_bid().
+    return (data[0] == '\x5d' and data[5:13] == '\xff' * 8 and
+            0x300000 <= dictsize <= 0x3f00000 and not dictsize & 0xfffff)
+
+
+def _sniff_libarchive(fd):
+    '''Lets libarchive bid on the file. Returns (format, filter).'''
+    a = _libarchive.archive_read_new()
+    e = _libarchive.archive_entry_new()
+    try:
+        _libarchive.archive_read_support_format_all(a)
+        _libarchive.archive_read_support_filter_all(a)
+        os.lseek(fd, 0, os.SEEK_SET)
+        # Warnings are fine, all we want is the result of the bidding.
+        if _libarchive.archive_read_open_fd(a, fd, BLOCK_SIZE) < _libarchive.ARCHIVE_WARN:
+            return None, None
+        if _libarchive.archive_read_next_header2(a, e) < _libarchive.ARCHIVE_WARN:
+            return None, None
+        code = _libarchive.archive_format(a)
+        format = FORMAT_CODES.get(code, FORMAT_CODES.get(code & _libarchive.ARCHIVE_FORMAT_BASE_MASK))
+        return format, FILTER_CODES.get(_libarchive.archive_filter_code(a, 0))
+    finally:
+        _libarchive.archive_read_close(a)
+        _libarchive.archive_read_free(a)
+        _libarchive.archive_entry_free(e)
+
+
+def _sniff(fd):
+    head = _pread(fd, 0, SNIFF_SIZE)
+    filter = _match_magic(head, FILTER_MAGIC)
+    if filter is None and _is_lzma_header(head):
+        filter = 'lzma'
+    if filter is None:
+        data = head
+    elif filter == 'gz':
+        try:
+            data = zlib.decompressobj(16 + zlib.MAX_WBITS).decompress(head, SNIFF_SIZE)
+        except zlib.error:
+            return _sniff_libarchive(fd)
+    else:
+        # bzip2 produces no output before a whole block (up to 900K) is read.
+        return _sniff_libarchive(fd)
+    format = _match_magic(data, FORMAT_MAGIC)
+    if format == 'tar' and data[156:157] in ('x', 'g'):
+        format = 'pax'
+    elif format is None and data[2:7] in LHA_METHODS:
+        format = 'lha'
+    elif format is None and _is_tar_header(data):
+        format = 'tar'
+    elif format is None and filter is None and _pread(fd, ISO_MAGIC[0], len(ISO_MAGIC[1])) == ISO_MAGIC[1]:
+        format = 'iso'
+    if format is None and (filter is not None or data[:2] == 'MZ'):
+        # Compressed data that did not start with a known header, or an executable
+        # that may be a self-extracting archive.
+        return _sniff_libarchive(fd)
+    return format, filter
+
+
+_sniff_cache = {}
+
+
+def sniff_format(f):
+    '''Detects the format and filter of the given file (a path or open file) from
+    its contents. A single small read at the start of the file is matched against the
+    magic numbers of FORMATS and FILTERS, libarchive is only asked when that is not
+    conclusive. Results are cached by device, inode and mtime.
+
+    Returns a tuple (format, filter) like guess_format(). The format is None if the
+    file is not an archive.'''
+    if isinstance(f, basestring):
+        fd = os.open(f, os.O_RDONLY)
+        position = None
+    else:
+        fd = f.fileno()
+        position = os.lseek(fd, 0, os.SEEK_CUR)
+    try:
+        st = os.fstat(fd)
+        key = (st.st_dev, st.st_ino, st.st_mtime)
+        result = _sniff_cache.get(key) if st.st_ino else None
+        if result is None:
+            result = _sniff(fd)
+            if st.st_ino and stat.S_ISREG(st.st_mode):
+                if len(_sniff_cache) >= SNIFF_CACHE_SIZE:
+                    _sniff_cache.clear()
+                _sniff_cache[key] = result
+        return result
+    finally:
+        if position is None:
+            os.close(fd)
+        else:
+            os.lseek(fd, position, os.SEEK_SET)
+
+
+def classify(paths):
+    '''Runs sniff_format() on many files. Returns a dict mapping each path to its
+    (format, filter) tuple, (None, None) for files that could not be read.'''
+    results = {}
+    for path in paths:
+        try:
+            results[path] = sniff_format(path)
+        except (IOError, OSError):
+            results[path] = (None, None)
+    return results
+
+
 class EntryReadStream(object):
     '''A file-like object for reading an entry from the archive.'''
     def __init__(self, archive, size):
@@ -218,10 +595,59 @@ class EntryReadStream(object):
             # Limit read to remaining bytes
             bytes = self.size - self.bytes
         # Read requested bytes
+        self.archive._fresh = False
         data = _libarchive.archive_read_data_into_str(self.archive._a, bytes)
         self.bytes += len(data)
         return data
 
+    def readinto(self, b):
+        '''Read up to len(b) bytes into the writable buffer b (a bytearray, memoryview,
+        mmap etc.) without allocating a new string. Returns the number of bytes read,
+        0 at the end of the entry.'''
+        if self.closed:
+            return 0
+        size = min(len(b), self.size - self.bytes)
+        if size <= 0:
+            return 0
+        self.archive._fresh = False
+        count = _libarchive.archive_read_data_into_buffer(self.archive._a, b, size)
+        self.bytes += count
+        return count
+
+    readinto1 = readinto
+
+    def iter_blocks(self):
+        '''Yields (offset, memoryview) pairs pointing directly into libarchive's buffer,
+        so no intermediate string is created. A view is only valid until the next block
+        is requested. Gaps between the end of one block and the offset of the next are
+        holes (sparse entries) and should be treated as zeros. Do not mix with read().
+        Entries that view() can return are yielded as that single view.'''
+        if self.closed:
+            return
+        view = self.view()
+        if view is not None:
+            yield 0, view
+            return
+        self.archive._fresh = False
+        while True:
+            block = _libarchive.archive_read_data_block_into_view(self.archive._a)
+            if block is None:
+                break
+            offset, view = block
+            self.bytes = offset + len(view)
+            yield offset, view
+
+    def view(self):
+        '''Returns the whole entry as a memoryview of the archive's memory when possible,
+        see Archive.readview(). Must be called before reading any data, returns None
+        when the data can not be viewed in place.'''
+        if self.closed or self.bytes:
+            return None
+        view = self.archive.readview()
+        if view is not None:
+            self.bytes = self.size
+        return view
+
     def close(self):
         if self.closed:
             return
@@ -237,12 +663,14 @@ class EntryWriteStream(object):
 
     If the size is known ahead of time and provided, then the file contents
     are not buffered but flushed directly to the archive. If size is omitted,
-    then the file contents are buffered and flushed in the close() method.'''
-    def __init__(self, archive, pathname, size=None):
+    then the file contents are buffered and flushed in the close() method.
+    The buffer is kept in memory up to spool_size bytes, larger contents are
+    spilled to a temporary file.'''
+    def __init__(self, archive, pathname, size=None, spool_size=SPOOL_SIZE):
         self.archive = archive
         self.entry = Entry(pathname=pathname, mtime=time.time(), mode=stat.S_IFREG)
         if size is None:
-            self.buffer = StringIO()
+            self.buffer = tempfile.SpooledTemporaryFile(max_size=spool_size)
         else:
             self.buffer = None
             self.entry.size = size
@@ -268,7 +696,7 @@ class EntryWriteStream(object):
     def write(self, data):
         if self.closed:
             raise Exception('Cannot write to closed stream.')
-        if self.buffer:
+        if self.buffer is not None:
             self.buffer.write(data)
         else:
             _libarchive.archive_write_data_from_str(self.archive._a, data)
@@ -277,11 +705,17 @@ class EntryWriteStream(object):
     def close(self):
         if self.closed:
             return
-        if self.buffer:
+        if self.buffer is not None:
             self.entry.size = self.buffer.tell()
             self.entry.to_archive(self.archive)
-            _libarchive.archive_write_data_from_str(self.archive._a, self.buffer.getvalue())
-        _libarchive.archive_write_finish_entry(self.archive._a)
+            self.buffer.seek(0)
+            while True:
+                data = self.buffer.read(COPY_BUFFER_SIZE)
+                if not data:
+                    break
+                _libarchive.archive_write_data_from_str(self.archive._a, data)
+            self.buffer.close()
+        call_and_check(_libarchive.archive_write_finish_entry, self.archive._a, self.archive._a)
 
         # Call archive.close() with _defer True to let it know we have been
         # closed and it is now safe to actually close.
@@ -306,22 +740,20 @@ class Entry(object):
 
     @classmethod
     def from_archive(cls, archive, encoding=ENCODING):
-        '''Instantiates an Entry class and sets all the properties from an archive header.'''
-        e = _libarchive.archive_entry_new()
-        try:
-            call_and_check(_libarchive.archive_read_next_header2, archive._a, archive._a, e)
-            mode = _libarchive.archive_entry_filetype(e)
-            mode |= _libarchive.archive_entry_perm(e)
-            entry = cls(
-                pathname=_libarchive.archive_entry_pathname(e).decode(encoding),
-                size=_libarchive.archive_entry_size(e),
-                mtime=_libarchive.archive_entry_mtime(e),
-                mode=mode,
-                hpos=archive.header_position,
-            )
-        finally:
-            _libarchive.archive_entry_free(e)
-        return entry
+        '''Instantiates an Entry class and sets all the properties from an archive header.
+        The header is read into the archive's own archive_entry, which is reused for
+        every entry, and all the fields are fetched in a single call.'''
+        fields = _libarchive.archive_read_next_header_fields(archive._a, archive._e)
+        if fields is None:
+            raise EOF()
+        pathname, size, mtime, mode, hpos = fields
+        return cls(
+            pathname=pathname.decode(encoding) if pathname is not None else None,
+            size=size,
+            mtime=mtime,
+            mode=mode,
+            hpos=archive._offset + hpos,
+        )
 
     @classmethod
     def from_file(cls, f, entry=None, encoding=ENCODING):
@@ -382,27 +814,120 @@ class Entry(object):
         return stat.S_ISBLK(self.mode)
 
 
+class EntryTable(object):
+    '''A compact list of entries. Header fields are kept in columns (a list of
+    pathnames and arrays for size, mtime, mode and header position) rather than as
+    one object per entry, which matters for archives with millions of members.
+    Entry objects are created on access and shared for as long as they are in use.'''
+    def __init__(self, entry_class=Entry, encoding=ENCODING):
+        self.entry_class = entry_class
+        self.encoding = encoding
+        self.pathnames = []
+        self.sizes = array(INT64_TYPECODE)
+        self.mtimes = array(INT64_TYPECODE)
+        self.modes = array('L')
+        self.hpos = array(INT64_TYPECODE)
+        self._cache = weakref.WeakValueDictionary()
+
+    def __len__(self):
+        return len(self.pathnames)
+
+    def __iter__(self):
+        for i in xrange(len(self)):
+            yield self[i]
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in xrange(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError('entry index out of range')
+        entry = self._cache.get(i)
+        if entry is None:
+            entry = self.entry_class(
+                pathname=self.pathnames[i],
+                size=int(self.sizes[i]),
+                mtime=int(self.mtimes[i]),
+                mode=self.modes[i],
+                hpos=int(self.hpos[i]),
+                encoding=self.encoding,
+            )
+            self._cache[i] = entry
+        return entry
+
+    def append(self, entry):
+        self._cache[len(self)] = entry
+        self.append_row(entry.pathname, entry.size, entry.mtime, entry.mode, entry.hpos)
+
+    def append_row(self, pathname, size, mtime, mode, hpos):
+        '''Adds an entry without creating an Entry object.'''
+        self.sizes.append(size)
+        self.mtimes.append(int(mtime))
+        self.modes.append(mode)
+        self.hpos.append(hpos)
+        self.pathnames.append(pathname)
+
+    def rows(self):
+        '''Yields (pathname, size, mtime, mode, hpos) tuples.'''
+        for i in xrange(len(self)):
+            yield (self.pathnames[i], int(self.sizes[i]), int(self.mtimes[i]),
+                   self.modes[i], int(self.hpos[i]))
+
+
 class Archive(object):
     '''A low-level archive reader which provides forward-only iteration. Consider
     this a light-weight pythonic libarchive wrapper.'''
-    def __init__(self, f, mode='r', format=None, filter=None, entry_class=Entry, encoding=ENCODING, blocksize=BLOCK_SIZE):
+    def __init__(self, f, mode='r', format=None, filter=None, entry_class=Entry, encoding=ENCODING, blocksize=None,
+                 options=None, filter_options=None, mmap=False):
         assert mode in ('r', 'w', 'wb', 'a'), 'Mode should be "r", "w", "wb", or "a".'
         self._stream = None
+        # Offset in the file at which the reader was opened.
+        self._offset = 0
+        # Position in the file or buffer at which libarchive starts reading, None if
+        # unknown. See init().
+        self._start = None
+        # Whether none of the current entry's data was read yet.
+        self._fresh = False
+        # Output of archives written to memory, see to_bytes().
+        self._membuf = None
+        self._bytes = None
         self.encoding = encoding
-        self.blocksize = blocksize
         if isinstance(f, basestring):
             self.filename = f
             f = file(f, mode)
             # Only close it if we opened it...
             self._defer_close = True
-        elif hasattr(f, 'fileno'):
+        elif isinstance(f, _Buffer) or (f is None and mode != 'r'):
+            # Read from or written to memory.
+            self.filename = None
+            self._defer_close = False
+        elif _fileno(f) is not None:
             self.filename = getattr(f, 'name', None)
             # Leave the fd alone, caller should manage it...
             self._defer_close = False
+        elif hasattr(f, 'read') or hasattr(f, 'write'):
+            # No fd, libarchive calls the object's read()/write() methods instead.
+            name = getattr(f, 'name', None)
+            self.filename = name if isinstance(name, basestring) else None
+            self._defer_close = False
         else:
-            raise Exception('Provided file is not path or open file.')
+            raise Exception('Provided file is not path or file-like object.')
         self.f = f
+        self._fd = _fileno(f)
         self.mode = mode
+        # Read blocks are sized for the file unless a size is given.
+        if blocksize is None:
+            blocksize = _read_blocksize(self._fd) if mode == 'r' else BLOCK_SIZE
+        self.blocksize = blocksize
+        # Memory the archive is read from, see from_buffer(). With mmap, regular files
+        # are mapped instead of being read into libarchive's buffers.
+        self._buffer = f.data if isinstance(f, _Buffer) else None
+        if mode == 'r' and self._fd is not None:
+            if mmap:
+                self._buffer = _map_file(self._fd)
+            if self._buffer is None:
+                self._advise()
         # Guess the format/filter from file name (if not provided)
         if self.filename:
             if format is None:
@@ -411,6 +936,12 @@ class Archive(object):
                 filter = guess_format(self.filename)[1]
         self.format = format
         self.filter = filter
+        # Format and filter options, either a libarchive option string or a dict like
+        # {'zip:compression': 'store', 'xz:threads': 4}. Keys without a module apply
+        # to every module that knows the option.
+        self.options = options
+        # Options of the filter only, e.g. {'compression-level': 9, 'threads': 4}.
+        self.filter_options = filter_options
         # The class to use for entries.
         self.entry_class = entry_class
         # Select filter/format functions.
@@ -437,9 +968,11 @@ class Archive(object):
     def __iter__(self):
         while True:
             try:
-                yield self.entry_class.from_archive(self, encoding=self.encoding)
+                entry = self.entry_class.from_archive(self, encoding=self.encoding)
             except EOF:
                 break
+            self._fresh = True
+            yield entry
 
     def __enter__(self):
         return self
@@ -449,6 +982,21 @@ class Archive(object):
 
     def __del__(self):
         self.close()
+        if getattr(self, '_membuf', None) is not None:
+            _libarchive.membuf_free(self._membuf)
+            self._membuf = None
+
+    @classmethod
+    def from_buffer(cls, data, **kwargs):
+        '''Opens an archive for reading straight from the memory of data, which can be a
+        string, bytearray, memoryview or mmap. Nothing is copied, so data must not be
+        modified (nor the mmap closed) while the archive is open.'''
+        assert kwargs.get('mode', 'r') == 'r', 'Buffers can only be read.'
+        return cls(_Buffer(data), **kwargs)
+
+    def _advise(self):
+        '''Gives the kernel access hints for the fd the archive is read from.'''
+        _advise_sequential(self._fd)
 
     def init(self):
         if self.mode == 'r':
@@ -456,11 +1004,50 @@ class Archive(object):
         else:
             self._a = _libarchive.archive_write_new()
         self.format_func(self._a)
-        self.filter_func(self._a)
+        call_and_check(self.filter_func, self._a, self._a)
+        self._set_options()
+        if self.mode == 'r':
+            # Header reads all go through this one entry, see Entry.from_archive().
+            self._e = _libarchive.archive_entry_new()
+            self._start = self._offset if self._buffer is not None else None
+            if self._fd is not None and self._buffer is None:
+                try:
+                    self._start = os.lseek(self._fd, 0, os.SEEK_CUR)
+                except OSError:
+                    pass
+            if self._buffer is not None:
+                call_and_check(_libarchive.archive_read_open_pybuffer, self._a, self._a, self._buffer, self._offset)
+            elif self._fd is None:
+                call_and_check(_libarchive.archive_read_open_pyobject, self._a, self._a, self.f,
+                               max(self.blocksize, COPY_BUFFER_SIZE), _seekable(self.f))
+            else:
+                call_and_check(_libarchive.archive_read_open_fd, self._a, self._a, self._fd, self.blocksize)
+        elif self.f is None:
+            self._membuf = _libarchive.membuf_new()
+            call_and_check(_libarchive.archive_write_open_membuf, self._a, self._a, self._membuf)
+        elif self._fd is None:
+            call_and_check(_libarchive.archive_write_open_pyobject, self._a, self._a, self.f, COPY_BUFFER_SIZE)
+        else:
+            call_and_check(_libarchive.archive_write_open_fd, self._a, self._a, self._fd)
+
+    def _set_options(self):
+        '''Applies options and filter_options, the archive must not be opened yet.'''
         if self.mode == 'r':
-            call_and_check(_libarchive.archive_read_open_fd, self._a, self._a, self.f.fileno(), self.blocksize)
+            set_options = _libarchive.archive_read_set_options
+            set_option = _libarchive.archive_read_set_option
+            set_filter_option = _libarchive.archive_read_set_filter_option
         else:
-            call_and_check(_libarchive.archive_write_open_fd, self._a, self._a, self.f.fileno())
+            set_options = _libarchive.archive_write_set_options
+            set_option = _libarchive.archive_write_set_option
+            set_filter_option = _libarchive.archive_write_set_filter_option
+        if isinstance(self.options, basestring):
+            call_and_check(set_options, self._a, self._a, self.options)
+        elif self.options:
+            for key, value in self.options.items():
+                module, _, option = key.rpartition(':')
+                call_and_check(set_option, self._a, self._a, module or None, option, _option_value(value))
+        for key, value in (self.filter_options or {}).items():
+            call_and_check(set_filter_option, self._a, self._a, None, key, _option_value(value))
 
     def denit(self):
         '''Closes and deallocates the archive reader/writer.'''
@@ -470,12 +1057,17 @@ class Archive(object):
             if self.mode == 'r':
                 _libarchive.archive_read_close(self._a)
                 _libarchive.archive_read_free(self._a)
-            elif self.mode == 'w':
-                _libarchive.archive_write_close(self._a)
-                _libarchive.archive_write_free(self._a)
+                _libarchive.archive_entry_free(self._e)
+            else:
+                try:
+                    # Flushes the last block, errors of the file object surface here.
+                    call_and_check(_libarchive.archive_write_close, self._a, self._a)
+                finally:
+                    _libarchive.archive_write_free(self._a)
         finally:
             # We only want one try at this...
             self._a = None
+            self._e = None
 
     def close(self, _defer=False):
         # _defer == True is how a stream can notify Archive that the stream is
@@ -491,41 +1083,201 @@ class Archive(object):
             self._defer_close = True
             return
         self.denit()
+        # Views returned by readview() keep a mapping alive, it is unmapped when the
+        # last one is gone.
+        self._buffer = None
         # If there is a file attached...
         if hasattr(self, 'f'):
             # Make sure it is not already closed...
             if getattr(self.f, 'closed', False):
                 return
             # Flush it if not read-only...
-            if self.f.mode != 'r' and self.f.mode != 'rb':
-                self.f.flush()
-                os.fsync(self.f.fileno())
+            if self.mode != 'r' and getattr(self.f, 'mode', None) not in ('r', 'rb'):
+                if hasattr(self.f, 'flush'):
+                    self.f.flush()
+                # Pipes and sockets can not be synced.
+                if self._fd is not None and stat.S_ISREG(os.fstat(self._fd).st_mode):
+                    os.fsync(self._fd)
             # and then close it, if we opened it...
             if getattr(self, '_close', None):
                 self.f.close()
 
+    def to_bytes(self):
+        '''Finishes an archive that was opened for writing to memory (by passing None
+        as the file) and returns its contents as a string.'''
+        if self._bytes is None:
+            if self._membuf is None:
+                raise Exception('Archive was not opened for writing to memory.')
+            self.close()
+            if self._a is not None:
+                raise Exception('Close the entry stream before calling to_bytes().')
+            self._bytes = _libarchive.membuf_to_str(self._membuf)
+            _libarchive.membuf_free(self._membuf)
+            self._membuf = None
+        return self._bytes
+
     @property
     def header_position(self):
         '''The position within the file.'''
-        return _libarchive.archive_read_header_position(self._a)
+        return self._offset + _libarchive.archive_read_header_position(self._a)
 
-    def iterpaths(self):
+    def iterentries(self):
+        '''Yields the remaining entries without reading their data. The data of each
+        entry is skipped, which seeks over it when the input is uncompressed.'''
         for entry in self:
+            yield entry
+            if self._stream is None:
+                self.skip()
+
+    def iterpaths(self):
+        for entry in self.iterentries():
             yield entry.pathname
 
+    def skip(self):
+        '''Skips the rest of the current entry's data.'''
+        self._fresh = False
+        call_and_check(_libarchive.archive_read_data_skip, self._a, self._a)
+
     def read(self, size):
         '''Read current archive entry contents into string.'''
+        self._fresh = False
         return _libarchive.archive_read_data_into_str(self._a, size)
 
+    def readinto(self, b):
+        '''Read current archive entry contents into the writable buffer b. Returns
+        the number of bytes read, 0 at the end of the entry.'''
+        self._fresh = False
+        return _libarchive.archive_read_data_into_buffer(self._a, b, -1)
+
+    def _read_at(self, offset, size):
+        '''Reads size bytes at offset in the archive's memory or file, the file's
+        position is left unchanged.'''
+        if self._buffer is not None:
+            return _bytes_at(self._buffer, offset, size)
+        position = os.lseek(self._fd, 0, os.SEEK_CUR)
+        try:
+            return _pread(self._fd, offset, size)
+        finally:
+            os.lseek(self._fd, position, os.SEEK_SET)
+
+    def _stored_span(self):
+        '''Returns (offset, size) of the current entry's data within the archive's
+        memory or file, None if it is not stored there as is. Only valid right after
+        the header was read.'''
+        if self._start is None:
+            return None
+        format = _libarchive.archive_format(self._a) & _libarchive.ARCHIVE_FORMAT_BASE_MASK
+        if format not in (_libarchive.ARCHIVE_FORMAT_TAR, _libarchive.ARCHIVE_FORMAT_CPIO):
+            return None
+        if _libarchive.archive_filter_code(self._a, 0) != _libarchive.ARCHIVE_FILTER_NONE:
+            return None
+        if _libarchive.archive_entry_filetype(self._e) != stat.S_IFREG:
+            return None
+        if _libarchive.archive_entry_sparse_count(self._e):
+            return None
+        # The reader has consumed the header, the data follows.
+        offset = self._start + _libarchive.archive_filter_bytes(self._a, 0)
+        return offset, _libarchive.archive_entry_size(self._e)
+
+    def readview(self):
+        '''Returns the data of the current entry as a memoryview of the archive's
+        memory, and skips over it in the archive. Nothing is copied. Only
+        possible when reading from memory (see from_buffer() and mmap) for entries
+        stored without compression (in uncompressed tar and cpio archives, stored zip
+        members), before any of their data was read. Returns None otherwise.'''
+        if self._buffer is None or not self._fresh:
+            return None
+        span = self._stored_span()
+        if span is None:
+            return None
+        view = _view(self._buffer, *span)
+        self.skip()
+        return view
+
+    def iter_blocks(self):
+        '''Yields (offset, memoryview) pairs for the current archive entry. See
+        EntryReadStream.iter_blocks().'''
+        self._fresh = False
+        while True:
+            block = _libarchive.archive_read_data_block_into_view(self._a)
+            if block is None:
+                break
+            yield block
+
     def readpath(self, f):
         '''Write current archive entry contents to file. f can be a file-like object or
-        a path.'''
+        a path. Entries stored as is in an archive file (see readview()) are copied
+        straight from the archive's fd, without passing through libarchive.'''
+        opened = None
         if isinstance(f, basestring):
-            basedir = os.path.basename(f)
-            if not os.path.exists(basedir):
+            basedir = os.path.dirname(f)
+            if basedir and not os.path.exists(basedir):
                 os.makedirs(basedir)
-            f = file(f, 'w')
-        return _libarchive.archive_read_data_into_fd(self._a, f.fileno())
+            f = opened = file(f, 'w')
+        try:
+            fd = _fileno(f)
+            if fd is None:
+                self._fresh = False
+                while True:
+                    data = _libarchive.archive_read_data_into_str(self._a, COPY_BUFFER_SIZE)
+                    if not data:
+                        break
+                    f.write(data)
+                return
+            if hasattr(f, 'flush'):
+                # Keep the order of anything buffered by the file object.
+                f.flush()
+            if self._copy_stored(fd):
+                return
+            self._fresh = False
+            return _libarchive.archive_read_data_into_fd(self._a, fd)
+        finally:
+            if opened is not None:
+                opened.close()
+
+    def _copy_stored(self, fd):
+        '''Copies the current entry into fd when it is stored as is, the bytes are
+        passed to the kernel directly from the archive's memory or moved from fd to
+        fd inside the kernel. Returns False, with nothing written, when that is not
+        possible.'''
+        if not self._fresh:
+            return False
+        if self._buffer is not None:
+            view = self.readview()
+            if view is None:
+                return False
+            while len(view):
+                view = view[os.write(fd, view):]
+            return True
+        if self._fd is None:
+            return False
+        span = self._stored_span()
+        if span is None:
+            return False
+        offset, size = span
+        if _libarchive.copy_fd_range(self._fd, offset, fd, size) != size:
+            raise Exception('Archive ended in the middle of the data of an entry.')
+        self.skip()
+        return True
+
+    def extractall(self, path=None, flags=EXTRACT_FLAGS):
+        '''Extracts all remaining entries into the directory path (the current directory
+        if omitted) in a single pass. The work is done by libarchive's disk writer
+        without returning to Python for each entry. flags is a combination of the
+        ARCHIVE_EXTRACT_* constants. Entries that cannot be extracted are skipped with a
+        RuntimeWarning. Returns a tuple (entries, bytes) of what was extracted.'''
+        self._fresh = False
+        # Entry names are always prefixed, so absolute names stay below path. The
+        # SECURE_* flags reject '..' and symlinks anywhere in the path.
+        path = os.path.realpath(path if path is not None else os.getcwd())
+        if not os.path.isdir(path):
+            try:
+                os.makedirs(path)
+            except OSError as e:
+                # Another extraction may have created it in the meantime.
+                if e.errno != errno.EEXIST or not os.path.isdir(path):
+                    raise
+        return _libarchive.archive_read_extract_all(self._a, path, flags)
 
     def readstream(self, size):
         '''Returns a file-like object for reading current archive entry contents.'''
@@ -541,105 +1293,325 @@ class Archive(object):
         member.to_archive(self)
         if data:
             _libarchive.archive_write_data_from_str(self._a, data)
-        _libarchive.archive_write_finish_entry(self._a)
+        call_and_check(_libarchive.archive_write_finish_entry, self._a, self._a)
 
     def writepath(self, f, pathname=None):
-        '''Writes a file to the archive. f can be a file-like object or a path. Uses
-        write() to do the actual writing.'''
+        '''Writes a file to the archive. f can be a file-like object or a path. Regular
+        files are copied from their fd in COPY_BUFFER_SIZE chunks, so memory use does not
+        depend on the size of the file. Other file-like objects are read into memory and
+        written using write().'''
         member = self.entry_class.from_file(f, encoding=self.encoding)
+        opened = None
         if isinstance(f, basestring):
             if os.path.isfile(f):
-                f = file(f, 'r')
+                f = opened = file(f, 'rb')
         if pathname:
             member.pathname = pathname
-        if hasattr(f, 'read'):
-            # TODO: optimize this to write directly from f to archive.
-            self.write(member, data=f.read())
-        else:
-            self.write(member)
+        try:
+            if hasattr(f, 'fileno') and stat.S_ISREG(os.fstat(f.fileno()).st_mode):
+                fd = f.fileno()
+                # Start where the file object is, its buffer is bypassed.
+                position = f.tell()
+                os.lseek(fd, position, os.SEEK_SET)
+                member.size = max(os.fstat(fd).st_size - position, 0)
+                member.to_archive(self)
+                copied = _libarchive.archive_write_data_from_fd(self._a, fd, member.size, COPY_BUFFER_SIZE)
+                if copied != member.size:
+                    raise Exception('File %s shrank while it was being archived.' % member.pathname)
+                call_and_check(_libarchive.archive_write_finish_entry, self._a, self._a)
+            elif hasattr(f, 'read'):
+                self.write(member, data=f.read())
+            else:
+                self.write(member)
+        finally:
+            if opened is not None:
+                opened.close()
 
-    def writestream(self, pathname, size=None):
-        '''Returns a file-like object for writing a new entry.'''
-        self._stream = EntryWriteStream(self, pathname, size)
+    def writestream(self, pathname, size=None, spool_size=SPOOL_SIZE):
+        '''Returns a file-like object for writing a new entry. If size is omitted, up
+        to spool_size bytes are buffered in memory before spilling to a temporary file.'''
+        self._stream = EntryWriteStream(self, pathname, size, spool_size)
         return self._stream
 
     def printlist(self, s=sys.stdout):
-        for entry in self:
-            s.write(entry.size)
+        for entry in self.iterentries():
+            s.write(str(entry.size))
             s.write('\t')
-            s.write(entry.mtime.strftime(MTIME_FORMAT))
+            s.write(time.strftime(MTIME_FORMAT, time.localtime(entry.mtime)))
             s.write('\t')
-            s.write(entry.pathname)
+            s.write(entry.pathname.encode(self.encoding))
+            s.write('\n')
         s.flush()
 
 
 class SeekableArchive(Archive):
     '''A class that provides random-access to archive entries. It does this by using one
-    or many Archive instances to seek to the correct location. The best performance will
-    occur when reading archive entries in the order in which they appear in the archive.
-    Reading out of order will cause the archive to be closed and opened each time a
-    reverse seek is needed.'''
-    def __init__(self, f, **kwargs):
+    or many Archive instances to seek to the correct location. Uncompressed tar and cpio
+    archives are reopened right at the requested entry's header. For other archives the
+    best performance will occur when reading archive entries in the order in which they
+    appear in the archive. Reading out of order will cause the archive to be closed and
+    opened each time a reverse seek is needed.
+
+    The index parameter enables a sidecar file that caches the entry headers, so that
+    later instances do not need to scan the whole archive. Pass True to store it next
+    to the archive (filename + INDEX_SUFFIX) or a path to store it elsewhere. The index
+    is rebuilt when the archive's size, mtime or inode no longer match.'''
+    def __init__(self, f, index=None, **kwargs):
         self._stream = None
+        # Index (in entries) of the last header read, of the next header the reader
+        # will return, and whether the current entry's data was read. Header
+        # positions are not used to identify entries, for some formats they depend
+        # on how much of the previous entry was read.
+        self._current = None
+        self._next = 0
+        self._dirty = False
+        # Whether a reader can be opened at any header, None until known.
+        self._jump = None
         # Convert file to open file. We need this to reopen the archive.
         mode = kwargs.setdefault('mode', 'r')
         if isinstance(f, basestring):
             f = file(f, mode)
         super(SeekableArchive, self).__init__(f, **kwargs)
-        self.entries = []
+        # Block size for reading from the start, readers opened at a header are given
+        # blocks sized for the entry instead, see reopen().
+        self._scan_blocksize = self.blocksize if kwargs.get('blocksize') is None else None
+        self.entries = EntryTable(self.entry_class, self.encoding)
+        # Maps pathnames to indexes in entries, filled as headers are discovered.
+        self._names = {}
         self.eof = False
+        if index is True:
+            index = self.filename and self.filename + INDEX_SUFFIX
+        self.index = index if self.mode == 'r' and self._fd is not None else None
+        if self.index:
+            self.load_index()
 
     def __iter__(self):
-        for entry in self.entries:
-            yield entry
-        if not self.eof:
-            try:
-                for entry in super(SeekableArchive, self).__iter__():
-                    self.entries.append(entry)
-                    yield entry
-            except StopIteration:
-                self.eof = True
-
-    def reopen(self):
-        '''Seeks the underlying fd to 0 position, then opens the archive. If the archive
-        is already open, this will effectively re-open it (rewind to the beginning).'''
+        i = 0
+        while True:
+            if i < len(self.entries):
+                yield self.entries[i]
+            elif self.eof or self._next_entry() is None:
+                break
+            else:
+                yield self.entries[i]
+            i += 1
+
+    def iterentries(self):
+        '''Yields all entries. Only headers that were not discovered yet are read, the
+        data in between is skipped.'''
+        return iter(self)
+
+    def _next_entry(self):
+        '''Reads the header following the last known entry. Returns None at the end of
+        the archive.'''
+        if self._next != len(self.entries):
+            # Reads may have moved us elsewhere in the archive.
+            self.seek(self.entries[-1])
+        if not self._dirty and self._current is not None:
+            self.skip()
+        try:
+            entry = self._read_header()
+        except EOF:
+            self.eof = True
+            if self.index:
+                self.save_index()
+            return None
+        self._add_entry(entry)
+        return entry
+
+    def skip(self):
+        super(SeekableArchive, self).skip()
+        self._dirty = True
+
+    def _add_entry(self, entry):
+        # Keep the first entry, like a forward scan would find it.
+        self._names.setdefault(entry.pathname, len(self.entries))
+        self.entries.append(entry)
+
+    def _ordinal(self, entry):
+        '''Returns the index of the given entry in entries.'''
+        hpos = self.entries.hpos
+        i = self._names.get(entry.pathname)
+        if i is not None and hpos[i] == entry.header_position:
+            return i
+        # Duplicate pathname.
+        for i, pathname in enumerate(self.entries.pathnames):
+            if pathname == entry.pathname and hpos[i] == entry.header_position:
+                return i
+        raise KeyError(entry.pathname)
+
+    def _index_key(self):
+        st = os.fstat(self.f.fileno())
+        return [st.st_size, st.st_mtime, st.st_ino]
+
+    def load_index(self):
+        '''Loads the entries from the sidecar index. Returns False if there is no index
+        or it is stale.'''
+        try:
+            with file(self.index, 'r') as f:
+                index = json.load(f)
+            if index.get('version') != INDEX_VERSION or index.get('key') != self._index_key():
+                return False
+            entries = EntryTable(self.entry_class, self.encoding)
+            for row in index['entries']:
+                entries.append_row(*row)
+        except (IOError, OSError, ValueError, KeyError, TypeError, OverflowError):
+            return False
+        self.entries = entries
+        self._names = {}
+        for i, pathname in enumerate(entries.pathnames):
+            self._names.setdefault(pathname, i)
+        self.eof = True
+        return True
+
+    def save_index(self):
+        '''Writes the entries to the sidecar index. The archive must have been scanned
+        to the end.'''
+        index = {
+            'version': INDEX_VERSION,
+            'key': self._index_key(),
+            'entries': list(self.entries.rows()),
+        }
+        # Write to a temporary file first so readers never see a partial index.
+        tmp = '%s.%d.tmp' % (self.index, os.getpid())
+        try:
+            with file(tmp, 'w') as f:
+                json.dump(index, f, separators=(',', ':'))
+            os.rename(tmp, self.index)
+        except (IOError, OSError) as e:
+            warnings.warn('Could not write index %s: %s.' % (self.index, e), RuntimeWarning)
+            if os.path.exists(tmp):
+                os.remove(tmp)
+
+    def _read_header(self):
+        try:
+            entry = self.entry_class.from_archive(self, encoding=self.encoding)
+        except EOF:
+            # The data of the current entry is gone as well.
+            self._dirty = True
+            raise
+        self._current = self._next
+        self._next += 1
+        self._dirty = False
+        self._fresh = True
+        if self._jump is None:
+            self._jump = self._can_jump()
+            if not self._jump and self._fd is not None and self._buffer is None:
+                _advise_sequential(self._fd)
+        return entry
+
+    def _advise(self):
+        # Entries may be read in any order, wait for the first header to tell.
+        pass
+
+    def _can_jump(self):
+        '''Only uncompressed tar and cpio archives on a regular file can be read starting
+        at any header. Requires a header to have been read.'''
+        format = _libarchive.archive_format(self._a) & _libarchive.ARCHIVE_FORMAT_BASE_MASK
+        if format not in (_libarchive.ARCHIVE_FORMAT_TAR, _libarchive.ARCHIVE_FORMAT_CPIO):
+            return False
+        if _libarchive.archive_filter_code(self._a, 0) != _libarchive.ARCHIVE_FILTER_NONE:
+            return False
+        if self._buffer is not None:
+            return True
+        if self._fd is None:
+            return _seekable(self.f)
+        try:
+            return stat.S_ISREG(os.fstat(self._fd).st_mode)
+        except OSError:
+            return False
+
+    def reopen(self, offset=0, ordinal=0):
+        '''Seeks the underlying fd to the given position (0 by default), then opens the
+        archive. If the archive is already open, this will effectively re-open it
+        (rewind to the beginning). ordinal is the index of the entry found at offset.'''
         self.denit()
-        self.f.seek(0)
+        if self._buffer is not None:
+            # init() opens the buffer at _offset.
+            pass
+        elif self._fd is None:
+            self.f.seek(offset)
+        else:
+            # libarchive reads the fd directly, bypass the file object's buffering.
+            os.lseek(self._fd, offset, os.SEEK_SET)
+        self._offset = offset
+        self._current = None
+        self._next = ordinal
+        self._dirty = False
+        if self._scan_blocksize is not None:
+            if offset:
+                # Just the header and data of the entry, with room for extension headers.
+                size = -(-(self.entries.sizes[ordinal] + BLOCK_SIZE) // BLOCK_SIZE) * BLOCK_SIZE
+                self.blocksize = min(int(size), self._scan_blocksize)
+            else:
+                self.blocksize = self._scan_blocksize
         self.init()
 
     def getentry(self, pathname):
-        '''Take a name or entry object and returns an entry object.'''
-        for entry in self:
+        '''Take a name or entry object and returns an entry object. Entries that were
+        already discovered are found without scanning the archive again.'''
+        if isinstance(pathname, Entry):
+            return pathname
+        i = self._names.get(pathname)
+        if i is not None:
+            return self.entries[i]
+        while not self.eof:
+            entry = self._next_entry()
+            if entry is None:
+                break
             if entry.pathname == pathname:
                 return entry
         raise KeyError(pathname)
 
     def seek(self, entry):
-        '''Seeks the archive to the requested entry. Will reopen if necessary.'''
-        move = entry.header_position - self.header_position
-        if move != 0:
-            if move < 0:
-                # can't move back, re-open archive:
-                self.reopen()
-            # move to proper position in stream
-            for curr in super(SeekableArchive, self).__iter__():
-                if curr.header_position == entry.header_position:
-                    break
+        '''Seeks the archive to the requested entry, so that its data can be read. Will
+        reopen if necessary.'''
+        i = self._ordinal(entry)
+        if i == self._current and not self._dirty:
+            return
+        if self._jump:
+            # Open a new reader right at the entry's header.
+            self.reopen(entry.header_position, i)
+        elif self._next > i:
+            # can't move back, re-open archive:
+            self.reopen()
+        # move to proper position in stream
+        try:
+            while self._next <= i:
+                self._read_header()
+                if self._jump and self._next <= i:
+                    # The first header told us we can jump straight to the entry.
+                    self.reopen(entry.header_position, i)
+        except EOF:
+            raise KeyError(entry.pathname)
 
     def read(self, member):
         '''Return the requested archive entry contents as a string.'''
         entry = self.getentry(member)
         self.seek(entry)
+        self._dirty = True
         return super(SeekableArchive, self).read(entry.size)
 
     def readpath(self, member, f):
         entry = self.getentry(member)
         self.seek(entry)
+        self._dirty = True
         return super(SeekableArchive, self).readpath(f)
 
+    def extractall(self, path=None, flags=EXTRACT_FLAGS):
+        '''Extracts all entries into the directory path. See Archive.extractall().'''
+        if self._next or self._offset:
+            self.reopen()
+        try:
+            return super(SeekableArchive, self).extractall(path, flags)
+        finally:
+            # The reader is left at the end of the archive.
+            self.reopen()
+
     def readstream(self, member):
         '''Returns a file-like object for reading requested archive entry contents.'''
         entry = self.getentry(member)
         self.seek(entry)
+        self._dirty = True
         self._stream = EntryReadStream(self, entry.size)
         return self._stream
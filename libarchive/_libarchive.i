@@ -26,12 +26,24 @@
 %module _libarchive
 
 %{
+#include <errno.h>
+#include <fcntl.h>
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+#include <unistd.h>
+#include <sys/mman.h>
 #include <archive.h>
 #include <archive_entry.h>
 %}
 
 %include "typemaps.i"
 
+/* Callbacks into Python file objects take the GIL from libarchive's thread. */
+%init %{
+    PyEval_InitThreads();
+%}
+
 %typemap(in) time_t
 {
     if (PyLong_Check($input))
@@ -72,8 +84,38 @@
 
 typedef unsigned short   mode_t;
 
-# Everything below is from the archive.h and archive_entry.h files.
-# I excluded functions declarations that are not needed.
+/* Everything below is from the archive.h and archive_entry.h files.
+   I excluded functions declarations that are not needed. */
+
+/* THREADING */
+/* The following calls may block on I/O or spend a long time compressing or
+   decompressing data. Release the GIL around them so that other Python
+   threads (for example ones working on unrelated archives) can run. None of
+   them touch Python objects. */
+%define %nogil(func)
+%exception func {
+    Py_BEGIN_ALLOW_THREADS
+    $action
+    Py_END_ALLOW_THREADS
+}
+%enddef
+
+%nogil(archive_read_free);
+%nogil(archive_read_open_filename);
+%nogil(archive_read_open_memory);
+%nogil(archive_read_open_memory2);
+%nogil(archive_read_open_fd);
+%nogil(archive_read_close);
+%nogil(archive_read_next_header2);
+%nogil(archive_read_data_skip);
+%nogil(archive_read_data_into_fd);
+%nogil(archive_write_free);
+%nogil(archive_write_open_fd);
+%nogil(archive_write_open_filename);
+%nogil(archive_write_close);
+%nogil(archive_write_header);
+%nogil(archive_write_finish_entry);
+%nogil(archive_read_extract2);
 
 /* CONFIGURATION */
 
@@ -171,6 +213,19 @@ extern int archive_read_next_header2(struct archive *,
 extern const struct stat	*archive_entry_stat(struct archive_entry *);
 extern __LA_INT64_T		 archive_read_header_position(struct archive *);
 
+/* options */
+extern int archive_read_set_format_option(struct archive *_a,
+		     const char *m, const char *o,
+		     const char *v);
+extern int archive_read_set_filter_option(struct archive *_a,
+		     const char *m, const char *o,
+		     const char *v);
+extern int archive_read_set_option(struct archive *_a,
+		     const char *m, const char *o,
+		     const char *v);
+extern int archive_read_set_options(struct archive *_a,
+		     const char *opts);
+
 /* data */
 extern int archive_read_data_skip(struct archive *);
 extern int archive_read_data_into_fd(struct archive *, int fd);
@@ -223,6 +278,14 @@ extern int archive_write_open_memory(struct archive *,
 /* closing */
 extern int		 archive_write_close(struct archive *);
 
+/* disk */
+extern struct archive	*archive_write_disk_new(void);
+extern int		 archive_write_disk_set_options(struct archive *,
+		     int flags);
+extern int		 archive_write_disk_set_standard_lookup(struct archive *);
+extern int archive_read_extract2(struct archive *, struct archive_entry *,
+		     struct archive * /* dest */);
+
 /* headers */
 extern int archive_write_header(struct archive *,
 		     struct archive_entry *);
@@ -233,6 +296,8 @@ extern int archive_write_header(struct archive *,
 extern int		 archive_write_finish_entry(struct archive *);
 
 /* FILTERS */
+/* Filters without a function in these headers (lz4, zstd) are added by code. */
+extern int archive_write_add_filter(struct archive *, int filter_code);
 extern int archive_write_add_filter_bzip2(struct archive *);
 extern int archive_write_add_filter_compress(struct archive *);
 extern int archive_write_add_filter_gzip(struct archive *);
@@ -241,6 +306,18 @@ extern int archive_write_add_filter_lzma(struct archive *);
 extern int archive_write_add_filter_none(struct archive *);
 extern int archive_write_add_filter_xz(struct archive *);
 
+/* options */
+extern int archive_write_set_format_option(struct archive *_a,
+		     const char *m, const char *o,
+		     const char *v);
+extern int archive_write_set_filter_option(struct archive *_a,
+		     const char *m, const char *o,
+		     const char *v);
+extern int archive_write_set_option(struct archive *_a,
+		     const char *m, const char *o,
+		     const char *v);
+extern int archive_write_set_options(struct archive *_a,
+		     const char *opts);
 
 /* FORMATS */
 /* A convenience function to set the format based on the code or name. */
@@ -276,6 +353,7 @@ extern __LA_INT64_T	 archive_entry_size(struct archive_entry *);
 extern time_t            archive_entry_mtime(struct archive_entry *);
 extern __LA_MODE_T	 archive_entry_filetype(struct archive_entry *);
 extern __LA_MODE_T	 archive_entry_perm(struct archive_entry *);
+extern int		 archive_entry_sparse_count(struct archive_entry *);
 
 /* writing */
 extern void	archive_entry_set_pathname(struct archive_entry *, const char *);
@@ -285,6 +363,11 @@ extern void	archive_entry_set_filetype(struct archive_entry *, unsigned int);
 extern void	archive_entry_set_perm(struct archive_entry *, __LA_MODE_T);
 
 
+/* FILTER STATE */
+extern __LA_INT64_T	 archive_filter_bytes(struct archive *, int);
+extern int		 archive_filter_code(struct archive *, int);
+extern int		 archive_filter_count(struct archive *);
+
 /* ERROR HANDLING */
 extern int		 archive_errno(struct archive *);
 extern const char	*archive_error_string(struct archive *);
@@ -310,6 +393,12 @@ extern const char	*archive_error_string(struct archive *);
 #define	ARCHIVE_FILTER_UU	7
 #define	ARCHIVE_FILTER_RPM	8
 #define	ARCHIVE_FILTER_LZIP	9
+/* Added in later libarchive releases. */
+#define	ARCHIVE_FILTER_LRZIP	10
+#define	ARCHIVE_FILTER_LZOP	11
+#define	ARCHIVE_FILTER_GRZIP	12
+#define	ARCHIVE_FILTER_LZ4	13
+#define	ARCHIVE_FILTER_ZSTD	14
 
 #define	ARCHIVE_FORMAT_BASE_MASK		0xff0000
 #define	ARCHIVE_FORMAT_CPIO			0x10000
@@ -356,27 +445,882 @@ extern const char	*archive_error_string(struct archive *);
 #define	ARCHIVE_EXTRACT_NO_OVERWRITE_NEWER	(0x0800)
 #define	ARCHIVE_EXTRACT_SPARSE			(0x1000)
 #define	ARCHIVE_EXTRACT_MAC_METADATA		(0x2000)
+#define	ARCHIVE_EXTRACT_SECURE_NOABSOLUTEPATHS	(0x10000)
 
 %inline %{
 PyObject *archive_read_data_into_str(struct archive *archive, int len) {
     PyObject *str = NULL;
+    ssize_t ret;
     if (!(str = PyString_FromStringAndSize(NULL, len))) {
         PyErr_SetString(PyExc_MemoryError, "could not allocate string.");
         return NULL;
     }
-    if (len != archive_read_data(archive, PyString_AS_STRING(str), len)) {
+    Py_BEGIN_ALLOW_THREADS
+    ret = archive_read_data(archive, PyString_AS_STRING(str), len);
+    Py_END_ALLOW_THREADS
+    if (ret < 0) {
+        Py_DECREF(str);
         PyErr_SetString(PyExc_RuntimeError, "could not read requested data.");
         return NULL;
     }
+    /* Short read, the end of the entry was reached. */
+    if (ret != len && _PyString_Resize(&str, ret) < 0)
+        return NULL;
     return str;
 }
 
+PyObject *archive_read_data_into_buffer(struct archive *archive, PyObject *buffer, int size) {
+    Py_buffer view;
+    int have_view = 0;
+    void *buf = NULL;
+    Py_ssize_t len = 0;
+    ssize_t ret;
+    if (PyObject_CheckBuffer(buffer)) {
+        if (PyObject_GetBuffer(buffer, &view, PyBUF_WRITABLE) < 0)
+            return NULL;
+        buf = view.buf;
+        len = view.len;
+        have_view = 1;
+    } else if (PyObject_AsWriteBuffer(buffer, &buf, &len) < 0) {
+        /* Old style buffers, for example mmap objects. */
+        return NULL;
+    }
+    if (size >= 0 && size < len)
+        len = size;
+    Py_BEGIN_ALLOW_THREADS
+    ret = archive_read_data(archive, buf, len);
+    Py_END_ALLOW_THREADS
+    if (have_view)
+        PyBuffer_Release(&view);
+    if (ret < 0) {
+        PyErr_SetString(PyExc_RuntimeError, "could not read requested data.");
+        return NULL;
+    }
+    return PyInt_FromSsize_t(ret);
+}
+
+PyObject *archive_read_data_block_into_view(struct archive *archive) {
+    const void *buf = NULL;
+    size_t size = 0;
+    __LA_INT64_T offset = 0;
+    Py_buffer view;
+    int ret;
+    Py_BEGIN_ALLOW_THREADS
+    ret = archive_read_data_block(archive, &buf, &size, &offset);
+    Py_END_ALLOW_THREADS
+    if (ret == ARCHIVE_EOF)
+        Py_RETURN_NONE;
+    if (ret != ARCHIVE_OK && ret != ARCHIVE_WARN) {
+        PyErr_SetString(PyExc_RuntimeError, "could not read data block.");
+        return NULL;
+    }
+    if (ret == ARCHIVE_WARN &&
+        PyErr_WarnEx(PyExc_RuntimeWarning, archive_error_string(archive), 1) < 0)
+        return NULL;
+    /* The view points into libarchive's own buffer, it is only valid until
+       the next read from the archive. */
+    if (PyBuffer_FillInfo(&view, NULL, (void *) buf, size, 1, PyBUF_CONTIG_RO) < 0)
+        return NULL;
+    return Py_BuildValue("(LN)", (PY_LONG_LONG) offset, PyMemoryView_FromBuffer(&view));
+}
+
+/* Reads the next header into entry, which the caller reuses between calls, and
+   returns (pathname, size, mtime, mode, header position) or None at the end. */
+PyObject *archive_read_next_header_fields(struct archive *archive, struct archive_entry *entry) {
+    __LA_INT64_T hpos;
+    int ret;
+    Py_BEGIN_ALLOW_THREADS
+    ret = archive_read_next_header2(archive, entry);
+    Py_END_ALLOW_THREADS
+    if (ret == ARCHIVE_EOF)
+        Py_RETURN_NONE;
+    /* Like call_and_check(), ARCHIVE_RETRY leaves the entry unfilled as well. */
+    if (ret != ARCHIVE_OK && ret != ARCHIVE_WARN) {
+        PyErr_Format(PyExc_RuntimeError, "Fatal error executing function, message is: %s.",
+                     archive_error_string(archive));
+        return NULL;
+    }
+    if (ret == ARCHIVE_WARN &&
+        PyErr_WarnEx(PyExc_RuntimeWarning, archive_error_string(archive), 1) < 0)
+        return NULL;
+    hpos = archive_read_header_position(archive);
+    return Py_BuildValue("(zLlIL)", archive_entry_pathname(entry),
+                         (PY_LONG_LONG) archive_entry_size(entry),
+                         (long) archive_entry_mtime(entry),
+                         (unsigned int) archive_entry_mode(entry),
+                         (PY_LONG_LONG) hpos);
+}
+
 PyObject *archive_write_data_from_str(struct archive *archive, PyObject *str) {
     int len = PyString_Size(str);
-    if (!archive_write_data(archive, PyString_AS_STRING(str), len)) {
-        PyErr_SetString(PyExc_RuntimeError, "could not write requested data.");
+    ssize_t ret;
+    Py_BEGIN_ALLOW_THREADS
+    ret = archive_write_data(archive, PyString_AS_STRING(str), len);
+    Py_END_ALLOW_THREADS
+    /* A short count means the entry did not take all of the data. */
+    if (ret < len) {
+        PyErr_Format(PyExc_RuntimeError, "could not write requested data: %s.",
+                     archive_error_string(archive) ? archive_error_string(archive) : "short write");
         return NULL;
     }
     return PyInt_FromLong(len);
 }
-%}
\ No newline at end of file
+
+%}
+
+%{
+/* Added in libarchive 3.1. */
+#ifndef ARCHIVE_EXTRACT_SECURE_NOABSOLUTEPATHS
+#define ARCHIVE_EXTRACT_SECURE_NOABSOLUTEPATHS 0x10000
+#endif
+
+/* Prefix the given entry path with dir, buf is reused between calls. */
+static const char *_prefix_path(const char *dir, size_t dirlen, const char *name, char **buf, size_t *buflen) {
+    size_t len = dirlen + strlen(name) + 2;
+    if (len > *buflen) {
+        char *tmp = realloc(*buf, len);
+        if (tmp == NULL)
+            return NULL;
+        *buf = tmp;
+        *buflen = len;
+    }
+    snprintf(*buf, len, "%s/%s", dir, name);
+    return *buf;
+}
+
+/* Appends "name: message" (or message without a name) to the NUL separated list in
+   buf, which is reused between calls. Returns -1 if out of memory. */
+static int _add_message(char **buf, size_t *len, size_t *size, const char *name, const char *message) {
+    const char *format = name ? "%s: %s" : "%s%s";
+    size_t n;
+    if (!message)
+        message = "unknown error";
+    n = snprintf(NULL, 0, format, name ? name : "", message) + 1;
+    if (*len + n > *size) {
+        size_t newsize = *size ? *size : 256;
+        char *tmp;
+        while (newsize < *len + n)
+            newsize *= 2;
+        if (!(tmp = realloc(*buf, newsize)))
+            return -1;
+        *buf = tmp;
+        *size = newsize;
+    }
+    snprintf(*buf + *len, n, format, name ? name : "", message);
+    *len += n;
+    return 0;
+}
+
+/* Writes the current entry to disk, errors are left on the reader. */
+static int _extract_entry(struct archive *archive, struct archive_entry *entry, struct archive *disk) {
+    const void *block;
+    size_t size;
+    int64_t offset;
+    int ret, r;
+    if ((ret = archive_write_header(disk, entry)) != ARCHIVE_OK)
+        archive_copy_error(archive, disk);
+    if (ret < ARCHIVE_WARN)
+        return ret;
+    if (archive_entry_size(entry) > 0 || !archive_entry_size_is_set(entry)) {
+        while ((r = archive_read_data_block(archive, &block, &size, &offset)) != ARCHIVE_EOF) {
+            if (r < ARCHIVE_WARN)
+                return r;
+            if (archive_write_data_block(disk, block, size, offset) < ARCHIVE_WARN) {
+                archive_copy_error(archive, disk);
+                return ARCHIVE_FAILED;
+            }
+        }
+    }
+    if ((r = archive_write_finish_entry(disk)) < ret) {
+        archive_copy_error(archive, disk);
+        ret = r;
+    }
+    return ret;
+}
+%}
+
+%inline %{
+PyObject *archive_read_extract_all(struct archive *archive, const char *path, int flags) {
+    struct archive *disk = NULL;
+    struct archive_entry *entry = NULL;
+    const char *name = NULL;
+    char *buf = NULL, *warnings = NULL, *warning;
+    size_t buflen = 0, pathlen = path ? strlen(path) : 0, wlen = 0, wsize = 0;
+    PY_LONG_LONG count = 0, size = 0;
+    int ret = ARCHIVE_OK, nomem = 0;
+    if (!(disk = archive_write_disk_new()))
+        return PyErr_NoMemory();
+    /* Prefixed names are absolute, absolute entry names are rejected below instead. */
+    archive_write_disk_set_options(disk, pathlen ? flags & ~ARCHIVE_EXTRACT_SECURE_NOABSOLUTEPATHS : flags);
+    archive_write_disk_set_standard_lookup(disk);
+    Py_BEGIN_ALLOW_THREADS
+    while (1) {
+        ret = archive_read_next_header(archive, &entry);
+        if (ret == ARCHIVE_EOF) {
+            ret = ARCHIVE_OK;
+            break;
+        }
+        if (ret == ARCHIVE_FATAL)
+            break;
+        if (ret != ARCHIVE_OK && ret != ARCHIVE_WARN) {
+            /* Skip the entry, the next header can still be read. */
+            if (_add_message(&warnings, &wlen, &wsize, NULL, archive_error_string(archive) ?
+                             archive_error_string(archive) : "could not read entry header") < 0) {
+                nomem = 1;
+                break;
+            }
+            continue;
+        }
+        if (pathlen) {
+            /* Extract relative to path, including hardlink targets. */
+            if ((name = archive_entry_pathname(entry)) != NULL) {
+                if ((flags & ARCHIVE_EXTRACT_SECURE_NOABSOLUTEPATHS) && name[0] == '/') {
+                    if (_add_message(&warnings, &wlen, &wsize, name, "Path is absolute") < 0) {
+                        nomem = 1;
+                        break;
+                    }
+                    continue;
+                }
+                if (!(name = _prefix_path(path, pathlen, name, &buf, &buflen))) {
+                    nomem = 1;
+                    break;
+                }
+                archive_entry_copy_pathname(entry, name);
+            }
+            if ((name = archive_entry_hardlink(entry)) != NULL) {
+                if ((flags & ARCHIVE_EXTRACT_SECURE_NOABSOLUTEPATHS) && name[0] == '/') {
+                    if (_add_message(&warnings, &wlen, &wsize, name, "Path is absolute") < 0) {
+                        nomem = 1;
+                        break;
+                    }
+                    continue;
+                }
+                if (!(name = _prefix_path(path, pathlen, name, &buf, &buflen))) {
+                    nomem = 1;
+                    break;
+                }
+                archive_entry_copy_hardlink(entry, name);
+            }
+        }
+        /* archive_read_extract2() reports rejected entries as warnings, so its
+           steps are done here to tell them apart. */
+        if ((ret = _extract_entry(archive, entry, disk)) == ARCHIVE_FATAL)
+            break;
+        if (ret != ARCHIVE_OK) {
+            /* A failed entry is reported and the remaining ones are still extracted. */
+            /* Report the name as it was in the archive. */
+            if ((name = archive_entry_pathname(entry)) != NULL && pathlen)
+                name += pathlen + 1;
+            if (_add_message(&warnings, &wlen, &wsize, name, archive_error_string(archive)) < 0) {
+                nomem = 1;
+                break;
+            }
+            if (ret != ARCHIVE_WARN)
+                continue;
+        }
+        count++;
+        size += archive_entry_size(entry);
+    }
+    /* Closing restores directory times and permissions. */
+    archive_write_free(disk);
+    Py_END_ALLOW_THREADS
+    free(buf);
+    if (nomem || ret == ARCHIVE_FATAL) {
+        free(warnings);
+        if (nomem)
+            PyErr_NoMemory();
+        else
+            PyErr_Format(PyExc_RuntimeError, "could not extract archive: %s.",
+                         archive_error_string(archive) ? archive_error_string(archive) : "unknown error");
+        return NULL;
+    }
+    /* One warning per skipped entry. */
+    for (warning = warnings; warning < warnings + wlen; warning += strlen(warning) + 1) {
+        if (PyErr_WarnEx(PyExc_RuntimeWarning, warning, 1) < 0) {
+            free(warnings);
+            return NULL;
+        }
+    }
+    free(warnings);
+    return Py_BuildValue("(LL)", count, size);
+}
+
+PyObject *archive_write_data_from_fd(struct archive *archive, int fd, int64_t length, int blocksize) {
+    char *buf = NULL;
+    ssize_t count = 0, written = 0, offset;
+    int64_t total = 0;
+    if (blocksize <= 0)
+        blocksize = 10240;
+    if (!(buf = PyMem_Malloc(blocksize)))
+        return PyErr_NoMemory();
+    Py_BEGIN_ALLOW_THREADS
+    /* Copy until EOF, or until length bytes were copied if length >= 0. */
+    while (length < 0 || total < length) {
+        count = blocksize;
+        if (length >= 0 && length - total < count)
+            count = length - total;
+        count = read(fd, buf, count);
+        if (count < 0 && errno == EINTR)
+            continue;
+        if (count <= 0)
+            break;
+        for (offset = 0; offset < count; offset += written) {
+            written = archive_write_data(archive, buf + offset, count - offset);
+            if (written <= 0)
+                break;
+        }
+        if (written <= 0)
+            break;
+        total += count;
+    }
+    Py_END_ALLOW_THREADS
+    PyMem_Free(buf);
+    if (count < 0)
+        return PyErr_SetFromErrno(PyExc_OSError);
+    if (written < 0 || (count > 0 && written == 0)) {
+        PyErr_SetString(PyExc_RuntimeError, "could not write requested data.");
+        return NULL;
+    }
+    return PyLong_FromLongLong(total);
+}
+%}
+
+%{
+/* Like archive_write_open_fd() on a regular file, don't pad the last block with
+   zeros. Some decompressors (zstd) reject the padding. */
+static void _unpadded(struct archive *archive) {
+    if (archive_write_get_bytes_in_last_block(archive) < 0)
+        archive_write_set_bytes_in_last_block(archive, 1);
+}
+
+/* Client data for archives read from or written to a Python file object. */
+struct pyio {
+    PyObject *file;
+    /* The bytearray filled by readinto(), or the last string read() returned. */
+    PyObject *buffer;
+    int readinto;
+    size_t blocksize;
+};
+
+/* Moves the pending Python exception into the archive's error message, the
+   wrapper of the libarchive call raises it from there. Needs the GIL. */
+static void _pyio_set_error(struct archive *archive) {
+    PyObject *type, *value, *traceback, *str = NULL;
+    PyErr_Fetch(&type, &value, &traceback);
+    if (value)
+        str = PyObject_Str(value);
+    archive_set_error(archive, EIO, "%s",
+                      str && PyString_Check(str) ? PyString_AS_STRING(str) : "I/O error in file object");
+    Py_XDECREF(str);
+    Py_XDECREF(type);
+    Py_XDECREF(value);
+    Py_XDECREF(traceback);
+    PyErr_Clear();
+}
+
+static ssize_t _pyio_read(struct archive *archive, void *data, const void **buffer) {
+    struct pyio *io = data;
+    PyObject *result;
+    ssize_t size = -1;
+    PyGILState_STATE gil = PyGILState_Ensure();
+    if (io->readinto) {
+        result = PyObject_CallMethod(io->file, "readinto", "O", io->buffer);
+        if (result == Py_None)
+            PyErr_SetString(PyExc_IOError, "readinto() returned None, non-blocking files are not supported");
+        else if (result)
+            size = PyInt_AsSsize_t(result);
+        *buffer = PyByteArray_AS_STRING(io->buffer);
+        Py_XDECREF(result);
+    } else {
+        result = PyObject_CallMethod(io->file, "read", "n", (Py_ssize_t) io->blocksize);
+        if (result && !PyString_Check(result)) {
+            PyErr_SetString(PyExc_TypeError, "read() did not return a string");
+            Py_CLEAR(result);
+        }
+        if (result) {
+            /* Keep the string alive until the next read. */
+            Py_XDECREF(io->buffer);
+            io->buffer = result;
+            *buffer = PyString_AS_STRING(result);
+            size = PyString_GET_SIZE(result);
+        }
+    }
+    if (size < 0)
+        _pyio_set_error(archive);
+    PyGILState_Release(gil);
+    return size;
+}
+
+static __LA_INT64_T _pyio_seek(struct archive *archive, void *data, __LA_INT64_T offset, int whence) {
+    struct pyio *io = data;
+    PyObject *result;
+    __LA_INT64_T position = ARCHIVE_FATAL;
+    PyGILState_STATE gil = PyGILState_Ensure();
+    result = PyObject_CallMethod(io->file, "seek", "Li", (PY_LONG_LONG) offset, whence);
+    if (result) {
+        Py_DECREF(result);
+        result = PyObject_CallMethod(io->file, "tell", NULL);
+    }
+    if (result) {
+        position = PyLong_AsLongLong(result);
+        Py_DECREF(result);
+    }
+    if (position < 0) {
+        position = ARCHIVE_FATAL;
+        _pyio_set_error(archive);
+    }
+    PyGILState_Release(gil);
+    return position;
+}
+
+static __LA_INT64_T _pyio_skip(struct archive *archive, void *data, __LA_INT64_T request) {
+    struct pyio *io = data;
+    PyObject *result;
+    PyGILState_STATE gil = PyGILState_Ensure();
+    result = PyObject_CallMethod(io->file, "seek", "Li", (PY_LONG_LONG) request, SEEK_CUR);
+    if (result) {
+        Py_DECREF(result);
+    } else {
+        /* Let libarchive read over the data instead. */
+        PyErr_Clear();
+        request = 0;
+    }
+    PyGILState_Release(gil);
+    return request;
+}
+
+/* Writes length bytes to the file, returns -1 on error. */
+static int _pyio_write_out(struct archive *archive, struct pyio *io, const char *buffer, size_t length) {
+    PyObject *result;
+    Py_ssize_t written;
+    int ret = 0;
+    PyGILState_STATE gil = PyGILState_Ensure();
+    while (length > 0) {
+        result = PyObject_CallMethod(io->file, "write", "s#", buffer, (int) length);
+        if (!result) {
+            ret = -1;
+            break;
+        }
+        /* file.write() returns None, raw files return the count. */
+        written = result == Py_None ? (Py_ssize_t) length : PyInt_AsSsize_t(result);
+        Py_DECREF(result);
+        if (written <= 0) {
+            if (!PyErr_Occurred())
+                PyErr_SetString(PyExc_IOError, "write() did not accept any data");
+            ret = -1;
+            break;
+        }
+        buffer += written;
+        length -= written;
+    }
+    if (ret < 0)
+        _pyio_set_error(archive);
+    PyGILState_Release(gil);
+    return ret;
+}
+
+static ssize_t _pyio_write(struct archive *archive, void *data, const void *buffer, size_t length) {
+    return _pyio_write_out(archive, data, buffer, length) < 0 ? -1 : (ssize_t) length;
+}
+
+static int _pyio_close(struct archive *archive, void *data) {
+    struct pyio *io = data;
+    PyGILState_STATE gil = PyGILState_Ensure();
+    Py_XDECREF(io->file);
+    Py_XDECREF(io->buffer);
+    PyGILState_Release(gil);
+    free(io);
+    return ARCHIVE_OK;
+}
+
+static struct pyio *_pyio_new(struct archive *archive, PyObject *file, int blocksize) {
+    struct pyio *io = calloc(1, sizeof(struct pyio));
+    if (!io) {
+        archive_set_error(archive, ENOMEM, "No memory");
+        return NULL;
+    }
+    io->blocksize = blocksize > 0 ? blocksize : 10240;
+    io->file = file;
+    Py_INCREF(file);
+    return io;
+}
+%}
+
+%inline %{
+/* Opens the archive for reading from a Python object with read() or readinto().
+   seek() is only used (for skipping data and by seeking readers like zip's)
+   when seekable is set. The object is not closed. */
+int archive_read_open_pyobject(struct archive *archive, PyObject *file, int blocksize, int seekable) {
+    struct pyio *io = _pyio_new(archive, file, blocksize);
+    int ret;
+    if (!io)
+        return ARCHIVE_FATAL;
+    io->readinto = PyObject_HasAttrString(file, "readinto");
+    if (io->readinto && !(io->buffer = PyByteArray_FromStringAndSize(NULL, io->blocksize))) {
+        PyErr_Clear();
+        _pyio_close(archive, io);
+        archive_set_error(archive, ENOMEM, "No memory");
+        return ARCHIVE_FATAL;
+    }
+    archive_read_set_read_callback(archive, _pyio_read);
+    archive_read_set_close_callback(archive, _pyio_close);
+    if (seekable) {
+        archive_read_set_skip_callback(archive, _pyio_skip);
+        archive_read_set_seek_callback(archive, _pyio_seek);
+    }
+    archive_read_set_callback_data(archive, io);
+    Py_BEGIN_ALLOW_THREADS
+    ret = archive_read_open1(archive);
+    Py_END_ALLOW_THREADS
+    return ret;
+}
+
+/* Opens the archive for writing to a Python object with write(), in chunks of
+   blocksize bytes. The object is not closed. */
+int archive_write_open_pyobject(struct archive *archive, PyObject *file, int blocksize) {
+    struct pyio *io = _pyio_new(archive, file, blocksize);
+    int ret;
+    if (!io)
+        return ARCHIVE_FATAL;
+    /* libarchive batches the writes. The last block goes through _pyio_write()
+       as well, errors returned by the close callback would be ignored. */
+    archive_write_set_bytes_per_block(archive, io->blocksize);
+    _unpadded(archive);
+    Py_BEGIN_ALLOW_THREADS
+    ret = archive_write_open(archive, io, NULL, _pyio_write, _pyio_close);
+    Py_END_ALLOW_THREADS
+    return ret;
+}
+%}
+%{
+/* Client data for archives read straight from the memory of a Python object. */
+struct pybuffer {
+    PyObject *obj;
+    /* Only set for objects with the new buffer interface. */
+    Py_buffer view;
+    int has_view;
+    const char *data;
+    size_t size;
+    size_t position;
+};
+
+static ssize_t _pybuffer_read(struct archive *archive, void *client, const void **buffer) {
+    struct pybuffer *buf = client;
+    size_t size = buf->size - buf->position;
+    *buffer = buf->data + buf->position;
+    /* Everything at once, the data is already in memory. */
+    buf->position = buf->size;
+    return size;
+}
+
+static __LA_INT64_T _pybuffer_skip(struct archive *archive, void *client, __LA_INT64_T request) {
+    struct pybuffer *buf = client;
+    if (request > (__LA_INT64_T) (buf->size - buf->position))
+        request = buf->size - buf->position;
+    buf->position += request;
+    return request;
+}
+
+static __LA_INT64_T _pybuffer_seek(struct archive *archive, void *client, __LA_INT64_T offset, int whence) {
+    struct pybuffer *buf = client;
+    if (whence == SEEK_CUR)
+        offset += buf->position;
+    else if (whence == SEEK_END)
+        offset += buf->size;
+    if (offset < 0)
+        return ARCHIVE_FATAL;
+    buf->position = offset > (__LA_INT64_T) buf->size ? buf->size : offset;
+    return buf->position;
+}
+
+static int _pybuffer_close(struct archive *archive, void *client) {
+    struct pybuffer *buf = client;
+    PyGILState_STATE gil = PyGILState_Ensure();
+    if (buf->has_view)
+        PyBuffer_Release(&buf->view);
+    Py_DECREF(buf->obj);
+    PyGILState_Release(gil);
+    free(buf);
+    return ARCHIVE_OK;
+}
+
+/* Output of archives written to memory, grown as needed. */
+struct membuf {
+    char *data;
+    size_t len;
+    size_t size;
+};
+
+static ssize_t _membuf_write(struct archive *archive, void *client, const void *buffer, size_t length) {
+    struct membuf *buf = client;
+    size_t size = buf->size;
+    char *data;
+    while (size - buf->len < length)
+        size = size ? size * 2 : 65536;
+    if (size != buf->size) {
+        if (!(data = realloc(buf->data, size))) {
+            archive_set_error(archive, ENOMEM, "No memory");
+            return -1;
+        }
+        buf->data = data;
+        buf->size = size;
+    }
+    memcpy(buf->data + buf->len, buffer, length);
+    buf->len += length;
+    return length;
+}
+%}
+
+%inline %{
+/* Opens the archive for reading from the memory of obj, starting offset bytes
+   in. obj can be anything with the buffer interface (str, bytearray, memoryview,
+   mmap), it is referenced until the archive is closed and nothing is copied. */
+int archive_read_open_pybuffer(struct archive *archive, PyObject *obj, size_t offset) {
+    struct pybuffer *buf = calloc(1, sizeof(struct pybuffer));
+    const void *data;
+    Py_ssize_t size;
+    int ret;
+    if (!buf) {
+        archive_set_error(archive, ENOMEM, "No memory");
+        return ARCHIVE_FATAL;
+    }
+    if (PyObject_CheckBuffer(obj)) {
+        if (PyObject_GetBuffer(obj, &buf->view, PyBUF_SIMPLE) == 0) {
+            buf->has_view = 1;
+            data = buf->view.buf;
+            size = buf->view.len;
+        } else {
+            size = -1;
+        }
+    } else if (PyObject_AsReadBuffer(obj, &data, &size) < 0) {
+        size = -1;
+    }
+    if (size < 0) {
+        free(buf);
+        PyErr_Clear();
+        archive_set_error(archive, EINVAL, "Object does not support the buffer interface");
+        return ARCHIVE_FATAL;
+    }
+    buf->obj = obj;
+    Py_INCREF(obj);
+    if (offset > (size_t) size)
+        offset = size;
+    buf->data = (const char *) data + offset;
+    buf->size = size - offset;
+    archive_read_set_read_callback(archive, _pybuffer_read);
+    archive_read_set_skip_callback(archive, _pybuffer_skip);
+    archive_read_set_seek_callback(archive, _pybuffer_seek);
+    archive_read_set_close_callback(archive, _pybuffer_close);
+    archive_read_set_callback_data(archive, buf);
+    Py_BEGIN_ALLOW_THREADS
+    ret = archive_read_open1(archive);
+    Py_END_ALLOW_THREADS
+    return ret;
+}
+
+struct membuf *membuf_new(void) {
+    return calloc(1, sizeof(struct membuf));
+}
+
+void membuf_free(struct membuf *buf) {
+    free(buf->data);
+    free(buf);
+}
+
+/* Returns a copy of what was written so far. */
+PyObject *membuf_to_str(struct membuf *buf) {
+    return PyString_FromStringAndSize(buf->data, buf->len);
+}
+
+/* Opens the archive for writing into buf, which must outlive the archive. */
+int archive_write_open_membuf(struct archive *archive, struct membuf *buf) {
+    int ret;
+    _unpadded(archive);
+    Py_BEGIN_ALLOW_THREADS
+    ret = archive_write_open(archive, buf, NULL, _membuf_write, NULL);
+    Py_END_ALLOW_THREADS
+    return ret;
+}
+%}
+
+%{
+#ifndef POSIX_FADV_SEQUENTIAL
+#define POSIX_FADV_SEQUENTIAL 0
+#define POSIX_FADV_WILLNEED 0
+#endif
+%}
+
+%constant int POSIX_FADV_SEQUENTIAL = POSIX_FADV_SEQUENTIAL;
+%constant int POSIX_FADV_WILLNEED = POSIX_FADV_WILLNEED;
+
+%inline %{
+/* Tells the kernel how the given range of fd will be read, see posix_fadvise().
+   Returns 0 or an errno value. Does nothing where posix_fadvise() is missing. */
+int fadvise(int fd, long long offset, long long length, int advice) {
+    int ret = 0;
+#ifdef POSIX_FADV_NORMAL
+    Py_BEGIN_ALLOW_THREADS
+    ret = posix_fadvise(fd, offset, length, advice);
+    Py_END_ALLOW_THREADS
+#endif
+    return ret;
+}
+%}
+
+%{
+#ifndef MADV_SEQUENTIAL
+#define MADV_SEQUENTIAL 0
+#define MADV_WILLNEED 0
+#endif
+
+/* Gets the memory of obj, either through the new or the old buffer interface. Fills
+   view when the new one was used, it must be released. Returns 0 or -1 with a
+   Python exception set. */
+static int _get_buffer(PyObject *obj, Py_buffer *view, const char **data, Py_ssize_t *size) {
+    const void *ptr;
+    view->obj = NULL;
+    if (PyObject_CheckBuffer(obj)) {
+        if (PyObject_GetBuffer(obj, view, PyBUF_SIMPLE) < 0)
+            return -1;
+        *data = view->buf;
+        *size = view->len;
+        return 0;
+    }
+    if (PyObject_AsReadBuffer(obj, &ptr, size) < 0)
+        return -1;
+    *data = ptr;
+    return 0;
+}
+%}
+
+%constant int MADV_SEQUENTIAL = MADV_SEQUENTIAL;
+%constant int MADV_WILLNEED = MADV_WILLNEED;
+
+%inline %{
+/* Tells the kernel how the given range of obj's memory (an mmap) will be used, see
+   madvise(). length 0 means up to the end. Returns 0 or an errno value. */
+int madvise_buffer(PyObject *obj, long long offset, long long length, int advice) {
+    Py_buffer view;
+    const char *data;
+    Py_ssize_t size;
+    long page = sysconf(_SC_PAGESIZE);
+    char *start;
+    int ret = 0;
+    if (_get_buffer(obj, &view, &data, &size) < 0) {
+        PyErr_Clear();
+        return EINVAL;
+    }
+    if (offset < 0 || offset > size)
+        offset = size;
+    if (length <= 0 || length > size - offset)
+        length = size - offset;
+#ifdef MADV_NORMAL
+    /* madvise() wants a page aligned address. */
+    start = (char *) data + offset;
+    length += (size_t) start % page;
+    start -= (size_t) start % page;
+    if (length > 0 && madvise(start, length, advice) < 0)
+        ret = errno;
+#endif
+    if (view.obj)
+        PyBuffer_Release(&view);
+    return ret;
+}
+%}
+
+%{
+#ifdef __linux__
+#include <sys/sendfile.h>
+#include <sys/syscall.h>
+#endif
+%}
+
+%inline %{
+/* Copies length bytes at offset in in_fd to the current position of out_fd, without
+   moving in_fd's position. The data stays in the kernel when possible: it tries
+   copy_file_range() (which can share blocks on the same filesystem), then
+   sendfile() (which also works for sockets and pipes), and falls back to pread()
+   and write(). Returns the number of bytes copied, less than length if in_fd ends
+   early. */
+PyObject *copy_fd_range(int in_fd, long long offset, int out_fd, long long length) {
+    /* 0: copy_file_range(), 1: sendfile(), 2: pread() and write(). */
+    int method = 0, error;
+    long long total = 0;
+    ssize_t count = 0, written;
+    size_t chunk;
+    off_t off = offset;
+    char *buf = NULL;
+    Py_BEGIN_ALLOW_THREADS
+    while (total < length) {
+        chunk = length - total > 0x40000000 ? 0x40000000 : (size_t) (length - total);
+#if defined(__linux__) && defined(SYS_copy_file_range)
+        if (method == 0) {
+            loff_t in_off = off;
+            count = syscall(SYS_copy_file_range, in_fd, &in_off, out_fd, NULL, chunk, 0);
+            if (count < 0 && errno != EINTR) {
+                /* Not supported for these files, try the next method. */
+                if (total == 0 && (errno == ENOSYS || errno == EXDEV || errno == EINVAL ||
+                                   errno == EOPNOTSUPP || errno == EBADF)) {
+                    method = 1;
+                    continue;
+                }
+                break;
+            }
+        }
+#else
+        if (method == 0)
+            method = 1;
+#endif
+#ifdef __linux__
+        if (method == 1) {
+            off_t in_off = off;
+            count = sendfile(out_fd, in_fd, &in_off, chunk);
+            if (count < 0 && errno != EINTR) {
+                if (total == 0 && (errno == ENOSYS || errno == EINVAL)) {
+                    method = 2;
+                    continue;
+                }
+                break;
+            }
+        }
+#else
+        if (method == 1)
+            method = 2;
+#endif
+        if (method == 2) {
+            if (!buf && !(buf = malloc(65536))) {
+                errno = ENOMEM;
+                count = -1;
+                break;
+            }
+            count = pread(in_fd, buf, chunk > 65536 ? 65536 : chunk, off);
+            for (written = 0; count > 0 && written < count; ) {
+                ssize_t n = write(out_fd, buf + written, count - written);
+                if (n < 0 && errno == EINTR)
+                    continue;
+                if (n <= 0) {
+                    count = -1;
+                    break;
+                }
+                written += n;
+            }
+            if (count < 0 && errno != EINTR)
+                break;
+        }
+        if (count == 0)
+            break;
+        if (count > 0) {
+            off += count;
+            total += count;
+        }
+    }
+    error = errno;
+    Py_END_ALLOW_THREADS
+    free(buf);
+    if (count < 0 && total < length) {
+        errno = error;
+        return PyErr_SetFromErrno(PyExc_OSError);
+    }
+    return PyLong_FromLongLong(total);
+}
+%}
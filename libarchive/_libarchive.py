@@ -1,13 +1,22 @@
 # This file was automatically generated by SWIG (http://www.swig.org).
-# Version 2.0.4
+# Version 3.0.12
 #
 # Do not make changes to this file unless you know what you are doing--modify
 # the SWIG interface file instead.
 
-
-
-from sys import version_info
-if version_info >= (2,6,0):
+from sys import version_info as _swig_python_version_info
+if _swig_python_version_info >= (2, 7, 0):
+    def swig_import_helper():
+        import importlib
+        pkg = __name__.rpartition('.')[0]
+        mname = '.'.join((pkg, '__libarchive')).lstrip('.')
+        try:
+            return importlib.import_module(mname)
+        except ImportError:
+            return importlib.import_module('__libarchive')
+    __libarchive = swig_import_helper()
+    del swig_import_helper
+elif _swig_python_version_info >= (2, 6, 0):
     def swig_import_helper():
         from os.path import dirname
         import imp
@@ -17,391 +26,478 @@ if version_info >= (2,6,0):
         except ImportError:
             import __libarchive
             return __libarchive
-        if fp is not None:
-            try:
-                _mod = imp.load_module('__libarchive', fp, pathname, description)
-            finally:
+        try:
+            _mod = imp.load_module('__libarchive', fp, pathname, description)
+        finally:
+            if fp is not None:
                 fp.close()
-            return _mod
+        return _mod
     __libarchive = swig_import_helper()
     del swig_import_helper
 else:
     import __libarchive
-del version_info
+del _swig_python_version_info
+
 try:
     _swig_property = property
 except NameError:
-    pass # Python < 2.2 doesn't have 'property'.
-def _swig_setattr_nondynamic(self,class_type,name,value,static=1):
-    if (name == "thisown"): return self.this.own(value)
+    pass  # Python < 2.2 doesn't have 'property'.
+
+try:
+    import builtins as __builtin__
+except ImportError:
+    import __builtin__
+
+def _swig_setattr_nondynamic(self, class_type, name, value, static=1):
+    if (name == "thisown"):
+        return self.this.own(value)
     if (name == "this"):
         if type(value).__name__ == 'SwigPyObject':
             self.__dict__[name] = value
             return
-    method = class_type.__swig_setmethods__.get(name,None)
-    if method: return method(self,value)
+    method = class_type.__swig_setmethods__.get(name, None)
+    if method:
+        return method(self, value)
     if (not static):
-        self.__dict__[name] = value
+        if _newclass:
+            object.__setattr__(self, name, value)
+        else:
+            self.__dict__[name] = value
     else:
         raise AttributeError("You cannot add attributes to %s" % self)
 
-def _swig_setattr(self,class_type,name,value):
-    return _swig_setattr_nondynamic(self,class_type,name,value,0)
 
-def _swig_getattr(self,class_type,name):
-    if (name == "thisown"): return self.this.own()
-    method = class_type.__swig_getmethods__.get(name,None)
-    if method: return method(self)
-    raise AttributeError(name)
+def _swig_setattr(self, class_type, name, value):
+    return _swig_setattr_nondynamic(self, class_type, name, value, 0)
+
+
+def _swig_getattr(self, class_type, name):
+    if (name == "thisown"):
+        return self.this.own()
+    method = class_type.__swig_getmethods__.get(name, None)
+    if method:
+        return method(self)
+    raise AttributeError("'%s' object has no attribute '%s'" % (class_type.__name__, name))
+
 
 def _swig_repr(self):
-    try: strthis = "proxy of " + self.this.__repr__()
-    except: strthis = ""
+    try:
+        strthis = "proxy of " + self.this.__repr__()
+    except __builtin__.Exception:
+        strthis = ""
     return "<%s.%s; %s >" % (self.__class__.__module__, self.__class__.__name__, strthis,)
 
 try:
     _object = object
     _newclass = 1
-except AttributeError:
-    class _object : pass
+except __builtin__.Exception:
+    class _object:
+        pass
     _newclass = 0
 
 
-
 def archive_read_new():
-  return __libarchive.archive_read_new()
+    return __libarchive.archive_read_new()
 archive_read_new = __libarchive.archive_read_new
 
-def archive_read_free(*args):
-  return __libarchive.archive_read_free(*args)
+def archive_read_free(arg1):
+    return __libarchive.archive_read_free(arg1)
 archive_read_free = __libarchive.archive_read_free
 
-def archive_read_open_filename(*args):
-  return __libarchive.archive_read_open_filename(*args)
+def archive_read_open_filename(arg1, _filename, _block_size):
+    return __libarchive.archive_read_open_filename(arg1, _filename, _block_size)
 archive_read_open_filename = __libarchive.archive_read_open_filename
 
-def archive_read_open_memory(*args):
-  return __libarchive.archive_read_open_memory(*args)
+def archive_read_open_memory(arg1, buff, size):
+    return __libarchive.archive_read_open_memory(arg1, buff, size)
 archive_read_open_memory = __libarchive.archive_read_open_memory
 
-def archive_read_open_memory2(*args):
-  return __libarchive.archive_read_open_memory2(*args)
+def archive_read_open_memory2(a, buff, size, read_size):
+    return __libarchive.archive_read_open_memory2(a, buff, size, read_size)
 archive_read_open_memory2 = __libarchive.archive_read_open_memory2
 
-def archive_read_open_fd(*args):
-  return __libarchive.archive_read_open_fd(*args)
+def archive_read_open_fd(arg1, _fd, _block_size):
+    return __libarchive.archive_read_open_fd(arg1, _fd, _block_size)
 archive_read_open_fd = __libarchive.archive_read_open_fd
 
-def archive_read_close(*args):
-  return __libarchive.archive_read_close(*args)
+def archive_read_close(arg1):
+    return __libarchive.archive_read_close(arg1)
 archive_read_close = __libarchive.archive_read_close
 
-def archive_format(*args):
-  return __libarchive.archive_format(*args)
+def archive_format(arg1):
+    return __libarchive.archive_format(arg1)
 archive_format = __libarchive.archive_format
 
-def archive_read_next_header2(*args):
-  return __libarchive.archive_read_next_header2(*args)
+def archive_read_next_header2(arg1, arg2):
+    return __libarchive.archive_read_next_header2(arg1, arg2)
 archive_read_next_header2 = __libarchive.archive_read_next_header2
 
-def archive_entry_stat(*args):
-  return __libarchive.archive_entry_stat(*args)
+def archive_entry_stat(arg1):
+    return __libarchive.archive_entry_stat(arg1)
 archive_entry_stat = __libarchive.archive_entry_stat
 
-def archive_read_header_position(*args):
-  return __libarchive.archive_read_header_position(*args)
+def archive_read_header_position(arg1):
+    return __libarchive.archive_read_header_position(arg1)
 archive_read_header_position = __libarchive.archive_read_header_position
 
-def archive_read_data_skip(*args):
-  return __libarchive.archive_read_data_skip(*args)
+def archive_read_set_format_option(_a, m, o, v):
+    return __libarchive.archive_read_set_format_option(_a, m, o, v)
+archive_read_set_format_option = __libarchive.archive_read_set_format_option
+
+def archive_read_set_filter_option(_a, m, o, v):
+    return __libarchive.archive_read_set_filter_option(_a, m, o, v)
+archive_read_set_filter_option = __libarchive.archive_read_set_filter_option
+
+def archive_read_set_option(_a, m, o, v):
+    return __libarchive.archive_read_set_option(_a, m, o, v)
+archive_read_set_option = __libarchive.archive_read_set_option
+
+def archive_read_set_options(_a, opts):
+    return __libarchive.archive_read_set_options(_a, opts)
+archive_read_set_options = __libarchive.archive_read_set_options
+
+def archive_read_data_skip(arg1):
+    return __libarchive.archive_read_data_skip(arg1)
 archive_read_data_skip = __libarchive.archive_read_data_skip
 
-def archive_read_data_into_fd(*args):
-  return __libarchive.archive_read_data_into_fd(*args)
+def archive_read_data_into_fd(arg1, fd):
+    return __libarchive.archive_read_data_into_fd(arg1, fd)
 archive_read_data_into_fd = __libarchive.archive_read_data_into_fd
 
-def archive_read_support_filter_all(*args):
-  return __libarchive.archive_read_support_filter_all(*args)
+def archive_read_support_filter_all(arg1):
+    return __libarchive.archive_read_support_filter_all(arg1)
 archive_read_support_filter_all = __libarchive.archive_read_support_filter_all
 
-def archive_read_support_filter_bzip2(*args):
-  return __libarchive.archive_read_support_filter_bzip2(*args)
+def archive_read_support_filter_bzip2(arg1):
+    return __libarchive.archive_read_support_filter_bzip2(arg1)
 archive_read_support_filter_bzip2 = __libarchive.archive_read_support_filter_bzip2
 
-def archive_read_support_filter_compress(*args):
-  return __libarchive.archive_read_support_filter_compress(*args)
+def archive_read_support_filter_compress(arg1):
+    return __libarchive.archive_read_support_filter_compress(arg1)
 archive_read_support_filter_compress = __libarchive.archive_read_support_filter_compress
 
-def archive_read_support_filter_gzip(*args):
-  return __libarchive.archive_read_support_filter_gzip(*args)
+def archive_read_support_filter_gzip(arg1):
+    return __libarchive.archive_read_support_filter_gzip(arg1)
 archive_read_support_filter_gzip = __libarchive.archive_read_support_filter_gzip
 
-def archive_read_support_filter_lzip(*args):
-  return __libarchive.archive_read_support_filter_lzip(*args)
+def archive_read_support_filter_lzip(arg1):
+    return __libarchive.archive_read_support_filter_lzip(arg1)
 archive_read_support_filter_lzip = __libarchive.archive_read_support_filter_lzip
 
-def archive_read_support_filter_lzma(*args):
-  return __libarchive.archive_read_support_filter_lzma(*args)
+def archive_read_support_filter_lzma(arg1):
+    return __libarchive.archive_read_support_filter_lzma(arg1)
 archive_read_support_filter_lzma = __libarchive.archive_read_support_filter_lzma
 
-def archive_read_support_filter_none(*args):
-  return __libarchive.archive_read_support_filter_none(*args)
+def archive_read_support_filter_none(arg1):
+    return __libarchive.archive_read_support_filter_none(arg1)
 archive_read_support_filter_none = __libarchive.archive_read_support_filter_none
 
-def archive_read_support_filter_rpm(*args):
-  return __libarchive.archive_read_support_filter_rpm(*args)
+def archive_read_support_filter_rpm(arg1):
+    return __libarchive.archive_read_support_filter_rpm(arg1)
 archive_read_support_filter_rpm = __libarchive.archive_read_support_filter_rpm
 
-def archive_read_support_filter_uu(*args):
-  return __libarchive.archive_read_support_filter_uu(*args)
+def archive_read_support_filter_uu(arg1):
+    return __libarchive.archive_read_support_filter_uu(arg1)
 archive_read_support_filter_uu = __libarchive.archive_read_support_filter_uu
 
-def archive_read_support_filter_xz(*args):
-  return __libarchive.archive_read_support_filter_xz(*args)
+def archive_read_support_filter_xz(arg1):
+    return __libarchive.archive_read_support_filter_xz(arg1)
 archive_read_support_filter_xz = __libarchive.archive_read_support_filter_xz
 
-def archive_read_support_format_all(*args):
-  return __libarchive.archive_read_support_format_all(*args)
+def archive_read_support_format_all(arg1):
+    return __libarchive.archive_read_support_format_all(arg1)
 archive_read_support_format_all = __libarchive.archive_read_support_format_all
 
-def archive_read_support_format_7zip(*args):
-  return __libarchive.archive_read_support_format_7zip(*args)
+def archive_read_support_format_7zip(arg1):
+    return __libarchive.archive_read_support_format_7zip(arg1)
 archive_read_support_format_7zip = __libarchive.archive_read_support_format_7zip
 
-def archive_read_support_format_ar(*args):
-  return __libarchive.archive_read_support_format_ar(*args)
+def archive_read_support_format_ar(arg1):
+    return __libarchive.archive_read_support_format_ar(arg1)
 archive_read_support_format_ar = __libarchive.archive_read_support_format_ar
 
-def archive_read_support_format_cab(*args):
-  return __libarchive.archive_read_support_format_cab(*args)
+def archive_read_support_format_cab(arg1):
+    return __libarchive.archive_read_support_format_cab(arg1)
 archive_read_support_format_cab = __libarchive.archive_read_support_format_cab
 
-def archive_read_support_format_cpio(*args):
-  return __libarchive.archive_read_support_format_cpio(*args)
+def archive_read_support_format_cpio(arg1):
+    return __libarchive.archive_read_support_format_cpio(arg1)
 archive_read_support_format_cpio = __libarchive.archive_read_support_format_cpio
 
-def archive_read_support_format_empty(*args):
-  return __libarchive.archive_read_support_format_empty(*args)
+def archive_read_support_format_empty(arg1):
+    return __libarchive.archive_read_support_format_empty(arg1)
 archive_read_support_format_empty = __libarchive.archive_read_support_format_empty
 
-def archive_read_support_format_gnutar(*args):
-  return __libarchive.archive_read_support_format_gnutar(*args)
+def archive_read_support_format_gnutar(arg1):
+    return __libarchive.archive_read_support_format_gnutar(arg1)
 archive_read_support_format_gnutar = __libarchive.archive_read_support_format_gnutar
 
-def archive_read_support_format_iso9660(*args):
-  return __libarchive.archive_read_support_format_iso9660(*args)
+def archive_read_support_format_iso9660(arg1):
+    return __libarchive.archive_read_support_format_iso9660(arg1)
 archive_read_support_format_iso9660 = __libarchive.archive_read_support_format_iso9660
 
-def archive_read_support_format_lha(*args):
-  return __libarchive.archive_read_support_format_lha(*args)
+def archive_read_support_format_lha(arg1):
+    return __libarchive.archive_read_support_format_lha(arg1)
 archive_read_support_format_lha = __libarchive.archive_read_support_format_lha
 
-def archive_read_support_format_rar(*args):
-  return __libarchive.archive_read_support_format_rar(*args)
+def archive_read_support_format_rar(arg1):
+    return __libarchive.archive_read_support_format_rar(arg1)
 archive_read_support_format_rar = __libarchive.archive_read_support_format_rar
 
-def archive_read_support_format_raw(*args):
-  return __libarchive.archive_read_support_format_raw(*args)
+def archive_read_support_format_raw(arg1):
+    return __libarchive.archive_read_support_format_raw(arg1)
 archive_read_support_format_raw = __libarchive.archive_read_support_format_raw
 
-def archive_read_support_format_tar(*args):
-  return __libarchive.archive_read_support_format_tar(*args)
+def archive_read_support_format_tar(arg1):
+    return __libarchive.archive_read_support_format_tar(arg1)
 archive_read_support_format_tar = __libarchive.archive_read_support_format_tar
 
-def archive_read_support_format_xar(*args):
-  return __libarchive.archive_read_support_format_xar(*args)
+def archive_read_support_format_xar(arg1):
+    return __libarchive.archive_read_support_format_xar(arg1)
 archive_read_support_format_xar = __libarchive.archive_read_support_format_xar
 
-def archive_read_support_format_zip(*args):
-  return __libarchive.archive_read_support_format_zip(*args)
+def archive_read_support_format_zip(arg1):
+    return __libarchive.archive_read_support_format_zip(arg1)
 archive_read_support_format_zip = __libarchive.archive_read_support_format_zip
 
 def archive_write_new():
-  return __libarchive.archive_write_new()
+    return __libarchive.archive_write_new()
 archive_write_new = __libarchive.archive_write_new
 
-def archive_write_free(*args):
-  return __libarchive.archive_write_free(*args)
+def archive_write_free(arg1):
+    return __libarchive.archive_write_free(arg1)
 archive_write_free = __libarchive.archive_write_free
 
-def archive_write_open(*args):
-  return __libarchive.archive_write_open(*args)
+def archive_write_open(arg1, arg2, arg3, arg4, arg5):
+    return __libarchive.archive_write_open(arg1, arg2, arg3, arg4, arg5)
 archive_write_open = __libarchive.archive_write_open
 
-def archive_write_open_fd(*args):
-  return __libarchive.archive_write_open_fd(*args)
+def archive_write_open_fd(arg1, _fd):
+    return __libarchive.archive_write_open_fd(arg1, _fd)
 archive_write_open_fd = __libarchive.archive_write_open_fd
 
-def archive_write_open_filename(*args):
-  return __libarchive.archive_write_open_filename(*args)
+def archive_write_open_filename(arg1, _file):
+    return __libarchive.archive_write_open_filename(arg1, _file)
 archive_write_open_filename = __libarchive.archive_write_open_filename
 
-def archive_write_open_filename_w(*args):
-  return __libarchive.archive_write_open_filename_w(*args)
+def archive_write_open_filename_w(arg1, _file):
+    return __libarchive.archive_write_open_filename_w(arg1, _file)
 archive_write_open_filename_w = __libarchive.archive_write_open_filename_w
 
-def archive_write_open_memory(*args):
-  return __libarchive.archive_write_open_memory(*args)
+def archive_write_open_memory(arg1, _buffer, _buffSize, _used):
+    return __libarchive.archive_write_open_memory(arg1, _buffer, _buffSize, _used)
 archive_write_open_memory = __libarchive.archive_write_open_memory
 
-def archive_write_close(*args):
-  return __libarchive.archive_write_close(*args)
+def archive_write_close(arg1):
+    return __libarchive.archive_write_close(arg1)
 archive_write_close = __libarchive.archive_write_close
 
-def archive_write_header(*args):
-  return __libarchive.archive_write_header(*args)
+def archive_write_disk_new():
+    return __libarchive.archive_write_disk_new()
+archive_write_disk_new = __libarchive.archive_write_disk_new
+
+def archive_write_disk_set_options(arg1, flags):
+    return __libarchive.archive_write_disk_set_options(arg1, flags)
+archive_write_disk_set_options = __libarchive.archive_write_disk_set_options
+
+def archive_write_disk_set_standard_lookup(arg1):
+    return __libarchive.archive_write_disk_set_standard_lookup(arg1)
+archive_write_disk_set_standard_lookup = __libarchive.archive_write_disk_set_standard_lookup
+
+def archive_read_extract2(arg1, arg2, arg3):
+    return __libarchive.archive_read_extract2(arg1, arg2, arg3)
+archive_read_extract2 = __libarchive.archive_read_extract2
+
+def archive_write_header(arg1, arg2):
+    return __libarchive.archive_write_header(arg1, arg2)
 archive_write_header = __libarchive.archive_write_header
 
-def archive_write_finish_entry(*args):
-  return __libarchive.archive_write_finish_entry(*args)
+def archive_write_finish_entry(arg1):
+    return __libarchive.archive_write_finish_entry(arg1)
 archive_write_finish_entry = __libarchive.archive_write_finish_entry
 
-def archive_write_add_filter_bzip2(*args):
-  return __libarchive.archive_write_add_filter_bzip2(*args)
+def archive_write_add_filter(arg1, filter_code):
+    return __libarchive.archive_write_add_filter(arg1, filter_code)
+archive_write_add_filter = __libarchive.archive_write_add_filter
+
+def archive_write_add_filter_bzip2(arg1):
+    return __libarchive.archive_write_add_filter_bzip2(arg1)
 archive_write_add_filter_bzip2 = __libarchive.archive_write_add_filter_bzip2
 
-def archive_write_add_filter_compress(*args):
-  return __libarchive.archive_write_add_filter_compress(*args)
+def archive_write_add_filter_compress(arg1):
+    return __libarchive.archive_write_add_filter_compress(arg1)
 archive_write_add_filter_compress = __libarchive.archive_write_add_filter_compress
 
-def archive_write_add_filter_gzip(*args):
-  return __libarchive.archive_write_add_filter_gzip(*args)
+def archive_write_add_filter_gzip(arg1):
+    return __libarchive.archive_write_add_filter_gzip(arg1)
 archive_write_add_filter_gzip = __libarchive.archive_write_add_filter_gzip
 
-def archive_write_add_filter_lzip(*args):
-  return __libarchive.archive_write_add_filter_lzip(*args)
+def archive_write_add_filter_lzip(arg1):
+    return __libarchive.archive_write_add_filter_lzip(arg1)
 archive_write_add_filter_lzip = __libarchive.archive_write_add_filter_lzip
 
-def archive_write_add_filter_lzma(*args):
-  return __libarchive.archive_write_add_filter_lzma(*args)
+def archive_write_add_filter_lzma(arg1):
+    return __libarchive.archive_write_add_filter_lzma(arg1)
 archive_write_add_filter_lzma = __libarchive.archive_write_add_filter_lzma
 
-def archive_write_add_filter_none(*args):
-  return __libarchive.archive_write_add_filter_none(*args)
+def archive_write_add_filter_none(arg1):
+    return __libarchive.archive_write_add_filter_none(arg1)
 archive_write_add_filter_none = __libarchive.archive_write_add_filter_none
 
-def archive_write_add_filter_xz(*args):
-  return __libarchive.archive_write_add_filter_xz(*args)
+def archive_write_add_filter_xz(arg1):
+    return __libarchive.archive_write_add_filter_xz(arg1)
 archive_write_add_filter_xz = __libarchive.archive_write_add_filter_xz
 
-def archive_write_set_format(*args):
-  return __libarchive.archive_write_set_format(*args)
+def archive_write_set_format_option(_a, m, o, v):
+    return __libarchive.archive_write_set_format_option(_a, m, o, v)
+archive_write_set_format_option = __libarchive.archive_write_set_format_option
+
+def archive_write_set_filter_option(_a, m, o, v):
+    return __libarchive.archive_write_set_filter_option(_a, m, o, v)
+archive_write_set_filter_option = __libarchive.archive_write_set_filter_option
+
+def archive_write_set_option(_a, m, o, v):
+    return __libarchive.archive_write_set_option(_a, m, o, v)
+archive_write_set_option = __libarchive.archive_write_set_option
+
+def archive_write_set_options(_a, opts):
+    return __libarchive.archive_write_set_options(_a, opts)
+archive_write_set_options = __libarchive.archive_write_set_options
+
+def archive_write_set_format(arg1, format_code):
+    return __libarchive.archive_write_set_format(arg1, format_code)
 archive_write_set_format = __libarchive.archive_write_set_format
 
-def archive_write_set_format_by_name(*args):
-  return __libarchive.archive_write_set_format_by_name(*args)
+def archive_write_set_format_by_name(arg1, name):
+    return __libarchive.archive_write_set_format_by_name(arg1, name)
 archive_write_set_format_by_name = __libarchive.archive_write_set_format_by_name
 
-def archive_write_set_format_ar_bsd(*args):
-  return __libarchive.archive_write_set_format_ar_bsd(*args)
+def archive_write_set_format_ar_bsd(arg1):
+    return __libarchive.archive_write_set_format_ar_bsd(arg1)
 archive_write_set_format_ar_bsd = __libarchive.archive_write_set_format_ar_bsd
 
-def archive_write_set_format_ar_svr4(*args):
-  return __libarchive.archive_write_set_format_ar_svr4(*args)
+def archive_write_set_format_ar_svr4(arg1):
+    return __libarchive.archive_write_set_format_ar_svr4(arg1)
 archive_write_set_format_ar_svr4 = __libarchive.archive_write_set_format_ar_svr4
 
-def archive_write_set_format_cpio(*args):
-  return __libarchive.archive_write_set_format_cpio(*args)
+def archive_write_set_format_cpio(arg1):
+    return __libarchive.archive_write_set_format_cpio(arg1)
 archive_write_set_format_cpio = __libarchive.archive_write_set_format_cpio
 
-def archive_write_set_format_cpio_newc(*args):
-  return __libarchive.archive_write_set_format_cpio_newc(*args)
+def archive_write_set_format_cpio_newc(arg1):
+    return __libarchive.archive_write_set_format_cpio_newc(arg1)
 archive_write_set_format_cpio_newc = __libarchive.archive_write_set_format_cpio_newc
 
-def archive_write_set_format_gnutar(*args):
-  return __libarchive.archive_write_set_format_gnutar(*args)
+def archive_write_set_format_gnutar(arg1):
+    return __libarchive.archive_write_set_format_gnutar(arg1)
 archive_write_set_format_gnutar = __libarchive.archive_write_set_format_gnutar
 
-def archive_write_set_format_iso9660(*args):
-  return __libarchive.archive_write_set_format_iso9660(*args)
+def archive_write_set_format_iso9660(arg1):
+    return __libarchive.archive_write_set_format_iso9660(arg1)
 archive_write_set_format_iso9660 = __libarchive.archive_write_set_format_iso9660
 
-def archive_write_set_format_pax(*args):
-  return __libarchive.archive_write_set_format_pax(*args)
+def archive_write_set_format_pax(arg1):
+    return __libarchive.archive_write_set_format_pax(arg1)
 archive_write_set_format_pax = __libarchive.archive_write_set_format_pax
 
-def archive_write_set_format_pax_restricted(*args):
-  return __libarchive.archive_write_set_format_pax_restricted(*args)
+def archive_write_set_format_pax_restricted(arg1):
+    return __libarchive.archive_write_set_format_pax_restricted(arg1)
 archive_write_set_format_pax_restricted = __libarchive.archive_write_set_format_pax_restricted
 
-def archive_write_set_format_shar(*args):
-  return __libarchive.archive_write_set_format_shar(*args)
+def archive_write_set_format_shar(arg1):
+    return __libarchive.archive_write_set_format_shar(arg1)
 archive_write_set_format_shar = __libarchive.archive_write_set_format_shar
 
-def archive_write_set_format_shar_dump(*args):
-  return __libarchive.archive_write_set_format_shar_dump(*args)
+def archive_write_set_format_shar_dump(arg1):
+    return __libarchive.archive_write_set_format_shar_dump(arg1)
 archive_write_set_format_shar_dump = __libarchive.archive_write_set_format_shar_dump
 
-def archive_write_set_format_ustar(*args):
-  return __libarchive.archive_write_set_format_ustar(*args)
+def archive_write_set_format_ustar(arg1):
+    return __libarchive.archive_write_set_format_ustar(arg1)
 archive_write_set_format_ustar = __libarchive.archive_write_set_format_ustar
 
-def archive_write_set_format_xar(*args):
-  return __libarchive.archive_write_set_format_xar(*args)
+def archive_write_set_format_xar(arg1):
+    return __libarchive.archive_write_set_format_xar(arg1)
 archive_write_set_format_xar = __libarchive.archive_write_set_format_xar
 
-def archive_write_set_format_zip(*args):
-  return __libarchive.archive_write_set_format_zip(*args)
+def archive_write_set_format_zip(arg1):
+    return __libarchive.archive_write_set_format_zip(arg1)
 archive_write_set_format_zip = __libarchive.archive_write_set_format_zip
 
 def archive_entry_new():
-  return __libarchive.archive_entry_new()
+    return __libarchive.archive_entry_new()
 archive_entry_new = __libarchive.archive_entry_new
 
-def archive_entry_free(*args):
-  return __libarchive.archive_entry_free(*args)
+def archive_entry_free(arg1):
+    return __libarchive.archive_entry_free(arg1)
 archive_entry_free = __libarchive.archive_entry_free
 
-def archive_entry_pathname(*args):
-  return __libarchive.archive_entry_pathname(*args)
+def archive_entry_pathname(arg1):
+    return __libarchive.archive_entry_pathname(arg1)
 archive_entry_pathname = __libarchive.archive_entry_pathname
 
-def archive_entry_pathname_w(*args):
-  return __libarchive.archive_entry_pathname_w(*args)
+def archive_entry_pathname_w(arg1):
+    return __libarchive.archive_entry_pathname_w(arg1)
 archive_entry_pathname_w = __libarchive.archive_entry_pathname_w
 
-def archive_entry_size(*args):
-  return __libarchive.archive_entry_size(*args)
+def archive_entry_size(arg1):
+    return __libarchive.archive_entry_size(arg1)
 archive_entry_size = __libarchive.archive_entry_size
 
-def archive_entry_mtime(*args):
-  return __libarchive.archive_entry_mtime(*args)
+def archive_entry_mtime(arg1):
+    return __libarchive.archive_entry_mtime(arg1)
 archive_entry_mtime = __libarchive.archive_entry_mtime
 
-def archive_entry_filetype(*args):
-  return __libarchive.archive_entry_filetype(*args)
+def archive_entry_filetype(arg1):
+    return __libarchive.archive_entry_filetype(arg1)
 archive_entry_filetype = __libarchive.archive_entry_filetype
 
-def archive_entry_perm(*args):
-  return __libarchive.archive_entry_perm(*args)
+def archive_entry_perm(arg1):
+    return __libarchive.archive_entry_perm(arg1)
 archive_entry_perm = __libarchive.archive_entry_perm
 
-def archive_entry_set_pathname(*args):
-  return __libarchive.archive_entry_set_pathname(*args)
+def archive_entry_sparse_count(arg1):
+    return __libarchive.archive_entry_sparse_count(arg1)
+archive_entry_sparse_count = __libarchive.archive_entry_sparse_count
+
+def archive_entry_set_pathname(arg1, arg2):
+    return __libarchive.archive_entry_set_pathname(arg1, arg2)
 archive_entry_set_pathname = __libarchive.archive_entry_set_pathname
 
-def archive_entry_set_size(*args):
-  return __libarchive.archive_entry_set_size(*args)
+def archive_entry_set_size(arg1, arg2):
+    return __libarchive.archive_entry_set_size(arg1, arg2)
 archive_entry_set_size = __libarchive.archive_entry_set_size
 
-def archive_entry_set_mtime(*args):
-  return __libarchive.archive_entry_set_mtime(*args)
+def archive_entry_set_mtime(arg1, arg2, arg3):
+    return __libarchive.archive_entry_set_mtime(arg1, arg2, arg3)
 archive_entry_set_mtime = __libarchive.archive_entry_set_mtime
 
-def archive_entry_set_filetype(*args):
-  return __libarchive.archive_entry_set_filetype(*args)
+def archive_entry_set_filetype(arg1, arg2):
+    return __libarchive.archive_entry_set_filetype(arg1, arg2)
 archive_entry_set_filetype = __libarchive.archive_entry_set_filetype
 
-def archive_entry_set_perm(*args):
-  return __libarchive.archive_entry_set_perm(*args)
+def archive_entry_set_perm(arg1, arg2):
+    return __libarchive.archive_entry_set_perm(arg1, arg2)
 archive_entry_set_perm = __libarchive.archive_entry_set_perm
 
-def archive_errno(*args):
-  return __libarchive.archive_errno(*args)
+def archive_filter_bytes(arg1, arg2):
+    return __libarchive.archive_filter_bytes(arg1, arg2)
+archive_filter_bytes = __libarchive.archive_filter_bytes
+
+def archive_filter_code(arg1, arg2):
+    return __libarchive.archive_filter_code(arg1, arg2)
+archive_filter_code = __libarchive.archive_filter_code
+
+def archive_filter_count(arg1):
+    return __libarchive.archive_filter_count(arg1)
+archive_filter_count = __libarchive.archive_filter_count
+
+def archive_errno(arg1):
+    return __libarchive.archive_errno(arg1)
 archive_errno = __libarchive.archive_errno
 
-def archive_error_string(*args):
-  return __libarchive.archive_error_string(*args)
+def archive_error_string(arg1):
+    return __libarchive.archive_error_string(arg1)
 archive_error_string = __libarchive.archive_error_string
 ARCHIVE_VERSION_NUMBER = __libarchive.ARCHIVE_VERSION_NUMBER
 ARCHIVE_VERSION_STRING = __libarchive.ARCHIVE_VERSION_STRING
@@ -421,6 +517,11 @@ ARCHIVE_FILTER_XZ = __libarchive.ARCHIVE_FILTER_XZ
 ARCHIVE_FILTER_UU = __libarchive.ARCHIVE_FILTER_UU
 ARCHIVE_FILTER_RPM = __libarchive.ARCHIVE_FILTER_RPM
 ARCHIVE_FILTER_LZIP = __libarchive.ARCHIVE_FILTER_LZIP
+ARCHIVE_FILTER_LRZIP = __libarchive.ARCHIVE_FILTER_LRZIP
+ARCHIVE_FILTER_LZOP = __libarchive.ARCHIVE_FILTER_LZOP
+ARCHIVE_FILTER_GRZIP = __libarchive.ARCHIVE_FILTER_GRZIP
+ARCHIVE_FILTER_LZ4 = __libarchive.ARCHIVE_FILTER_LZ4
+ARCHIVE_FILTER_ZSTD = __libarchive.ARCHIVE_FILTER_ZSTD
 ARCHIVE_FORMAT_BASE_MASK = __libarchive.ARCHIVE_FORMAT_BASE_MASK
 ARCHIVE_FORMAT_CPIO = __libarchive.ARCHIVE_FORMAT_CPIO
 ARCHIVE_FORMAT_CPIO_POSIX = __libarchive.ARCHIVE_FORMAT_CPIO_POSIX
@@ -465,14 +566,79 @@ ARCHIVE_EXTRACT_NO_AUTODIR = __libarchive.ARCHIVE_EXTRACT_NO_AUTODIR
 ARCHIVE_EXTRACT_NO_OVERWRITE_NEWER = __libarchive.ARCHIVE_EXTRACT_NO_OVERWRITE_NEWER
 ARCHIVE_EXTRACT_SPARSE = __libarchive.ARCHIVE_EXTRACT_SPARSE
 ARCHIVE_EXTRACT_MAC_METADATA = __libarchive.ARCHIVE_EXTRACT_MAC_METADATA
+ARCHIVE_EXTRACT_SECURE_NOABSOLUTEPATHS = __libarchive.ARCHIVE_EXTRACT_SECURE_NOABSOLUTEPATHS
 
-def archive_read_data_into_str(*args):
-  return __libarchive.archive_read_data_into_str(*args)
+def archive_read_data_into_str(archive, len):
+    return __libarchive.archive_read_data_into_str(archive, len)
 archive_read_data_into_str = __libarchive.archive_read_data_into_str
 
-def archive_write_data_from_str(*args):
-  return __libarchive.archive_write_data_from_str(*args)
+def archive_read_data_into_buffer(archive, buffer, size):
+    return __libarchive.archive_read_data_into_buffer(archive, buffer, size)
+archive_read_data_into_buffer = __libarchive.archive_read_data_into_buffer
+
+def archive_read_data_block_into_view(archive):
+    return __libarchive.archive_read_data_block_into_view(archive)
+archive_read_data_block_into_view = __libarchive.archive_read_data_block_into_view
+
+def archive_read_next_header_fields(archive, entry):
+    return __libarchive.archive_read_next_header_fields(archive, entry)
+archive_read_next_header_fields = __libarchive.archive_read_next_header_fields
+
+def archive_write_data_from_str(archive, str):
+    return __libarchive.archive_write_data_from_str(archive, str)
 archive_write_data_from_str = __libarchive.archive_write_data_from_str
+
+def archive_read_extract_all(archive, path, flags):
+    return __libarchive.archive_read_extract_all(archive, path, flags)
+archive_read_extract_all = __libarchive.archive_read_extract_all
+
+def archive_write_data_from_fd(archive, fd, length, blocksize):
+    return __libarchive.archive_write_data_from_fd(archive, fd, length, blocksize)
+archive_write_data_from_fd = __libarchive.archive_write_data_from_fd
+
+def archive_read_open_pyobject(archive, file, blocksize, seekable):
+    return __libarchive.archive_read_open_pyobject(archive, file, blocksize, seekable)
+archive_read_open_pyobject = __libarchive.archive_read_open_pyobject
+
+def archive_write_open_pyobject(archive, file, blocksize):
+    return __libarchive.archive_write_open_pyobject(archive, file, blocksize)
+archive_write_open_pyobject = __libarchive.archive_write_open_pyobject
+
+def archive_read_open_pybuffer(archive, obj, offset):
+    return __libarchive.archive_read_open_pybuffer(archive, obj, offset)
+archive_read_open_pybuffer = __libarchive.archive_read_open_pybuffer
+
+def membuf_new():
+    return __libarchive.membuf_new()
+membuf_new = __libarchive.membuf_new
+
+def membuf_free(buf):
+    return __libarchive.membuf_free(buf)
+membuf_free = __libarchive.membuf_free
+
+def membuf_to_str(buf):
+    return __libarchive.membuf_to_str(buf)
+membuf_to_str = __libarchive.membuf_to_str
+
+def archive_write_open_membuf(archive, buf):
+    return __libarchive.archive_write_open_membuf(archive, buf)
+archive_write_open_membuf = __libarchive.archive_write_open_membuf
+POSIX_FADV_SEQUENTIAL = __libarchive.POSIX_FADV_SEQUENTIAL
+POSIX_FADV_WILLNEED = __libarchive.POSIX_FADV_WILLNEED
+
+def fadvise(fd, offset, length, advice):
+    return __libarchive.fadvise(fd, offset, length, advice)
+fadvise = __libarchive.fadvise
+MADV_SEQUENTIAL = __libarchive.MADV_SEQUENTIAL
+MADV_WILLNEED = __libarchive.MADV_WILLNEED
+
+def madvise_buffer(obj, offset, length, advice):
+    return __libarchive.madvise_buffer(obj, offset, length, advice)
+madvise_buffer = __libarchive.madvise_buffer
+
+def copy_fd_range(in_fd, offset, out_fd, length):
+    return __libarchive.copy_fd_range(in_fd, offset, out_fd, length)
+copy_fd_range = __libarchive.copy_fd_range
 # This file is compatible with both classic and new-style classes.
 
 
@@ -1,14 +1,18 @@
 /* ----------------------------------------------------------------------------
  * This file was automatically generated by SWIG (http://www.swig.org).
- * Version 2.0.4
- * 
- * This file is not intended to be easily readable and contains a number of 
+ * Version 3.0.12
+ *
+ * This file is not intended to be easily readable and contains a number of
  * coding conventions designed to improve portability and efficiency. Do not make
- * changes to this file unless you know what you are doing--modify the SWIG 
- * interface file instead. 
+ * changes to this file unless you know what you are doing--modify the SWIG
+ * interface file instead.
  * ----------------------------------------------------------------------------- */
 
+
+#ifndef SWIGPYTHON
 #define SWIGPYTHON
+#endif
+
 #define SWIG_PYTHON_DIRECTOR_NO_VTABLE
 
 /* -----------------------------------------------------------------------------
@@ -42,28 +46,28 @@
 #ifndef SWIGUNUSED
 # if defined(__GNUC__)
 #   if !(defined(__cplusplus)) || (__GNUC__ > 3 || (__GNUC__ == 3 && __GNUC_MINOR__ >= 4))
-#     define SWIGUNUSED __attribute__ ((__unused__)) 
+#     define SWIGUNUSED __attribute__ ((__unused__))
 #   else
 #     define SWIGUNUSED
 #   endif
 # elif defined(__ICC)
-#   define SWIGUNUSED __attribute__ ((__unused__)) 
+#   define SWIGUNUSED __attribute__ ((__unused__))
 # else
-#   define SWIGUNUSED 
+#   define SWIGUNUSED
 # endif
 #endif
 
 #ifndef SWIG_MSC_UNSUPPRESS_4505
 # if defined(_MSC_VER)
 #   pragma warning(disable : 4505) /* unreferenced local function has been removed */
-# endif 
+# endif
 #endif
 
 #ifndef SWIGUNUSEDPARM
 # ifdef __cplusplus
 #   define SWIGUNUSEDPARM(p)
 # else
-#   define SWIGUNUSEDPARM(p) p SWIGUNUSED 
+#   define SWIGUNUSEDPARM(p) p SWIGUNUSED
 # endif
 #endif
 
@@ -78,9 +82,11 @@
 #endif
 
 /* exporting methods */
-#if (__GNUC__ >= 4) || (__GNUC__ == 3 && __GNUC_MINOR__ >= 4)
-#  ifndef GCC_HASCLASSVISIBILITY
-#    define GCC_HASCLASSVISIBILITY
+#if defined(__GNUC__)
+#  if (__GNUC__ >= 4) || (__GNUC__ == 3 && __GNUC_MINOR__ >= 4)
+#    ifndef GCC_HASCLASSVISIBILITY
+#      define GCC_HASCLASSVISIBILITY
+#    endif
 #  endif
 #endif
 
@@ -106,7 +112,7 @@
 #   define SWIGSTDCALL __stdcall
 # else
 #   define SWIGSTDCALL
-# endif 
+# endif
 #endif
 
 /* Deal with Microsoft's attempt at deprecating C standard runtime functions */
@@ -119,10 +125,29 @@
 # define _SCL_SECURE_NO_DEPRECATE
 #endif
 
+/* Deal with Apple's deprecated 'AssertMacros.h' from Carbon-framework */
+#if defined(__APPLE__) && !defined(__ASSERT_MACROS_DEFINE_VERSIONS_WITHOUT_UNDERSCORES)
+# define __ASSERT_MACROS_DEFINE_VERSIONS_WITHOUT_UNDERSCORES 0
+#endif
+
+/* Intel's compiler complains if a variable which was never initialised is
+ * cast to void, which is a common idiom which we use to indicate that we
+ * are aware a variable isn't used.  So we just silence that warning.
+ * See: https://github.com/swig/swig/issues/192 for more discussion.
+ */
+#ifdef __INTEL_COMPILER
+# pragma warning disable 592
+#endif
 
 
-/* Python.h has to appear first */
-#include <Python.h>
+#if defined(_DEBUG) && defined(SWIG_PYTHON_INTERPRETER_NO_DEBUG)
+/* Use debug wrappers with the Python release dll */
+# undef _DEBUG
+# include <Python.h>
+# define _DEBUG
+#else
+# include <Python.h>
+#endif
 
 /* -----------------------------------------------------------------------------
  * swigrun.swg
@@ -148,7 +173,7 @@
   You can use the SWIGRUNTIME and SWIGRUNTIMEINLINE macros for
   creating a static or dynamic library from the SWIG runtime code.
   In 99.9% of the cases, SWIG just needs to declare them as 'static'.
-  
+
   But only do this if strictly necessary, ie, if you have problems
   with your compiler or suchlike.
 */
@@ -174,16 +199,16 @@
 #define SWIG_POINTER_OWN           0x1
 
 
-/* 
+/*
    Flags/methods for returning states.
-   
-   The SWIG conversion methods, as ConvertPtr, return an integer 
+
+   The SWIG conversion methods, as ConvertPtr, return an integer
    that tells if the conversion was successful or not. And if not,
    an error code can be returned (see swigerrors.swg for the codes).
-   
+
    Use the following macros/flags to set or process the returning
    states.
-   
+
    In old versions of SWIG, code such as the following was usually written:
 
      if (SWIG_ConvertPtr(obj,vptr,ty.flags) != -1) {
@@ -216,23 +241,23 @@
     } else {
       // fail code
     }
-    
+
    I.e., now SWIG_ConvertPtr can return new objects and you can
    identify the case and take care of the deallocation. Of course that
    also requires SWIG_ConvertPtr to return new result values, such as
 
-      int SWIG_ConvertPtr(obj, ptr,...) {         
-        if (<obj is ok>) {			       
-          if (<need new object>) {		       
-            *ptr = <ptr to new allocated object>; 
-            return SWIG_NEWOBJ;		       
-          } else {				       
-            *ptr = <ptr to old object>;	       
-            return SWIG_OLDOBJ;		       
-          } 				       
-        } else {				       
-          return SWIG_BADOBJ;		       
-        }					       
+      int SWIG_ConvertPtr(obj, ptr,...) {
+        if (<obj is ok>) {
+          if (<need new object>) {
+            *ptr = <ptr to new allocated object>;
+            return SWIG_NEWOBJ;
+          } else {
+            *ptr = <ptr to old object>;
+            return SWIG_OLDOBJ;
+          }
+        } else {
+          return SWIG_BADOBJ;
+        }
       }
 
    Of course, returning the plain '0(success)/-1(fail)' still works, but you can be
@@ -246,17 +271,17 @@
        int fooi(int);
 
    and you call
- 
+
       food(1)   // cast rank '1'  (1 -> 1.0)
       fooi(1)   // cast rank '0'
 
    just use the SWIG_AddCast()/SWIG_CheckState()
 */
 
-#define SWIG_OK                    (0) 
+#define SWIG_OK                    (0)
 #define SWIG_ERROR                 (-1)
 #define SWIG_IsOK(r)               (r >= 0)
-#define SWIG_ArgError(r)           ((r != SWIG_ERROR) ? r : SWIG_TypeError)  
+#define SWIG_ArgError(r)           ((r != SWIG_ERROR) ? r : SWIG_TypeError)
 
 /* The CastRankLimit says how many bits are used for the cast rank */
 #define SWIG_CASTRANKLIMIT         (1 << 8)
@@ -287,14 +312,14 @@
 #  endif
 #  define SWIG_CASTRANKMASK          ((SWIG_CASTRANKLIMIT) -1)
 #  define SWIG_CastRank(r)           (r & SWIG_CASTRANKMASK)
-SWIGINTERNINLINE int SWIG_AddCast(int r) { 
+SWIGINTERNINLINE int SWIG_AddCast(int r) {
   return SWIG_IsOK(r) ? ((SWIG_CastRank(r) < SWIG_MAXCASTRANK) ? (r + 1) : SWIG_ERROR) : r;
 }
-SWIGINTERNINLINE int SWIG_CheckState(int r) { 
-  return SWIG_IsOK(r) ? SWIG_CastRank(r) + 1 : 0; 
+SWIGINTERNINLINE int SWIG_CheckState(int r) {
+  return SWIG_IsOK(r) ? SWIG_CastRank(r) + 1 : 0;
 }
 #else /* no cast-rank mode */
-#  define SWIG_AddCast
+#  define SWIG_AddCast(r) (r)
 #  define SWIG_CheckState(r) (SWIG_IsOK(r) ? 1 : 0)
 #endif
 
@@ -338,7 +363,7 @@ typedef struct swig_module_info {
   void                    *clientdata;		/* Language specific module data */
 } swig_module_info;
 
-/* 
+/*
   Compare two type names skipping the space characters, therefore
   "char*" == "char *" and "Class<int>" == "Class<int >", etc.
 
@@ -358,18 +383,18 @@ SWIG_TypeNameComp(const char *f1, const char *l1,
 
 /*
   Check type equivalence in a name list like <name1>|<name2>|...
-  Return 0 if not equal, 1 if equal
+  Return 0 if equal, -1 if nb < tb, 1 if nb > tb
 */
 SWIGRUNTIME int
-SWIG_TypeEquiv(const char *nb, const char *tb) {
-  int equiv = 0;
+SWIG_TypeCmp(const char *nb, const char *tb) {
+  int equiv = 1;
   const char* te = tb + strlen(tb);
   const char* ne = nb;
-  while (!equiv && *ne) {
+  while (equiv != 0 && *ne) {
     for (nb = ne; *ne; ++ne) {
       if (*ne == '|') break;
     }
-    equiv = (SWIG_TypeNameComp(nb, ne, tb, te) == 0) ? 1 : 0;
+    equiv = SWIG_TypeNameComp(nb, ne, tb, te);
     if (*ne) ++ne;
   }
   return equiv;
@@ -377,24 +402,13 @@ SWIG_TypeEquiv(const char *nb, const char *tb) {
 
 /*
   Check type equivalence in a name list like <name1>|<name2>|...
-  Return 0 if equal, -1 if nb < tb, 1 if nb > tb
+  Return 0 if not equal, 1 if equal
 */
 SWIGRUNTIME int
-SWIG_TypeCompare(const char *nb, const char *tb) {
-  int equiv = 0;
-  const char* te = tb + strlen(tb);
-  const char* ne = nb;
-  while (!equiv && *ne) {
-    for (nb = ne; *ne; ++ne) {
-      if (*ne == '|') break;
-    }
-    equiv = (SWIG_TypeNameComp(nb, ne, tb, te) == 0) ? 1 : 0;
-    if (*ne) ++ne;
-  }
-  return equiv;
+SWIG_TypeEquiv(const char *nb, const char *tb) {
+  return SWIG_TypeCmp(nb, tb) == 0 ? 1 : 0;
 }
 
-
 /*
   Check the typename
 */
@@ -422,7 +436,7 @@ SWIG_TypeCheck(const char *c, swig_type_info *ty) {
   return 0;
 }
 
-/* 
+/*
   Identical to SWIG_TypeCheck, except strcmp is replaced with a pointer comparison
 */
 SWIGRUNTIME swig_cast_info *
@@ -457,7 +471,7 @@ SWIG_TypeCast(swig_cast_info *ty, void *ptr, int *newmemory) {
   return ((!ty) || (!ty->converter)) ? ptr : (*ty->converter)(ptr, newmemory);
 }
 
-/* 
+/*
    Dynamic pointer casting. Down an inheritance hierarchy
 */
 SWIGRUNTIME swig_type_info *
@@ -501,7 +515,7 @@ SWIG_TypePrettyName(const swig_type_info *type) {
     return type->name;
 }
 
-/* 
+/*
    Set the clientdata field for a type
 */
 SWIGRUNTIME void
@@ -509,14 +523,14 @@ SWIG_TypeClientData(swig_type_info *ti, void *clientdata) {
   swig_cast_info *cast = ti->cast;
   /* if (ti->clientdata == clientdata) return; */
   ti->clientdata = clientdata;
-  
+
   while (cast) {
     if (!cast->converter) {
       swig_type_info *tc = cast->type;
       if (!tc->clientdata) {
 	SWIG_TypeClientData(tc, clientdata);
       }
-    }    
+    }
     cast = cast->next;
   }
 }
@@ -525,31 +539,31 @@ SWIG_TypeNewClientData(swig_type_info *ti, void *clientdata) {
   SWIG_TypeClientData(ti, clientdata);
   ti->owndata = 1;
 }
-  
+
 /*
   Search for a swig_type_info structure only by mangled name
   Search is a O(log #types)
-  
-  We start searching at module start, and finish searching when start == end.  
+
+  We start searching at module start, and finish searching when start == end.
   Note: if start == end at the beginning of the function, we go all the way around
   the circular list.
 */
 SWIGRUNTIME swig_type_info *
-SWIG_MangledTypeQueryModule(swig_module_info *start, 
-                            swig_module_info *end, 
+SWIG_MangledTypeQueryModule(swig_module_info *start,
+                            swig_module_info *end,
 		            const char *name) {
   swig_module_info *iter = start;
   do {
     if (iter->size) {
-      register size_t l = 0;
-      register size_t r = iter->size - 1;
+      size_t l = 0;
+      size_t r = iter->size - 1;
       do {
 	/* since l+r >= 0, we can (>> 1) instead (/ 2) */
-	register size_t i = (l + r) >> 1; 
+	size_t i = (l + r) >> 1;
 	const char *iname = iter->types[i]->name;
 	if (iname) {
-	  register int compare = strcmp(name, iname);
-	  if (compare == 0) {	    
+	  int compare = strcmp(name, iname);
+	  if (compare == 0) {
 	    return iter->types[i];
 	  } else if (compare < 0) {
 	    if (i) {
@@ -574,14 +588,14 @@ SWIG_MangledTypeQueryModule(swig_module_info *start,
   Search for a swig_type_info structure for either a mangled name or a human readable name.
   It first searches the mangled names of the types, which is a O(log #types)
   If a type is not found it then searches the human readable names, which is O(#types).
-  
-  We start searching at module start, and finish searching when start == end.  
+
+  We start searching at module start, and finish searching when start == end.
   Note: if start == end at the beginning of the function, we go all the way around
   the circular list.
 */
 SWIGRUNTIME swig_type_info *
-SWIG_TypeQueryModule(swig_module_info *start, 
-                     swig_module_info *end, 
+SWIG_TypeQueryModule(swig_module_info *start,
+                     swig_module_info *end,
 		     const char *name) {
   /* STEP 1: Search the name field using binary search */
   swig_type_info *ret = SWIG_MangledTypeQueryModule(start, end, name);
@@ -592,7 +606,7 @@ SWIG_TypeQueryModule(swig_module_info *start,
        of the str field (the human readable name) */
     swig_module_info *iter = start;
     do {
-      register size_t i = 0;
+      size_t i = 0;
       for (; i < iter->size; ++i) {
 	if (iter->types[i]->str && (SWIG_TypeEquiv(iter->types[i]->str, name)))
 	  return iter->types[i];
@@ -600,56 +614,56 @@ SWIG_TypeQueryModule(swig_module_info *start,
       iter = iter->next;
     } while (iter != end);
   }
-  
+
   /* neither found a match */
   return 0;
 }
 
-/* 
+/*
    Pack binary data into a string
 */
 SWIGRUNTIME char *
 SWIG_PackData(char *c, void *ptr, size_t sz) {
   static const char hex[17] = "0123456789abcdef";
-  register const unsigned char *u = (unsigned char *) ptr;
-  register const unsigned char *eu =  u + sz;
+  const unsigned char *u = (unsigned char *) ptr;
+  const unsigned char *eu =  u + sz;
   for (; u != eu; ++u) {
-    register unsigned char uu = *u;
+    unsigned char uu = *u;
     *(c++) = hex[(uu & 0xf0) >> 4];
     *(c++) = hex[uu & 0xf];
   }
   return c;
 }
 
-/* 
+/*
    Unpack binary data from a string
 */
 SWIGRUNTIME const char *
 SWIG_UnpackData(const char *c, void *ptr, size_t sz) {
-  register unsigned char *u = (unsigned char *) ptr;
-  register const unsigned char *eu = u + sz;
+  unsigned char *u = (unsigned char *) ptr;
+  const unsigned char *eu = u + sz;
   for (; u != eu; ++u) {
-    register char d = *(c++);
-    register unsigned char uu;
+    char d = *(c++);
+    unsigned char uu;
     if ((d >= '0') && (d <= '9'))
-      uu = ((d - '0') << 4);
+      uu = (unsigned char)((d - '0') << 4);
     else if ((d >= 'a') && (d <= 'f'))
-      uu = ((d - ('a'-10)) << 4);
-    else 
+      uu = (unsigned char)((d - ('a'-10)) << 4);
+    else
       return (char *) 0;
     d = *(c++);
     if ((d >= '0') && (d <= '9'))
-      uu |= (d - '0');
+      uu |= (unsigned char)(d - '0');
     else if ((d >= 'a') && (d <= 'f'))
-      uu |= (d - ('a'-10));
-    else 
+      uu |= (unsigned char)(d - ('a'-10));
+    else
       return (char *) 0;
     *u = uu;
   }
   return c;
 }
 
-/* 
+/*
    Pack 'void *' into a string buffer.
 */
 SWIGRUNTIME char *
@@ -709,18 +723,18 @@ SWIG_UnpackDataName(const char *c, void *ptr, size_t sz, const char *name) {
 #endif
 
 /*  Errors in SWIG */
-#define  SWIG_UnknownError    	   -1 
-#define  SWIG_IOError        	   -2 
-#define  SWIG_RuntimeError   	   -3 
-#define  SWIG_IndexError     	   -4 
-#define  SWIG_TypeError      	   -5 
-#define  SWIG_DivisionByZero 	   -6 
-#define  SWIG_OverflowError  	   -7 
-#define  SWIG_SyntaxError    	   -8 
-#define  SWIG_ValueError     	   -9 
+#define  SWIG_UnknownError    	   -1
+#define  SWIG_IOError        	   -2
+#define  SWIG_RuntimeError   	   -3
+#define  SWIG_IndexError     	   -4
+#define  SWIG_TypeError      	   -5
+#define  SWIG_DivisionByZero 	   -6
+#define  SWIG_OverflowError  	   -7
+#define  SWIG_SyntaxError    	   -8
+#define  SWIG_ValueError     	   -9
 #define  SWIG_SystemError    	   -10
 #define  SWIG_AttributeError 	   -11
-#define  SWIG_MemoryError    	   -12 
+#define  SWIG_MemoryError    	   -12
 #define  SWIG_NullReferenceError   -13
 
 
@@ -732,6 +746,7 @@ SWIG_UnpackDataName(const char *c, void *ptr, size_t sz, const char *name) {
 #define PyInt_Check(x) PyLong_Check(x)
 #define PyInt_AsLong(x) PyLong_AsLong(x)
 #define PyInt_FromLong(x) PyLong_FromLong(x)
+#define PyInt_FromSize_t(x) PyLong_FromSize_t(x)
 #define PyString_Check(name) PyBytes_Check(name)
 #define PyString_FromString(x) PyUnicode_FromString(x)
 #define PyString_Format(fmt, args)  PyUnicode_Format(fmt, args)
@@ -823,10 +838,6 @@ PyString_FromFormat(const char *fmt, ...) {
 }
 #endif
 
-/* Add PyObject_Del for old Pythons */
-#if PY_VERSION_HEX < 0x01060000
-# define PyObject_Del(op) PyMem_DEL((op))
-#endif
 #ifndef PyObject_DEL
 # define PyObject_DEL PyObject_Del
 #endif
@@ -901,6 +912,10 @@ static long PyNumber_AsSsize_t (PyObject *x, void *SWIGUNUSEDPARM(exc))
 }
 #endif
 
+#if PY_VERSION_HEX < 0x02050000
+#define PyInt_FromSize_t(x) PyInt_FromLong((long)x)
+#endif
+
 #if PY_VERSION_HEX < 0x02040000
 #define Py_VISIT(op)				\
   do { 						\
@@ -937,6 +952,7 @@ typedef destructor freefunc;
 #if PY_VERSION_HEX < 0x03020000
 #define PyDescr_TYPE(x) (((PyDescrObject *)(x))->d_type)
 #define PyDescr_NAME(x) (((PyDescrObject *)(x))->d_name)
+#define Py_hash_t long
 #endif
 
 /* -----------------------------------------------------------------------------
@@ -1172,7 +1188,7 @@ SWIGRUNTIME PyObject* SWIG_PyInstanceMethod_New(PyObject *SWIGUNUSEDPARM(self),
 
 /* Runtime API */
 
-#define SWIG_GetModule(clientdata)                      SWIG_Python_GetModule()
+#define SWIG_GetModule(clientdata)                      SWIG_Python_GetModule(clientdata)
 #define SWIG_SetModule(clientdata, pointer)             SWIG_Python_SetModule(pointer)
 #define SWIG_NewClientData(obj)                         SwigPyClientData_New(obj)
 
@@ -1198,7 +1214,7 @@ SWIG_Python_SetErrorObj(PyObject *errtype, PyObject *obj) {
 SWIGINTERN void 
 SWIG_Python_SetErrorMsg(PyObject *errtype, const char *msg) {
   SWIG_PYTHON_THREAD_BEGIN_BLOCK;
-  PyErr_SetString(errtype, (char *) msg);
+  PyErr_SetString(errtype, msg);
   SWIG_PYTHON_THREAD_END_BLOCK;
 }
 
@@ -1217,7 +1233,11 @@ SwigPyBuiltin_AddPublicSymbol(PyObject *seq, const char *key) {
 
 SWIGINTERN void
 SWIG_Python_SetConstant(PyObject *d, PyObject *public_interface, const char *name, PyObject *obj) {   
+#if PY_VERSION_HEX < 0x02030000
   PyDict_SetItemString(d, (char *)name, obj);
+#else
+  PyDict_SetItemString(d, name, obj);
+#endif
   Py_DECREF(obj);
   if (public_interface)
     SwigPyBuiltin_AddPublicSymbol(public_interface, name);
@@ -1227,7 +1247,11 @@ SWIG_Python_SetConstant(PyObject *d, PyObject *public_interface, const char *nam
 
 SWIGINTERN void
 SWIG_Python_SetConstant(PyObject *d, const char *name, PyObject *obj) {   
+#if PY_VERSION_HEX < 0x02030000
   PyDict_SetItemString(d, (char *)name, obj);
+#else
+  PyDict_SetItemString(d, name, obj);
+#endif
   Py_DECREF(obj);                            
 }
 
@@ -1280,7 +1304,7 @@ SWIG_Python_AppendOutput(PyObject* result, PyObject* obj) {
 
 /* Unpack the argument tuple */
 
-SWIGINTERN int
+SWIGINTERN Py_ssize_t
 SWIG_Python_UnpackTuple(PyObject *args, const char *name, Py_ssize_t min, Py_ssize_t max, PyObject **objs)
 {
   if (!args) {
@@ -1294,7 +1318,7 @@ SWIG_Python_UnpackTuple(PyObject *args, const char *name, Py_ssize_t min, Py_ssi
   }  
   if (!PyTuple_Check(args)) {
     if (min <= 1 && max >= 1) {
-      register int i;
+      Py_ssize_t i;
       objs[0] = args;
       for (i = 1; i < max; ++i) {
 	objs[i] = 0;
@@ -1304,7 +1328,7 @@ SWIG_Python_UnpackTuple(PyObject *args, const char *name, Py_ssize_t min, Py_ssi
     PyErr_SetString(PyExc_SystemError, "UnpackTuple() argument list is not a tuple");
     return 0;
   } else {
-    register Py_ssize_t l = PyTuple_GET_SIZE(args);
+    Py_ssize_t l = PyTuple_GET_SIZE(args);
     if (l < min) {
       PyErr_Format(PyExc_TypeError, "%s expected %s%d arguments, got %d", 
 		   name, (min == max ? "" : "at least "), (int)min, (int)l);
@@ -1314,7 +1338,7 @@ SWIG_Python_UnpackTuple(PyObject *args, const char *name, Py_ssize_t min, Py_ssi
 		   name, (min == max ? "" : "at most "), (int)max, (int)l);
       return 0;
     } else {
-      register int i;
+      Py_ssize_t i;
       for (i = 0; i < l; ++i) {
 	objs[i] = PyTuple_GET_ITEM(args, i);
       }
@@ -1500,6 +1524,23 @@ typedef struct {
 #endif
 } SwigPyObject;
 
+
+#ifdef SWIGPYTHON_BUILTIN
+
+SWIGRUNTIME PyObject *
+SwigPyObject_get___dict__(PyObject *v, PyObject *SWIGUNUSEDPARM(args))
+{
+  SwigPyObject *sobj = (SwigPyObject *)v;
+
+  if (!sobj->dict)
+    sobj->dict = PyDict_New();
+
+  Py_INCREF(sobj->dict);
+  return sobj->dict;
+}
+
+#endif
+
 SWIGRUNTIME PyObject *
 SwigPyObject_long(SwigPyObject *v)
 {
@@ -1548,7 +1589,7 @@ SwigPyObject_repr(SwigPyObject *v, PyObject *args)
 #endif
 {
   const char *name = SWIG_TypePrettyName(v->ty);
-  PyObject *repr = SWIG_Python_str_FromFormat("<Swig Object of type '%s' at %p>", name, (void *)v);
+  PyObject *repr = SWIG_Python_str_FromFormat("<Swig Object of type '%s' at %p>", (name ? name : "unknown"), (void *)v);
   if (v->next) {
 # ifdef METH_NOARGS
     PyObject *nrep = SwigPyObject_repr((SwigPyObject *)v->next);
@@ -1567,34 +1608,6 @@ SwigPyObject_repr(SwigPyObject *v, PyObject *args)
   return repr;  
 }
 
-SWIGRUNTIME int
-SwigPyObject_print(SwigPyObject *v, FILE *fp, int SWIGUNUSEDPARM(flags))
-{
-  char *str;
-#ifdef METH_NOARGS
-  PyObject *repr = SwigPyObject_repr(v);
-#else
-  PyObject *repr = SwigPyObject_repr(v, NULL);
-#endif
-  if (repr) {
-    str = SWIG_Python_str_AsChar(repr); 
-    fputs(str, fp);
-    SWIG_Python_str_DelForPy3(str);
-    Py_DECREF(repr);
-    return 0; 
-  } else {
-    return 1; 
-  }
-}
-
-SWIGRUNTIME PyObject *
-SwigPyObject_str(SwigPyObject *v)
-{
-  char result[SWIG_BUFFER_SIZE];
-  return SWIG_PackVoidPtr(result, v->ptr, v->ty->name, sizeof(result)) ?
-    SWIG_Python_str_FromChar(result) : 0;
-}
-
 SWIGRUNTIME int
 SwigPyObject_compare(SwigPyObject *v, SwigPyObject *w)
 {
@@ -1666,16 +1679,32 @@ SwigPyObject_dealloc(PyObject *v)
     if (destroy) {
       /* destroy is always a VARARGS method */
       PyObject *res;
+
+      /* PyObject_CallFunction() has the potential to silently drop
+         the active active exception.  In cases of unnamed temporary
+         variable or where we just finished iterating over a generator
+         StopIteration will be active right now, and this needs to
+         remain true upon return from SwigPyObject_dealloc.  So save
+         and restore. */
+      
+      PyObject *val = NULL, *type = NULL, *tb = NULL;
+      PyErr_Fetch(&val, &type, &tb);
+
       if (data->delargs) {
-	/* we need to create a temporary object to carry the destroy operation */
-	PyObject *tmp = SwigPyObject_New(sobj->ptr, ty, 0);
-	res = SWIG_Python_CallFunctor(destroy, tmp);
-	Py_DECREF(tmp);
+        /* we need to create a temporary object to carry the destroy operation */
+        PyObject *tmp = SwigPyObject_New(sobj->ptr, ty, 0);
+        res = SWIG_Python_CallFunctor(destroy, tmp);
+        Py_DECREF(tmp);
       } else {
-	PyCFunction meth = PyCFunction_GET_FUNCTION(destroy);
-	PyObject *mself = PyCFunction_GET_SELF(destroy);
-	res = ((*meth)(mself, v));
+        PyCFunction meth = PyCFunction_GET_FUNCTION(destroy);
+        PyObject *mself = PyCFunction_GET_SELF(destroy);
+        res = ((*meth)(mself, v));
       }
+      if (!res)
+        PyErr_WriteUnraisable(destroy);
+
+      PyErr_Restore(val, type, tb);
+
       Py_XDECREF(res);
     } 
 #if !defined(SWIG_PYTHON_SILENT_MEMLEAK)
@@ -1699,6 +1728,7 @@ SwigPyObject_append(PyObject* v, PyObject* next)
   next = tmp;
 #endif
   if (!SwigPyObject_Check(next)) {
+    PyErr_SetString(PyExc_TypeError, "Attempt to append a non SwigPyObject");
     return NULL;
   }
   sobj->next = next;
@@ -1752,8 +1782,10 @@ SwigPyObject_own(PyObject *v, PyObject *args)
   PyObject *val = 0;
 #if (PY_VERSION_HEX < 0x02020000)
   if (!PyArg_ParseTuple(args,(char *)"|O:own",&val))
-#else
+#elif (PY_VERSION_HEX < 0x02050000)
   if (!PyArg_UnpackTuple(args, (char *)"own", 0, 1, &val)) 
+#else
+  if (!PyArg_UnpackTuple(args, "own", 0, 1, &val)) 
 #endif
     {
       return NULL;
@@ -1785,7 +1817,7 @@ SwigPyObject_own(PyObject *v, PyObject *args)
 static PyMethodDef
 swigobject_methods[] = {
   {(char *)"disown",  (PyCFunction)SwigPyObject_disown,  METH_NOARGS,  (char *)"releases ownership of the pointer"},
-  {(char *)"acquire", (PyCFunction)SwigPyObject_acquire, METH_NOARGS,  (char *)"aquires ownership of the pointer"},
+  {(char *)"acquire", (PyCFunction)SwigPyObject_acquire, METH_NOARGS,  (char *)"acquires ownership of the pointer"},
   {(char *)"own",     (PyCFunction)SwigPyObject_own,     METH_VARARGS, (char *)"returns/sets ownership of the pointer"},
   {(char *)"append",  (PyCFunction)SwigPyObject_append,  METH_O,       (char *)"appends another 'this' object"},
   {(char *)"next",    (PyCFunction)SwigPyObject_next,    METH_NOARGS,  (char *)"returns the next 'this' object"},
@@ -1796,7 +1828,7 @@ swigobject_methods[] = {
 static PyMethodDef
 swigobject_methods[] = {
   {(char *)"disown",  (PyCFunction)SwigPyObject_disown,  METH_VARARGS,  (char *)"releases ownership of the pointer"},
-  {(char *)"acquire", (PyCFunction)SwigPyObject_acquire, METH_VARARGS,  (char *)"aquires ownership of the pointer"},
+  {(char *)"acquire", (PyCFunction)SwigPyObject_acquire, METH_VARARGS,  (char *)"acquires ownership of the pointer"},
   {(char *)"own",     (PyCFunction)SwigPyObject_own,     METH_VARARGS,  (char *)"returns/sets ownership of the pointer"},
   {(char *)"append",  (PyCFunction)SwigPyObject_append,  METH_VARARGS,  (char *)"appends another 'this' object"},
   {(char *)"next",    (PyCFunction)SwigPyObject_next,    METH_VARARGS,  (char *)"returns the next 'this' object"},
@@ -1852,7 +1884,9 @@ SwigPyObject_TypeOnce(void) {
     (unaryfunc)SwigPyObject_oct,  /*nb_oct*/
     (unaryfunc)SwigPyObject_hex,  /*nb_hex*/
 #endif
-#if PY_VERSION_HEX >= 0x03000000 /* 3.0 */
+#if PY_VERSION_HEX >= 0x03050000 /* 3.5 */
+    0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0 /* nb_inplace_add -> nb_inplace_matrix_multiply */
+#elif PY_VERSION_HEX >= 0x03000000 /* 3.0 */
     0,0,0,0,0,0,0,0,0,0,0,0,0,0,0 /* nb_inplace_add -> nb_index, nb_inplace_divide removed */
 #elif PY_VERSION_HEX >= 0x02050000 /* 2.5.0 */
     0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0 /* nb_inplace_add -> nb_index */
@@ -1867,7 +1901,6 @@ SwigPyObject_TypeOnce(void) {
   static int type_init = 0;
   if (!type_init) {
     const PyTypeObject tmp = {
-      /* PyObject header changed in Python 3 */
 #if PY_VERSION_HEX >= 0x03000000
       PyVarObject_HEAD_INIT(NULL, 0)
 #else
@@ -1878,7 +1911,7 @@ SwigPyObject_TypeOnce(void) {
       sizeof(SwigPyObject),                 /* tp_basicsize */
       0,                                    /* tp_itemsize */
       (destructor)SwigPyObject_dealloc,     /* tp_dealloc */
-      (printfunc)SwigPyObject_print,        /* tp_print */
+      0,                                    /* tp_print */
 #if PY_VERSION_HEX < 0x02020000
       (getattrfunc)SwigPyObject_getattr,    /* tp_getattr */
 #else
@@ -1886,7 +1919,7 @@ SwigPyObject_TypeOnce(void) {
 #endif
       (setattrfunc)0,                       /* tp_setattr */
 #if PY_VERSION_HEX >= 0x03000000
-    0, /* tp_reserved in 3.0.1, tp_compare in 3.0.0 but not used */
+      0, /* tp_reserved in 3.0.1, tp_compare in 3.0.0 but not used */
 #else
       (cmpfunc)SwigPyObject_compare,        /* tp_compare */
 #endif
@@ -1896,7 +1929,7 @@ SwigPyObject_TypeOnce(void) {
       0,                                    /* tp_as_mapping */
       (hashfunc)0,                          /* tp_hash */
       (ternaryfunc)0,                       /* tp_call */
-      (reprfunc)SwigPyObject_str,           /* tp_str */
+      0,                                    /* tp_str */
       PyObject_GenericGetAttr,              /* tp_getattro */
       0,                                    /* tp_setattro */
       0,                                    /* tp_as_buffer */
@@ -1932,10 +1965,19 @@ SwigPyObject_TypeOnce(void) {
       0,                                    /* tp_del */
 #endif
 #if PY_VERSION_HEX >= 0x02060000
-      0,                                    /* tp_version */
+      0,                                    /* tp_version_tag */
+#endif
+#if PY_VERSION_HEX >= 0x03040000
+      0,                                    /* tp_finalize */
 #endif
 #ifdef COUNT_ALLOCS
-      0,0,0,0                               /* tp_alloc -> tp_next */
+      0,                                    /* tp_allocs */
+      0,                                    /* tp_frees */
+      0,                                    /* tp_maxalloc */
+#if PY_VERSION_HEX >= 0x02050000
+      0,                                    /* tp_prev */
+#endif
+      0                                     /* tp_next */
 #endif
     };
     swigpyobject_type = tmp;
@@ -2050,7 +2092,6 @@ SwigPyPacked_TypeOnce(void) {
   static int type_init = 0;
   if (!type_init) {
     const PyTypeObject tmp = {
-      /* PyObject header changed in Python 3 */
 #if PY_VERSION_HEX>=0x03000000
       PyVarObject_HEAD_INIT(NULL, 0)
 #else
@@ -2111,10 +2152,19 @@ SwigPyPacked_TypeOnce(void) {
       0,                                    /* tp_del */
 #endif
 #if PY_VERSION_HEX >= 0x02060000
-      0,                                    /* tp_version */
+      0,                                    /* tp_version_tag */
+#endif
+#if PY_VERSION_HEX >= 0x03040000
+      0,                                    /* tp_finalize */
 #endif
 #ifdef COUNT_ALLOCS
-      0,0,0,0                               /* tp_alloc -> tp_next */
+      0,                                    /* tp_allocs */
+      0,                                    /* tp_frees */
+      0,                                    /* tp_maxalloc */
+#if PY_VERSION_HEX >= 0x02050000
+      0,                                    /* tp_prev */
+#endif
+      0                                     /* tp_next */
 #endif
     };
     swigpypacked_type = tmp;
@@ -2273,10 +2323,11 @@ SWIGRUNTIME int
 SWIG_Python_ConvertPtrAndOwn(PyObject *obj, void **ptr, swig_type_info *ty, int flags, int *own) {
   int res;
   SwigPyObject *sobj;
+  int implicit_conv = (flags & SWIG_POINTER_IMPLICIT_CONV) != 0;
 
   if (!obj)
     return SWIG_ERROR;
-  if (obj == Py_None) {
+  if (obj == Py_None && !implicit_conv) {
     if (ptr)
       *ptr = 0;
     return SWIG_OK;
@@ -2325,7 +2376,7 @@ SWIG_Python_ConvertPtrAndOwn(PyObject *obj, void **ptr, swig_type_info *ty, int
     }
     res = SWIG_OK;
   } else {
-    if (flags & SWIG_POINTER_IMPLICIT_CONV) {
+    if (implicit_conv) {
       SwigPyClientData *data = ty ? (SwigPyClientData *) ty->clientdata : 0;
       if (data && !data->implicitconv) {
         PyObject *klass = data->klass;
@@ -2360,6 +2411,13 @@ SWIG_Python_ConvertPtrAndOwn(PyObject *obj, void **ptr, swig_type_info *ty, int
         }
       }
     }
+    if (!SWIG_IsOK(res) && obj == Py_None) {
+      if (ptr)
+        *ptr = 0;
+      if (PyErr_Occurred())
+        PyErr_Clear();
+      res = SWIG_OK;
+    }
   }
   return res;
 }
@@ -2447,24 +2505,30 @@ SWIG_Python_NewShadowInstance(SwigPyClientData *data, PyObject *swig_this)
     }
   } else {
 #if PY_VERSION_HEX >= 0x03000000
-    inst = PyBaseObject_Type.tp_new((PyTypeObject*) data->newargs, Py_None, Py_None);
-    PyObject_SetAttr(inst, SWIG_This(), swig_this);
-    Py_TYPE(inst)->tp_flags &= ~Py_TPFLAGS_VALID_VERSION_TAG;
+    inst = ((PyTypeObject*) data->newargs)->tp_new((PyTypeObject*) data->newargs, Py_None, Py_None);
+    if (inst) {
+      PyObject_SetAttr(inst, SWIG_This(), swig_this);
+      Py_TYPE(inst)->tp_flags &= ~Py_TPFLAGS_VALID_VERSION_TAG;
+    }
 #else
     PyObject *dict = PyDict_New();
-    PyDict_SetItem(dict, SWIG_This(), swig_this);
-    inst = PyInstance_NewRaw(data->newargs, dict);
-    Py_DECREF(dict);
+    if (dict) {
+      PyDict_SetItem(dict, SWIG_This(), swig_this);
+      inst = PyInstance_NewRaw(data->newargs, dict);
+      Py_DECREF(dict);
+    }
 #endif
   }
   return inst;
 #else
 #if (PY_VERSION_HEX >= 0x02010000)
-  PyObject *inst;
+  PyObject *inst = 0;
   PyObject *dict = PyDict_New();
-  PyDict_SetItem(dict, SWIG_This(), swig_this);
-  inst = PyInstance_NewRaw(data->newargs, dict);
-  Py_DECREF(dict);
+  if (dict) {
+    PyDict_SetItem(dict, SWIG_This(), swig_this);
+    inst = PyInstance_NewRaw(data->newargs, dict);
+    Py_DECREF(dict);
+  }
   return (PyObject *) inst;
 #else
   PyInstanceObject *inst = PyObject_NEW(PyInstanceObject, &PyInstance_Type);
@@ -2515,7 +2579,7 @@ SWIG_Python_SetSwigThis(PyObject *inst, PyObject *swig_this)
 SWIGINTERN PyObject *
 SWIG_Python_InitShadowInstance(PyObject *args) {
   PyObject *obj[2];
-  if (!SWIG_Python_UnpackTuple(args,(char*)"swiginit", 2, 2, obj)) {
+  if (!SWIG_Python_UnpackTuple(args, "swiginit", 2, 2, obj)) {
     return NULL;
   } else {
     SwigPyObject *sthis = SWIG_Python_GetSwigThis(obj[0]);
@@ -2551,18 +2615,21 @@ SWIG_Python_NewPointerObj(PyObject *self, void *ptr, swig_type_info *type, int f
 	  newobj = (SwigPyObject *) newobj->next;
         newobj->next = next_self;
         newobj = (SwigPyObject *)next_self;
+#ifdef SWIGPYTHON_BUILTIN
+        newobj->dict = 0;
+#endif
       }
     } else {
       newobj = PyObject_New(SwigPyObject, clientdata->pytype);
+#ifdef SWIGPYTHON_BUILTIN
+      newobj->dict = 0;
+#endif
     }
     if (newobj) {
       newobj->ptr = ptr;
       newobj->ty = type;
       newobj->own = own;
       newobj->next = 0;
-#ifdef SWIGPYTHON_BUILTIN
-      newobj->dict = 0;
-#endif
       return (PyObject*) newobj;
     }
     return SWIG_Py_Void();
@@ -2571,12 +2638,10 @@ SWIG_Python_NewPointerObj(PyObject *self, void *ptr, swig_type_info *type, int f
   assert(!(flags & SWIG_BUILTIN_TP_INIT));
 
   robj = SwigPyObject_New(ptr, type, own);
-  if (clientdata && !(flags & SWIG_POINTER_NOSHADOW)) {
+  if (robj && clientdata && !(flags & SWIG_POINTER_NOSHADOW)) {
     PyObject *inst = SWIG_Python_NewShadowInstance(clientdata, robj);
-    if (inst) {
-      Py_DECREF(robj);
-      robj = inst;
-    }
+    Py_DECREF(robj);
+    robj = inst;
   }
   return robj;
 }
@@ -2597,7 +2662,7 @@ void *SWIG_ReturnGlobalTypeList(void *);
 #endif
 
 SWIGRUNTIME swig_module_info *
-SWIG_Python_GetModule(void) {
+SWIG_Python_GetModule(void *SWIGUNUSEDPARM(clientdata)) {
   static void *type_pointer = (void *)0;
   /* first check if module already created */
   if (!type_pointer) {
@@ -2627,13 +2692,11 @@ PyModule_AddObject(PyObject *m, char *name, PyObject *o)
 {
   PyObject *dict;
   if (!PyModule_Check(m)) {
-    PyErr_SetString(PyExc_TypeError,
-		    "PyModule_AddObject() needs module as first arg");
+    PyErr_SetString(PyExc_TypeError, "PyModule_AddObject() needs module as first arg");
     return SWIG_ERROR;
   }
   if (!o) {
-    PyErr_SetString(PyExc_TypeError,
-		    "PyModule_AddObject() needs non-NULL value");
+    PyErr_SetString(PyExc_TypeError, "PyModule_AddObject() needs non-NULL value");
     return SWIG_ERROR;
   }
   
@@ -2723,7 +2786,7 @@ SWIG_Python_TypeQuery(const char *type)
     descriptor = (swig_type_info *) PyCObject_AsVoidPtr(obj);
 #endif
   } else {
-    swig_module_info *swig_module = SWIG_Python_GetModule();
+    swig_module_info *swig_module = SWIG_GetModule(0);
     descriptor = SWIG_TypeQueryModule(swig_module, swig_module, type);
     if (descriptor) {
 #ifdef SWIGPY_USE_CAPSULE
@@ -2791,7 +2854,7 @@ SwigPyObject_GetDesc(PyObject *self)
 {
   SwigPyObject *v = (SwigPyObject *)self;
   swig_type_info *ty = v ? v->ty : 0;
-  return ty ? ty->str : (char*)"";
+  return ty ? ty->str : "";
 }
 
 SWIGRUNTIME void
@@ -2848,23 +2911,24 @@ SWIG_Python_MustGetPtr(PyObject *obj, swig_type_info *ty, int SWIGUNUSEDPARM(arg
   return result;
 }
 
+#ifdef SWIGPYTHON_BUILTIN
 SWIGRUNTIME int
 SWIG_Python_NonDynamicSetAttr(PyObject *obj, PyObject *name, PyObject *value) {
   PyTypeObject *tp = obj->ob_type;
   PyObject *descr;
   PyObject *encoded_name;
   descrsetfunc f;
-  int res;
+  int res = -1;
 
-#ifdef Py_USING_UNICODE
+# ifdef Py_USING_UNICODE
   if (PyString_Check(name)) {
     name = PyUnicode_Decode(PyString_AsString(name), PyString_Size(name), NULL, NULL);
     if (!name)
       return -1;
   } else if (!PyUnicode_Check(name))
-#else
+# else
   if (!PyString_Check(name))
-#endif
+# endif
   {
     PyErr_Format(PyExc_TypeError, "attribute name must be string, not '%.200s'", name->ob_type->tp_name);
     return -1;
@@ -2877,7 +2941,6 @@ SWIG_Python_NonDynamicSetAttr(PyObject *obj, PyObject *name, PyObject *value) {
       goto done;
   }
 
-  res = -1;
   descr = _PyType_Lookup(tp, name);
   f = NULL;
   if (descr != NULL)
@@ -2899,6 +2962,7 @@ SWIG_Python_NonDynamicSetAttr(PyObject *obj, PyObject *name, PyObject *value) {
   Py_DECREF(name);
   return res;
 }
+#endif
 
 
 #ifdef __cplusplus
@@ -2922,13 +2986,14 @@ SWIG_Python_NonDynamicSetAttr(PyObject *obj, PyObject *name, PyObject *value) {
 #define SWIGTYPE_p_archive_write_callback swig_types[4]
 #define SWIGTYPE_p_char swig_types[5]
 #define SWIGTYPE_p_int64_t swig_types[6]
-#define SWIGTYPE_p_size_t swig_types[7]
-#define SWIGTYPE_p_stat swig_types[8]
-#define SWIGTYPE_p_time_t swig_types[9]
-#define SWIGTYPE_p_unsigned_short swig_types[10]
-#define SWIGTYPE_p_wchar_t swig_types[11]
-static swig_type_info *swig_types[13];
-static swig_module_info swig_module = {swig_types, 12, 0, 0, 0, 0};
+#define SWIGTYPE_p_membuf swig_types[7]
+#define SWIGTYPE_p_size_t swig_types[8]
+#define SWIGTYPE_p_stat swig_types[9]
+#define SWIGTYPE_p_time_t swig_types[10]
+#define SWIGTYPE_p_unsigned_short swig_types[11]
+#define SWIGTYPE_p_wchar_t swig_types[12]
+static swig_type_info *swig_types[14];
+static swig_module_info swig_module = {swig_types, 13, 0, 0, 0, 0};
 #define SWIG_TypeQuery(name) SWIG_TypeQueryModule(&swig_module, &swig_module, name)
 #define SWIG_MangledTypeQuery(name) SWIG_MangledTypeQueryModule(&swig_module, &swig_module, name)
 
@@ -2952,7 +3017,7 @@ static swig_module_info swig_module = {swig_types, 12, 0, 0, 0, 0};
 #endif
 #define SWIG_name    "__libarchive"
 
-#define SWIGVERSION 0x020004 
+#define SWIGVERSION 0x030012 
 #define SWIG_VERSION SWIGVERSION
 
 
@@ -2960,17 +3025,21 @@ static swig_module_info swig_module = {swig_types, 12, 0, 0, 0, 0};
 #define SWIG_as_voidptrptr(a) ((void)SWIG_as_voidptr(*a),(void**)(a)) 
 
 
+#include <errno.h>
+#include <fcntl.h>
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+#include <unistd.h>
+#include <sys/mman.h>
 #include <archive.h>
 #include <archive_entry.h>
 
 
-  #define SWIG_From_long   PyInt_FromLong 
-
-
-SWIGINTERNINLINE PyObject *
-SWIG_From_int  (int value)
-{    
-  return SWIG_From_long  (value);
+SWIGINTERNINLINE PyObject*
+  SWIG_From_int  (int value)
+{
+  return PyInt_FromLong((long) value);
 }
 
 
@@ -2991,13 +3060,18 @@ SWIGINTERN int
 SWIG_AsCharPtrAndSize(PyObject *obj, char** cptr, size_t* psize, int *alloc)
 {
 #if PY_VERSION_HEX>=0x03000000
+#if defined(SWIG_PYTHON_STRICT_BYTE_CHAR)
+  if (PyBytes_Check(obj))
+#else
   if (PyUnicode_Check(obj))
+#endif
 #else  
   if (PyString_Check(obj))
 #endif
   {
     char *cstr; Py_ssize_t len;
 #if PY_VERSION_HEX>=0x03000000
+#if !defined(SWIG_PYTHON_STRICT_BYTE_CHAR)
     if (!alloc && cptr) {
         /* We can't allow converting without allocation, since the internal
            representation of string in Python 3 is UCS-2/UCS-4 but we require
@@ -3006,8 +3080,9 @@ SWIG_AsCharPtrAndSize(PyObject *obj, char** cptr, size_t* psize, int *alloc)
         return SWIG_RuntimeError;
     }
     obj = PyUnicode_AsUTF8String(obj);
-    PyBytes_AsStringAndSize(obj, &cstr, &len);
     if(alloc) *alloc = SWIG_NEWOBJ;
+#endif
+    PyBytes_AsStringAndSize(obj, &cstr, &len);
 #else
     PyString_AsStringAndSize(obj, &cstr, &len);
 #endif
@@ -3027,27 +3102,58 @@ SWIG_AsCharPtrAndSize(PyObject *obj, char** cptr, size_t* psize, int *alloc)
 #else
 	if (*alloc == SWIG_NEWOBJ) 
 #endif
-	  {
-	    *cptr = (char *)memcpy((char *)malloc((len + 1)*sizeof(char)), cstr, sizeof(char)*(len + 1));
-	    *alloc = SWIG_NEWOBJ;
-	  }
-	else {
+	{
+	  *cptr = (char *)memcpy(malloc((len + 1)*sizeof(char)), cstr, sizeof(char)*(len + 1));
+	  *alloc = SWIG_NEWOBJ;
+	} else {
 	  *cptr = cstr;
 	  *alloc = SWIG_OLDOBJ;
 	}
       } else {
-        #if PY_VERSION_HEX>=0x03000000
-        assert(0); /* Should never reach here in Python 3 */
-        #endif
+#if PY_VERSION_HEX>=0x03000000
+#if defined(SWIG_PYTHON_STRICT_BYTE_CHAR)
+	*cptr = PyBytes_AsString(obj);
+#else
+	assert(0); /* Should never reach here with Unicode strings in Python 3 */
+#endif
+#else
 	*cptr = SWIG_Python_str_AsChar(obj);
+#endif
       }
     }
     if (psize) *psize = len + 1;
-#if PY_VERSION_HEX>=0x03000000
+#if PY_VERSION_HEX>=0x03000000 && !defined(SWIG_PYTHON_STRICT_BYTE_CHAR)
     Py_XDECREF(obj);
 #endif
     return SWIG_OK;
   } else {
+#if defined(SWIG_PYTHON_2_UNICODE)
+#if defined(SWIG_PYTHON_STRICT_BYTE_CHAR)
+#error "Cannot use both SWIG_PYTHON_2_UNICODE and SWIG_PYTHON_STRICT_BYTE_CHAR at once"
+#endif
+#if PY_VERSION_HEX<0x03000000
+    if (PyUnicode_Check(obj)) {
+      char *cstr; Py_ssize_t len;
+      if (!alloc && cptr) {
+        return SWIG_RuntimeError;
+      }
+      obj = PyUnicode_AsUTF8String(obj);
+      if (PyString_AsStringAndSize(obj, &cstr, &len) != -1) {
+        if (cptr) {
+          if (alloc) *alloc = SWIG_NEWOBJ;
+          *cptr = (char *)memcpy(malloc((len + 1)*sizeof(char)), cstr, sizeof(char)*(len + 1));
+        }
+        if (psize) *psize = len + 1;
+
+        Py_XDECREF(obj);
+        return SWIG_OK;
+      } else {
+        Py_XDECREF(obj);
+      }
+    }
+#endif
+#endif
+
     swig_type_info* pchar_descriptor = SWIG_pchar_descriptor();
     if (pchar_descriptor) {
       void* vptr = 0;
@@ -3073,9 +3179,11 @@ SWIG_AsVal_double (PyObject *obj, double *val)
   if (PyFloat_Check(obj)) {
     if (val) *val = PyFloat_AsDouble(obj);
     return SWIG_OK;
+#if PY_VERSION_HEX < 0x03000000
   } else if (PyInt_Check(obj)) {
-    if (val) *val = PyInt_AsLong(obj);
+    if (val) *val = (double) PyInt_AsLong(obj);
     return SWIG_OK;
+#endif
   } else if (PyLong_Check(obj)) {
     double v = PyLong_AsDouble(obj);
     if (!PyErr_Occurred()) {
@@ -3149,6 +3257,7 @@ SWIG_CanCastAsInteger(double *d, double min, double max) {
 SWIGINTERN int
 SWIG_AsVal_unsigned_SS_long (PyObject *obj, unsigned long *val) 
 {
+#if PY_VERSION_HEX < 0x03000000
   if (PyInt_Check(obj)) {
     long v = PyInt_AsLong(obj);
     if (v >= 0) {
@@ -3157,13 +3266,16 @@ SWIG_AsVal_unsigned_SS_long (PyObject *obj, unsigned long *val)
     } else {
       return SWIG_OverflowError;
     }
-  } else if (PyLong_Check(obj)) {
+  } else
+#endif
+  if (PyLong_Check(obj)) {
     unsigned long v = PyLong_AsUnsignedLong(obj);
     if (!PyErr_Occurred()) {
       if (val) *val = v;
       return SWIG_OK;
     } else {
       PyErr_Clear();
+      return SWIG_OverflowError;
     }
   }
 #ifdef SWIG_PYTHON_CAST_MODE
@@ -3190,16 +3302,6 @@ SWIG_AsVal_unsigned_SS_long (PyObject *obj, unsigned long *val)
 }
 
 
-SWIGINTERNINLINE int
-SWIG_AsVal_size_t (PyObject * obj, size_t *val)
-{
-  unsigned long v;
-  int res = SWIG_AsVal_unsigned_SS_long (obj, val ? &v : 0);
-  if (SWIG_IsOK(res) && val) *val = (size_t)(v);
-  return res;
-}
-
-
 #include <limits.h>
 #if !defined(SWIG_NO_LLONG_MAX)
 # if !defined(LLONG_MAX) && defined(__GNUC__) && defined (__LONG_LONG_MAX__)
@@ -3210,19 +3312,90 @@ SWIG_AsVal_size_t (PyObject * obj, size_t *val)
 #endif
 
 
+#if defined(LLONG_MAX) && !defined(SWIG_LONG_LONG_AVAILABLE)
+#  define SWIG_LONG_LONG_AVAILABLE
+#endif
+
+
+#ifdef SWIG_LONG_LONG_AVAILABLE
+SWIGINTERN int
+SWIG_AsVal_unsigned_SS_long_SS_long (PyObject *obj, unsigned long long *val)
+{
+  int res = SWIG_TypeError;
+  if (PyLong_Check(obj)) {
+    unsigned long long v = PyLong_AsUnsignedLongLong(obj);
+    if (!PyErr_Occurred()) {
+      if (val) *val = v;
+      return SWIG_OK;
+    } else {
+      PyErr_Clear();
+      res = SWIG_OverflowError;
+    }
+  } else {
+    unsigned long v;
+    res = SWIG_AsVal_unsigned_SS_long (obj,&v);
+    if (SWIG_IsOK(res)) {
+      if (val) *val = v;
+      return res;
+    }
+  }
+#ifdef SWIG_PYTHON_CAST_MODE
+  {
+    const double mant_max = 1LL << DBL_MANT_DIG;
+    double d;
+    res = SWIG_AsVal_double (obj,&d);
+    if (SWIG_IsOK(res) && !SWIG_CanCastAsInteger(&d, 0, mant_max))
+      return SWIG_OverflowError;
+    if (SWIG_IsOK(res) && SWIG_CanCastAsInteger(&d, 0, mant_max)) {
+      if (val) *val = (unsigned long long)(d);
+      return SWIG_AddCast(res);
+    }
+    res = SWIG_TypeError;
+  }
+#endif
+  return res;
+}
+#endif
+
+
+SWIGINTERNINLINE int
+SWIG_AsVal_size_t (PyObject * obj, size_t *val)
+{
+  int res = SWIG_TypeError;
+#ifdef SWIG_LONG_LONG_AVAILABLE
+  if (sizeof(size_t) <= sizeof(unsigned long)) {
+#endif
+    unsigned long v;
+    res = SWIG_AsVal_unsigned_SS_long (obj, val ? &v : 0);
+    if (SWIG_IsOK(res) && val) *val = (size_t)(v);
+#ifdef SWIG_LONG_LONG_AVAILABLE
+  } else if (sizeof(size_t) <= sizeof(unsigned long long)) {
+    unsigned long long v;
+    res = SWIG_AsVal_unsigned_SS_long_SS_long (obj, val ? &v : 0);
+    if (SWIG_IsOK(res) && val) *val = (size_t)(v);
+  }
+#endif
+  return res;
+}
+
+
 SWIGINTERN int
 SWIG_AsVal_long (PyObject *obj, long* val)
 {
+#if PY_VERSION_HEX < 0x03000000
   if (PyInt_Check(obj)) {
     if (val) *val = PyInt_AsLong(obj);
     return SWIG_OK;
-  } else if (PyLong_Check(obj)) {
+  } else
+#endif
+  if (PyLong_Check(obj)) {
     long v = PyLong_AsLong(obj);
     if (!PyErr_Occurred()) {
       if (val) *val = v;
       return SWIG_OK;
     } else {
       PyErr_Clear();
+      return SWIG_OverflowError;
     }
   }
 #ifdef SWIG_PYTHON_CAST_MODE
@@ -3275,9 +3448,17 @@ SWIG_FromCharPtrAndSize(const char* carray, size_t size)
 	SWIG_InternalNewPointerObj((char *)(carray), pchar_descriptor, 0) : SWIG_Py_Void();
     } else {
 #if PY_VERSION_HEX >= 0x03000000
-      return PyUnicode_FromStringAndSize(carray, (int)(size));
+#if defined(SWIG_PYTHON_STRICT_BYTE_CHAR)
+      return PyBytes_FromStringAndSize(carray, (Py_ssize_t)(size));
+#else
+#if PY_VERSION_HEX >= 0x03010000
+      return PyUnicode_DecodeUTF8(carray, (Py_ssize_t)(size), "surrogateescape");
+#else
+      return PyUnicode_FromStringAndSize(carray, (Py_ssize_t)(size));
+#endif
+#endif
 #else
-      return PyString_FromStringAndSize(carray, (int)(size));
+      return PyString_FromStringAndSize(carray, (Py_ssize_t)(size));
 #endif
     }
   } else {
@@ -3293,11 +3474,14 @@ SWIG_FromCharPtr(const char *cptr)
 }
 
 
+  #define SWIG_From_long   PyInt_FromLong 
+
+
 SWIGINTERNINLINE PyObject* 
 SWIG_From_unsigned_SS_long  (unsigned long value)
 {
   return (value > LONG_MAX) ?
-    PyLong_FromUnsignedLong(value) : PyInt_FromLong((long)(value)); 
+    PyLong_FromUnsignedLong(value) : PyInt_FromLong((long)(value));
 }
 
 
@@ -3342,29 +3526,908 @@ SWIG_AsVal_unsigned_SS_short (PyObject * obj, unsigned short *val)
 
 PyObject *archive_read_data_into_str(struct archive *archive, int len) {
     PyObject *str = NULL;
+    ssize_t ret;
     if (!(str = PyString_FromStringAndSize(NULL, len))) {
         PyErr_SetString(PyExc_MemoryError, "could not allocate string.");
         return NULL;
     }
-    if (len != archive_read_data(archive, PyString_AS_STRING(str), len)) {
+    Py_BEGIN_ALLOW_THREADS
+    ret = archive_read_data(archive, PyString_AS_STRING(str), len);
+    Py_END_ALLOW_THREADS
+    if (ret < 0) {
+        Py_DECREF(str);
         PyErr_SetString(PyExc_RuntimeError, "could not read requested data.");
         return NULL;
     }
+    /* Short read, the end of the entry was reached. */
+    if (ret != len && _PyString_Resize(&str, ret) < 0)
+        return NULL;
     return str;
 }
 
+PyObject *archive_read_data_into_buffer(struct archive *archive, PyObject *buffer, int size) {
+    Py_buffer view;
+    int have_view = 0;
+    void *buf = NULL;
+    Py_ssize_t len = 0;
+    ssize_t ret;
+    if (PyObject_CheckBuffer(buffer)) {
+        if (PyObject_GetBuffer(buffer, &view, PyBUF_WRITABLE) < 0)
+            return NULL;
+        buf = view.buf;
+        len = view.len;
+        have_view = 1;
+    } else if (PyObject_AsWriteBuffer(buffer, &buf, &len) < 0) {
+        /* Old style buffers, for example mmap objects. */
+        return NULL;
+    }
+    if (size >= 0 && size < len)
+        len = size;
+    Py_BEGIN_ALLOW_THREADS
+    ret = archive_read_data(archive, buf, len);
+    Py_END_ALLOW_THREADS
+    if (have_view)
+        PyBuffer_Release(&view);
+    if (ret < 0) {
+        PyErr_SetString(PyExc_RuntimeError, "could not read requested data.");
+        return NULL;
+    }
+    return PyInt_FromSsize_t(ret);
+}
+
+PyObject *archive_read_data_block_into_view(struct archive *archive) {
+    const void *buf = NULL;
+    size_t size = 0;
+    __LA_INT64_T offset = 0;
+    Py_buffer view;
+    int ret;
+    Py_BEGIN_ALLOW_THREADS
+    ret = archive_read_data_block(archive, &buf, &size, &offset);
+    Py_END_ALLOW_THREADS
+    if (ret == ARCHIVE_EOF)
+        Py_RETURN_NONE;
+    if (ret != ARCHIVE_OK && ret != ARCHIVE_WARN) {
+        PyErr_SetString(PyExc_RuntimeError, "could not read data block.");
+        return NULL;
+    }
+    if (ret == ARCHIVE_WARN &&
+        PyErr_WarnEx(PyExc_RuntimeWarning, archive_error_string(archive), 1) < 0)
+        return NULL;
+    /* The view points into libarchive's own buffer, it is only valid until
+       the next read from the archive. */
+    if (PyBuffer_FillInfo(&view, NULL, (void *) buf, size, 1, PyBUF_CONTIG_RO) < 0)
+        return NULL;
+    return Py_BuildValue("(LN)", (PY_LONG_LONG) offset, PyMemoryView_FromBuffer(&view));
+}
+
+/* Reads the next header into entry, which the caller reuses between calls, and
+   returns (pathname, size, mtime, mode, header position) or None at the end. */
+PyObject *archive_read_next_header_fields(struct archive *archive, struct archive_entry *entry) {
+    __LA_INT64_T hpos;
+    int ret;
+    Py_BEGIN_ALLOW_THREADS
+    ret = archive_read_next_header2(archive, entry);
+    Py_END_ALLOW_THREADS
+    if (ret == ARCHIVE_EOF)
+        Py_RETURN_NONE;
+    /* Like call_and_check(), ARCHIVE_RETRY leaves the entry unfilled as well. */
+    if (ret != ARCHIVE_OK && ret != ARCHIVE_WARN) {
+        PyErr_Format(PyExc_RuntimeError, "Fatal error executing function, message is: %s.",
+                     archive_error_string(archive));
+        return NULL;
+    }
+    if (ret == ARCHIVE_WARN &&
+        PyErr_WarnEx(PyExc_RuntimeWarning, archive_error_string(archive), 1) < 0)
+        return NULL;
+    hpos = archive_read_header_position(archive);
+    return Py_BuildValue("(zLlIL)", archive_entry_pathname(entry),
+                         (PY_LONG_LONG) archive_entry_size(entry),
+                         (long) archive_entry_mtime(entry),
+                         (unsigned int) archive_entry_mode(entry),
+                         (PY_LONG_LONG) hpos);
+}
+
 PyObject *archive_write_data_from_str(struct archive *archive, PyObject *str) {
     int len = PyString_Size(str);
-    if (!archive_write_data(archive, PyString_AS_STRING(str), len)) {
-        PyErr_SetString(PyExc_RuntimeError, "could not write requested data.");
+    ssize_t ret;
+    Py_BEGIN_ALLOW_THREADS
+    ret = archive_write_data(archive, PyString_AS_STRING(str), len);
+    Py_END_ALLOW_THREADS
+    /* A short count means the entry did not take all of the data. */
+    if (ret < len) {
+        PyErr_Format(PyExc_RuntimeError, "could not write requested data: %s.",
+                     archive_error_string(archive) ? archive_error_string(archive) : "short write");
         return NULL;
     }
     return PyInt_FromLong(len);
 }
 
-#ifdef __cplusplus
-extern "C" {
-#endif
+
+
+/* Added in libarchive 3.1. */
+#ifndef ARCHIVE_EXTRACT_SECURE_NOABSOLUTEPATHS
+#define ARCHIVE_EXTRACT_SECURE_NOABSOLUTEPATHS 0x10000
+#endif
+
+/* Prefix the given entry path with dir, buf is reused between calls. */
+static const char *_prefix_path(const char *dir, size_t dirlen, const char *name, char **buf, size_t *buflen) {
+    size_t len = dirlen + strlen(name) + 2;
+    if (len > *buflen) {
+        char *tmp = realloc(*buf, len);
+        if (tmp == NULL)
+            return NULL;
+        *buf = tmp;
+        *buflen = len;
+    }
+    snprintf(*buf, len, "%s/%s", dir, name);
+    return *buf;
+}
+
+/* Appends "name: message" (or message without a name) to the NUL separated list in
+   buf, which is reused between calls. Returns -1 if out of memory. */
+static int _add_message(char **buf, size_t *len, size_t *size, const char *name, const char *message) {
+    const char *format = name ? "%s: %s" : "%s%s";
+    size_t n;
+    if (!message)
+        message = "unknown error";
+    n = snprintf(NULL, 0, format, name ? name : "", message) + 1;
+    if (*len + n > *size) {
+        size_t newsize = *size ? *size : 256;
+        char *tmp;
+        while (newsize < *len + n)
+            newsize *= 2;
+        if (!(tmp = realloc(*buf, newsize)))
+            return -1;
+        *buf = tmp;
+        *size = newsize;
+    }
+    snprintf(*buf + *len, n, format, name ? name : "", message);
+    *len += n;
+    return 0;
+}
+
+/* Writes the current entry to disk, errors are left on the reader. */
+static int _extract_entry(struct archive *archive, struct archive_entry *entry, struct archive *disk) {
+    const void *block;
+    size_t size;
+    int64_t offset;
+    int ret, r;
+    if ((ret = archive_write_header(disk, entry)) != ARCHIVE_OK)
+        archive_copy_error(archive, disk);
+    if (ret < ARCHIVE_WARN)
+        return ret;
+    if (archive_entry_size(entry) > 0 || !archive_entry_size_is_set(entry)) {
+        while ((r = archive_read_data_block(archive, &block, &size, &offset)) != ARCHIVE_EOF) {
+            if (r < ARCHIVE_WARN)
+                return r;
+            if (archive_write_data_block(disk, block, size, offset) < ARCHIVE_WARN) {
+                archive_copy_error(archive, disk);
+                return ARCHIVE_FAILED;
+            }
+        }
+    }
+    if ((r = archive_write_finish_entry(disk)) < ret) {
+        archive_copy_error(archive, disk);
+        ret = r;
+    }
+    return ret;
+}
+
+
+PyObject *archive_read_extract_all(struct archive *archive, const char *path, int flags) {
+    struct archive *disk = NULL;
+    struct archive_entry *entry = NULL;
+    const char *name = NULL;
+    char *buf = NULL, *warnings = NULL, *warning;
+    size_t buflen = 0, pathlen = path ? strlen(path) : 0, wlen = 0, wsize = 0;
+    PY_LONG_LONG count = 0, size = 0;
+    int ret = ARCHIVE_OK, nomem = 0;
+    if (!(disk = archive_write_disk_new()))
+        return PyErr_NoMemory();
+    /* Prefixed names are absolute, absolute entry names are rejected below instead. */
+    archive_write_disk_set_options(disk, pathlen ? flags & ~ARCHIVE_EXTRACT_SECURE_NOABSOLUTEPATHS : flags);
+    archive_write_disk_set_standard_lookup(disk);
+    Py_BEGIN_ALLOW_THREADS
+    while (1) {
+        ret = archive_read_next_header(archive, &entry);
+        if (ret == ARCHIVE_EOF) {
+            ret = ARCHIVE_OK;
+            break;
+        }
+        if (ret == ARCHIVE_FATAL)
+            break;
+        if (ret != ARCHIVE_OK && ret != ARCHIVE_WARN) {
+            /* Skip the entry, the next header can still be read. */
+            if (_add_message(&warnings, &wlen, &wsize, NULL, archive_error_string(archive) ?
+                             archive_error_string(archive) : "could not read entry header") < 0) {
+                nomem = 1;
+                break;
+            }
+            continue;
+        }
+        if (pathlen) {
+            /* Extract relative to path, including hardlink targets. */
+            if ((name = archive_entry_pathname(entry)) != NULL) {
+                if ((flags & ARCHIVE_EXTRACT_SECURE_NOABSOLUTEPATHS) && name[0] == '/') {
+                    if (_add_message(&warnings, &wlen, &wsize, name, "Path is absolute") < 0) {
+                        nomem = 1;
+                        break;
+                    }
+                    continue;
+                }
+                if (!(name = _prefix_path(path, pathlen, name, &buf, &buflen))) {
+                    nomem = 1;
+                    break;
+                }
+                archive_entry_copy_pathname(entry, name);
+            }
+            if ((name = archive_entry_hardlink(entry)) != NULL) {
+                if ((flags & ARCHIVE_EXTRACT_SECURE_NOABSOLUTEPATHS) && name[0] == '/') {
+                    if (_add_message(&warnings, &wlen, &wsize, name, "Path is absolute") < 0) {
+                        nomem = 1;
+                        break;
+                    }
+                    continue;
+                }
+                if (!(name = _prefix_path(path, pathlen, name, &buf, &buflen))) {
+                    nomem = 1;
+                    break;
+                }
+                archive_entry_copy_hardlink(entry, name);
+            }
+        }
+        /* archive_read_extract2() reports rejected entries as warnings, so its
+           steps are done here to tell them apart. */
+        if ((ret = _extract_entry(archive, entry, disk)) == ARCHIVE_FATAL)
+            break;
+        if (ret != ARCHIVE_OK) {
+            /* A failed entry is reported and the remaining ones are still extracted. */
+            /* Report the name as it was in the archive. */
+            if ((name = archive_entry_pathname(entry)) != NULL && pathlen)
+                name += pathlen + 1;
+            if (_add_message(&warnings, &wlen, &wsize, name, archive_error_string(archive)) < 0) {
+                nomem = 1;
+                break;
+            }
+            if (ret != ARCHIVE_WARN)
+                continue;
+        }
+        count++;
+        size += archive_entry_size(entry);
+    }
+    /* Closing restores directory times and permissions. */
+    archive_write_free(disk);
+    Py_END_ALLOW_THREADS
+    free(buf);
+    if (nomem || ret == ARCHIVE_FATAL) {
+        free(warnings);
+        if (nomem)
+            PyErr_NoMemory();
+        else
+            PyErr_Format(PyExc_RuntimeError, "could not extract archive: %s.",
+                         archive_error_string(archive) ? archive_error_string(archive) : "unknown error");
+        return NULL;
+    }
+    /* One warning per skipped entry. */
+    for (warning = warnings; warning < warnings + wlen; warning += strlen(warning) + 1) {
+        if (PyErr_WarnEx(PyExc_RuntimeWarning, warning, 1) < 0) {
+            free(warnings);
+            return NULL;
+        }
+    }
+    free(warnings);
+    return Py_BuildValue("(LL)", count, size);
+}
+
+PyObject *archive_write_data_from_fd(struct archive *archive, int fd, int64_t length, int blocksize) {
+    char *buf = NULL;
+    ssize_t count = 0, written = 0, offset;
+    int64_t total = 0;
+    if (blocksize <= 0)
+        blocksize = 10240;
+    if (!(buf = PyMem_Malloc(blocksize)))
+        return PyErr_NoMemory();
+    Py_BEGIN_ALLOW_THREADS
+    /* Copy until EOF, or until length bytes were copied if length >= 0. */
+    while (length < 0 || total < length) {
+        count = blocksize;
+        if (length >= 0 && length - total < count)
+            count = length - total;
+        count = read(fd, buf, count);
+        if (count < 0 && errno == EINTR)
+            continue;
+        if (count <= 0)
+            break;
+        for (offset = 0; offset < count; offset += written) {
+            written = archive_write_data(archive, buf + offset, count - offset);
+            if (written <= 0)
+                break;
+        }
+        if (written <= 0)
+            break;
+        total += count;
+    }
+    Py_END_ALLOW_THREADS
+    PyMem_Free(buf);
+    if (count < 0)
+        return PyErr_SetFromErrno(PyExc_OSError);
+    if (written < 0 || (count > 0 && written == 0)) {
+        PyErr_SetString(PyExc_RuntimeError, "could not write requested data.");
+        return NULL;
+    }
+    return PyLong_FromLongLong(total);
+}
+
+
+/* Like archive_write_open_fd() on a regular file, don't pad the last block with
+   zeros. Some decompressors (zstd) reject the padding. */
+static void _unpadded(struct archive *archive) {
+    if (archive_write_get_bytes_in_last_block(archive) < 0)
+        archive_write_set_bytes_in_last_block(archive, 1);
+}
+
+/* Client data for archives read from or written to a Python file object. */
+struct pyio {
+    PyObject *file;
+    /* The bytearray filled by readinto(), or the last string read() returned. */
+    PyObject *buffer;
+    int readinto;
+    size_t blocksize;
+};
+
+/* Moves the pending Python exception into the archive's error message, the
+   wrapper of the libarchive call raises it from there. Needs the GIL. */
+static void _pyio_set_error(struct archive *archive) {
+    PyObject *type, *value, *traceback, *str = NULL;
+    PyErr_Fetch(&type, &value, &traceback);
+    if (value)
+        str = PyObject_Str(value);
+    archive_set_error(archive, EIO, "%s",
+                      str && PyString_Check(str) ? PyString_AS_STRING(str) : "I/O error in file object");
+    Py_XDECREF(str);
+    Py_XDECREF(type);
+    Py_XDECREF(value);
+    Py_XDECREF(traceback);
+    PyErr_Clear();
+}
+
+static ssize_t _pyio_read(struct archive *archive, void *data, const void **buffer) {
+    struct pyio *io = data;
+    PyObject *result;
+    ssize_t size = -1;
+    PyGILState_STATE gil = PyGILState_Ensure();
+    if (io->readinto) {
+        result = PyObject_CallMethod(io->file, "readinto", "O", io->buffer);
+        if (result == Py_None)
+            PyErr_SetString(PyExc_IOError, "readinto() returned None, non-blocking files are not supported");
+        else if (result)
+            size = PyInt_AsSsize_t(result);
+        *buffer = PyByteArray_AS_STRING(io->buffer);
+        Py_XDECREF(result);
+    } else {
+        result = PyObject_CallMethod(io->file, "read", "n", (Py_ssize_t) io->blocksize);
+        if (result && !PyString_Check(result)) {
+            PyErr_SetString(PyExc_TypeError, "read() did not return a string");
+            Py_CLEAR(result);
+        }
+        if (result) {
+            /* Keep the string alive until the next read. */
+            Py_XDECREF(io->buffer);
+            io->buffer = result;
+            *buffer = PyString_AS_STRING(result);
+            size = PyString_GET_SIZE(result);
+        }
+    }
+    if (size < 0)
+        _pyio_set_error(archive);
+    PyGILState_Release(gil);
+    return size;
+}
+
+static __LA_INT64_T _pyio_seek(struct archive *archive, void *data, __LA_INT64_T offset, int whence) {
+    struct pyio *io = data;
+    PyObject *result;
+    __LA_INT64_T position = ARCHIVE_FATAL;
+    PyGILState_STATE gil = PyGILState_Ensure();
+    result = PyObject_CallMethod(io->file, "seek", "Li", (PY_LONG_LONG) offset, whence);
+    if (result) {
+        Py_DECREF(result);
+        result = PyObject_CallMethod(io->file, "tell", NULL);
+    }
+    if (result) {
+        position = PyLong_AsLongLong(result);
+        Py_DECREF(result);
+    }
+    if (position < 0) {
+        position = ARCHIVE_FATAL;
+        _pyio_set_error(archive);
+    }
+    PyGILState_Release(gil);
+    return position;
+}
+
+static __LA_INT64_T _pyio_skip(struct archive *archive, void *data, __LA_INT64_T request) {
+    struct pyio *io = data;
+    PyObject *result;
+    PyGILState_STATE gil = PyGILState_Ensure();
+    result = PyObject_CallMethod(io->file, "seek", "Li", (PY_LONG_LONG) request, SEEK_CUR);
+    if (result) {
+        Py_DECREF(result);
+    } else {
+        /* Let libarchive read over the data instead. */
+        PyErr_Clear();
+        request = 0;
+    }
+    PyGILState_Release(gil);
+    return request;
+}
+
+/* Writes length bytes to the file, returns -1 on error. */
+static int _pyio_write_out(struct archive *archive, struct pyio *io, const char *buffer, size_t length) {
+    PyObject *result;
+    Py_ssize_t written;
+    int ret = 0;
+    PyGILState_STATE gil = PyGILState_Ensure();
+    while (length > 0) {
+        result = PyObject_CallMethod(io->file, "write", "s#", buffer, (int) length);
+        if (!result) {
+            ret = -1;
+            break;
+        }
+        /* file.write() returns None, raw files return the count. */
+        written = result == Py_None ? (Py_ssize_t) length : PyInt_AsSsize_t(result);
+        Py_DECREF(result);
+        if (written <= 0) {
+            if (!PyErr_Occurred())
+                PyErr_SetString(PyExc_IOError, "write() did not accept any data");
+            ret = -1;
+            break;
+        }
+        buffer += written;
+        length -= written;
+    }
+    if (ret < 0)
+        _pyio_set_error(archive);
+    PyGILState_Release(gil);
+    return ret;
+}
+
+static ssize_t _pyio_write(struct archive *archive, void *data, const void *buffer, size_t length) {
+    return _pyio_write_out(archive, data, buffer, length) < 0 ? -1 : (ssize_t) length;
+}
+
+static int _pyio_close(struct archive *archive, void *data) {
+    struct pyio *io = data;
+    PyGILState_STATE gil = PyGILState_Ensure();
+    Py_XDECREF(io->file);
+    Py_XDECREF(io->buffer);
+    PyGILState_Release(gil);
+    free(io);
+    return ARCHIVE_OK;
+}
+
+static struct pyio *_pyio_new(struct archive *archive, PyObject *file, int blocksize) {
+    struct pyio *io = calloc(1, sizeof(struct pyio));
+    if (!io) {
+        archive_set_error(archive, ENOMEM, "No memory");
+        return NULL;
+    }
+    io->blocksize = blocksize > 0 ? blocksize : 10240;
+    io->file = file;
+    Py_INCREF(file);
+    return io;
+}
+
+
+/* Opens the archive for reading from a Python object with read() or readinto().
+   seek() is only used (for skipping data and by seeking readers like zip's)
+   when seekable is set. The object is not closed. */
+int archive_read_open_pyobject(struct archive *archive, PyObject *file, int blocksize, int seekable) {
+    struct pyio *io = _pyio_new(archive, file, blocksize);
+    int ret;
+    if (!io)
+        return ARCHIVE_FATAL;
+    io->readinto = PyObject_HasAttrString(file, "readinto");
+    if (io->readinto && !(io->buffer = PyByteArray_FromStringAndSize(NULL, io->blocksize))) {
+        PyErr_Clear();
+        _pyio_close(archive, io);
+        archive_set_error(archive, ENOMEM, "No memory");
+        return ARCHIVE_FATAL;
+    }
+    archive_read_set_read_callback(archive, _pyio_read);
+    archive_read_set_close_callback(archive, _pyio_close);
+    if (seekable) {
+        archive_read_set_skip_callback(archive, _pyio_skip);
+        archive_read_set_seek_callback(archive, _pyio_seek);
+    }
+    archive_read_set_callback_data(archive, io);
+    Py_BEGIN_ALLOW_THREADS
+    ret = archive_read_open1(archive);
+    Py_END_ALLOW_THREADS
+    return ret;
+}
+
+/* Opens the archive for writing to a Python object with write(), in chunks of
+   blocksize bytes. The object is not closed. */
+int archive_write_open_pyobject(struct archive *archive, PyObject *file, int blocksize) {
+    struct pyio *io = _pyio_new(archive, file, blocksize);
+    int ret;
+    if (!io)
+        return ARCHIVE_FATAL;
+    /* libarchive batches the writes. The last block goes through _pyio_write()
+       as well, errors returned by the close callback would be ignored. */
+    archive_write_set_bytes_per_block(archive, io->blocksize);
+    _unpadded(archive);
+    Py_BEGIN_ALLOW_THREADS
+    ret = archive_write_open(archive, io, NULL, _pyio_write, _pyio_close);
+    Py_END_ALLOW_THREADS
+    return ret;
+}
+
+
+/* Client data for archives read straight from the memory of a Python object. */
+struct pybuffer {
+    PyObject *obj;
+    /* Only set for objects with the new buffer interface. */
+    Py_buffer view;
+    int has_view;
+    const char *data;
+    size_t size;
+    size_t position;
+};
+
+static ssize_t _pybuffer_read(struct archive *archive, void *client, const void **buffer) {
+    struct pybuffer *buf = client;
+    size_t size = buf->size - buf->position;
+    *buffer = buf->data + buf->position;
+    /* Everything at once, the data is already in memory. */
+    buf->position = buf->size;
+    return size;
+}
+
+static __LA_INT64_T _pybuffer_skip(struct archive *archive, void *client, __LA_INT64_T request) {
+    struct pybuffer *buf = client;
+    if (request > (__LA_INT64_T) (buf->size - buf->position))
+        request = buf->size - buf->position;
+    buf->position += request;
+    return request;
+}
+
+static __LA_INT64_T _pybuffer_seek(struct archive *archive, void *client, __LA_INT64_T offset, int whence) {
+    struct pybuffer *buf = client;
+    if (whence == SEEK_CUR)
+        offset += buf->position;
+    else if (whence == SEEK_END)
+        offset += buf->size;
+    if (offset < 0)
+        return ARCHIVE_FATAL;
+    buf->position = offset > (__LA_INT64_T) buf->size ? buf->size : offset;
+    return buf->position;
+}
+
+static int _pybuffer_close(struct archive *archive, void *client) {
+    struct pybuffer *buf = client;
+    PyGILState_STATE gil = PyGILState_Ensure();
+    if (buf->has_view)
+        PyBuffer_Release(&buf->view);
+    Py_DECREF(buf->obj);
+    PyGILState_Release(gil);
+    free(buf);
+    return ARCHIVE_OK;
+}
+
+/* Output of archives written to memory, grown as needed. */
+struct membuf {
+    char *data;
+    size_t len;
+    size_t size;
+};
+
+static ssize_t _membuf_write(struct archive *archive, void *client, const void *buffer, size_t length) {
+    struct membuf *buf = client;
+    size_t size = buf->size;
+    char *data;
+    while (size - buf->len < length)
+        size = size ? size * 2 : 65536;
+    if (size != buf->size) {
+        if (!(data = realloc(buf->data, size))) {
+            archive_set_error(archive, ENOMEM, "No memory");
+            return -1;
+        }
+        buf->data = data;
+        buf->size = size;
+    }
+    memcpy(buf->data + buf->len, buffer, length);
+    buf->len += length;
+    return length;
+}
+
+
+/* Opens the archive for reading from the memory of obj, starting offset bytes
+   in. obj can be anything with the buffer interface (str, bytearray, memoryview,
+   mmap), it is referenced until the archive is closed and nothing is copied. */
+int archive_read_open_pybuffer(struct archive *archive, PyObject *obj, size_t offset) {
+    struct pybuffer *buf = calloc(1, sizeof(struct pybuffer));
+    const void *data;
+    Py_ssize_t size;
+    int ret;
+    if (!buf) {
+        archive_set_error(archive, ENOMEM, "No memory");
+        return ARCHIVE_FATAL;
+    }
+    if (PyObject_CheckBuffer(obj)) {
+        if (PyObject_GetBuffer(obj, &buf->view, PyBUF_SIMPLE) == 0) {
+            buf->has_view = 1;
+            data = buf->view.buf;
+            size = buf->view.len;
+        } else {
+            size = -1;
+        }
+    } else if (PyObject_AsReadBuffer(obj, &data, &size) < 0) {
+        size = -1;
+    }
+    if (size < 0) {
+        free(buf);
+        PyErr_Clear();
+        archive_set_error(archive, EINVAL, "Object does not support the buffer interface");
+        return ARCHIVE_FATAL;
+    }
+    buf->obj = obj;
+    Py_INCREF(obj);
+    if (offset > (size_t) size)
+        offset = size;
+    buf->data = (const char *) data + offset;
+    buf->size = size - offset;
+    archive_read_set_read_callback(archive, _pybuffer_read);
+    archive_read_set_skip_callback(archive, _pybuffer_skip);
+    archive_read_set_seek_callback(archive, _pybuffer_seek);
+    archive_read_set_close_callback(archive, _pybuffer_close);
+    archive_read_set_callback_data(archive, buf);
+    Py_BEGIN_ALLOW_THREADS
+    ret = archive_read_open1(archive);
+    Py_END_ALLOW_THREADS
+    return ret;
+}
+
+struct membuf *membuf_new(void) {
+    return calloc(1, sizeof(struct membuf));
+}
+
+void membuf_free(struct membuf *buf) {
+    free(buf->data);
+    free(buf);
+}
+
+/* Returns a copy of what was written so far. */
+PyObject *membuf_to_str(struct membuf *buf) {
+    return PyString_FromStringAndSize(buf->data, buf->len);
+}
+
+/* Opens the archive for writing into buf, which must outlive the archive. */
+int archive_write_open_membuf(struct archive *archive, struct membuf *buf) {
+    int ret;
+    _unpadded(archive);
+    Py_BEGIN_ALLOW_THREADS
+    ret = archive_write_open(archive, buf, NULL, _membuf_write, NULL);
+    Py_END_ALLOW_THREADS
+    return ret;
+}
+
+
+#ifndef POSIX_FADV_SEQUENTIAL
+#define POSIX_FADV_SEQUENTIAL 0
+#define POSIX_FADV_WILLNEED 0
+#endif
+
+
+/* Tells the kernel how the given range of fd will be read, see posix_fadvise().
+   Returns 0 or an errno value. Does nothing where posix_fadvise() is missing. */
+int fadvise(int fd, long long offset, long long length, int advice) {
+    int ret = 0;
+#ifdef POSIX_FADV_NORMAL
+    Py_BEGIN_ALLOW_THREADS
+    ret = posix_fadvise(fd, offset, length, advice);
+    Py_END_ALLOW_THREADS
+#endif
+    return ret;
+}
+
+
+#ifdef SWIG_LONG_LONG_AVAILABLE
+SWIGINTERN int
+SWIG_AsVal_long_SS_long (PyObject *obj, long long *val)
+{
+  int res = SWIG_TypeError;
+  if (PyLong_Check(obj)) {
+    long long v = PyLong_AsLongLong(obj);
+    if (!PyErr_Occurred()) {
+      if (val) *val = v;
+      return SWIG_OK;
+    } else {
+      PyErr_Clear();
+      res = SWIG_OverflowError;
+    }
+  } else {
+    long v;
+    res = SWIG_AsVal_long (obj,&v);
+    if (SWIG_IsOK(res)) {
+      if (val) *val = v;
+      return res;
+    }
+  }
+#ifdef SWIG_PYTHON_CAST_MODE
+  {
+    const double mant_max = 1LL << DBL_MANT_DIG;
+    const double mant_min = -mant_max;
+    double d;
+    res = SWIG_AsVal_double (obj,&d);
+    if (SWIG_IsOK(res) && !SWIG_CanCastAsInteger(&d, mant_min, mant_max))
+      return SWIG_OverflowError;
+    if (SWIG_IsOK(res) && SWIG_CanCastAsInteger(&d, mant_min, mant_max)) {
+      if (val) *val = (long long)(d);
+      return SWIG_AddCast(res);
+    }
+    res = SWIG_TypeError;
+  }
+#endif
+  return res;
+}
+#endif
+
+
+#ifndef MADV_SEQUENTIAL
+#define MADV_SEQUENTIAL 0
+#define MADV_WILLNEED 0
+#endif
+
+/* Gets the memory of obj, either through the new or the old buffer interface. Fills
+   view when the new one was used, it must be released. Returns 0 or -1 with a
+   Python exception set. */
+static int _get_buffer(PyObject *obj, Py_buffer *view, const char **data, Py_ssize_t *size) {
+    const void *ptr;
+    view->obj = NULL;
+    if (PyObject_CheckBuffer(obj)) {
+        if (PyObject_GetBuffer(obj, view, PyBUF_SIMPLE) < 0)
+            return -1;
+        *data = view->buf;
+        *size = view->len;
+        return 0;
+    }
+    if (PyObject_AsReadBuffer(obj, &ptr, size) < 0)
+        return -1;
+    *data = ptr;
+    return 0;
+}
+
+
+/* Tells the kernel how the given range of obj's memory (an mmap) will be used, see
+   madvise(). length 0 means up to the end. Returns 0 or an errno value. */
+int madvise_buffer(PyObject *obj, long long offset, long long length, int advice) {
+    Py_buffer view;
+    const char *data;
+    Py_ssize_t size;
+    long page = sysconf(_SC_PAGESIZE);
+    char *start;
+    int ret = 0;
+    if (_get_buffer(obj, &view, &data, &size) < 0) {
+        PyErr_Clear();
+        return EINVAL;
+    }
+    if (offset < 0 || offset > size)
+        offset = size;
+    if (length <= 0 || length > size - offset)
+        length = size - offset;
+#ifdef MADV_NORMAL
+    /* madvise() wants a page aligned address. */
+    start = (char *) data + offset;
+    length += (size_t) start % page;
+    start -= (size_t) start % page;
+    if (length > 0 && madvise(start, length, advice) < 0)
+        ret = errno;
+#endif
+    if (view.obj)
+        PyBuffer_Release(&view);
+    return ret;
+}
+
+
+#ifdef __linux__
+#include <sys/sendfile.h>
+#include <sys/syscall.h>
+#endif
+
+
+/* Copies length bytes at offset in in_fd to the current position of out_fd, without
+   moving in_fd's position. The data stays in the kernel when possible: it tries
+   copy_file_range() (which can share blocks on the same filesystem), then
+   sendfile() (which also works for sockets and pipes), and falls back to pread()
+   and write(). Returns the number of bytes copied, less than length if in_fd ends
+   early. */
+PyObject *copy_fd_range(int in_fd, long long offset, int out_fd, long long length) {
+    /* 0: copy_file_range(), 1: sendfile(), 2: pread() and write(). */
+    int method = 0, error;
+    long long total = 0;
+    ssize_t count = 0, written;
+    size_t chunk;
+    off_t off = offset;
+    char *buf = NULL;
+    Py_BEGIN_ALLOW_THREADS
+    while (total < length) {
+        chunk = length - total > 0x40000000 ? 0x40000000 : (size_t) (length - total);
+#if defined(__linux__) && defined(SYS_copy_file_range)
+        if (method == 0) {
+            loff_t in_off = off;
+            count = syscall(SYS_copy_file_range, in_fd, &in_off, out_fd, NULL, chunk, 0);
+            if (count < 0 && errno != EINTR) {
+                /* Not supported for these files, try the next method. */
+                if (total == 0 && (errno == ENOSYS || errno == EXDEV || errno == EINVAL ||
+                                   errno == EOPNOTSUPP || errno == EBADF)) {
+                    method = 1;
+                    continue;
+                }
+                break;
+            }
+        }
+#else
+        if (method == 0)
+            method = 1;
+#endif
+#ifdef __linux__
+        if (method == 1) {
+            off_t in_off = off;
+            count = sendfile(out_fd, in_fd, &in_off, chunk);
+            if (count < 0 && errno != EINTR) {
+                if (total == 0 && (errno == ENOSYS || errno == EINVAL)) {
+                    method = 2;
+                    continue;
+                }
+                break;
+            }
+        }
+#else
+        if (method == 1)
+            method = 2;
+#endif
+        if (method == 2) {
+            if (!buf && !(buf = malloc(65536))) {
+                errno = ENOMEM;
+                count = -1;
+                break;
+            }
+            count = pread(in_fd, buf, chunk > 65536 ? 65536 : chunk, off);
+            for (written = 0; count > 0 && written < count; ) {
+                ssize_t n = write(out_fd, buf + written, count - written);
+                if (n < 0 && errno == EINTR)
+                    continue;
+                if (n <= 0) {
+                    count = -1;
+                    break;
+                }
+                written += n;
+            }
+            if (count < 0 && errno != EINTR)
+                break;
+        }
+        if (count == 0)
+            break;
+        if (count > 0) {
+            off += count;
+            total += count;
+        }
+    }
+    error = errno;
+    Py_END_ALLOW_THREADS
+    free(buf);
+    if (count < 0 && total < length) {
+        errno = error;
+        return PyErr_SetFromErrno(PyExc_OSError);
+    }
+    return PyLong_FromLongLong(total);
+}
+
+#ifdef __cplusplus
+extern "C" {
+#endif
 SWIGINTERN PyObject *_wrap_archive_read_new(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   struct archive *result = 0 ;
@@ -3392,7 +4455,11 @@ SWIGINTERN PyObject *_wrap_archive_read_free(PyObject *SWIGUNUSEDPARM(self), PyO
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "archive_read_free" "', argument " "1"" of type '" "struct archive *""'"); 
   }
   arg1 = (struct archive *)(argp1);
-  result = (int)archive_read_free(arg1);
+  {
+    Py_BEGIN_ALLOW_THREADS
+    result = (int)archive_read_free(arg1);
+    Py_END_ALLOW_THREADS
+  }
   resultobj = SWIG_From_int((int)(result));
   return resultobj;
 fail:
@@ -3433,7 +4500,11 @@ SWIGINTERN PyObject *_wrap_archive_read_open_filename(PyObject *SWIGUNUSEDPARM(s
     SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "archive_read_open_filename" "', argument " "3"" of type '" "size_t""'");
   } 
   arg3 = (size_t)(val3);
-  result = (int)archive_read_open_filename(arg1,(char const *)arg2,arg3);
+  {
+    Py_BEGIN_ALLOW_THREADS
+    result = (int)archive_read_open_filename(arg1,(char const *)arg2,arg3);
+    Py_END_ALLOW_THREADS
+  }
   resultobj = SWIG_From_int((int)(result));
   if (alloc2 == SWIG_NEWOBJ) free((char*)buf2);
   return resultobj;
@@ -3473,7 +4544,11 @@ SWIGINTERN PyObject *_wrap_archive_read_open_memory(PyObject *SWIGUNUSEDPARM(sel
     SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "archive_read_open_memory" "', argument " "3"" of type '" "size_t""'");
   } 
   arg3 = (size_t)(val3);
-  result = (int)archive_read_open_memory(arg1,arg2,arg3);
+  {
+    Py_BEGIN_ALLOW_THREADS
+    result = (int)archive_read_open_memory(arg1,arg2,arg3);
+    Py_END_ALLOW_THREADS
+  }
   resultobj = SWIG_From_int((int)(result));
   return resultobj;
 fail:
@@ -3520,7 +4595,11 @@ SWIGINTERN PyObject *_wrap_archive_read_open_memory2(PyObject *SWIGUNUSEDPARM(se
     SWIG_exception_fail(SWIG_ArgError(ecode4), "in method '" "archive_read_open_memory2" "', argument " "4"" of type '" "size_t""'");
   } 
   arg4 = (size_t)(val4);
-  result = (int)archive_read_open_memory2(arg1,arg2,arg3,arg4);
+  {
+    Py_BEGIN_ALLOW_THREADS
+    result = (int)archive_read_open_memory2(arg1,arg2,arg3,arg4);
+    Py_END_ALLOW_THREADS
+  }
   resultobj = SWIG_From_int((int)(result));
   return resultobj;
 fail:
@@ -3560,7 +4639,11 @@ SWIGINTERN PyObject *_wrap_archive_read_open_fd(PyObject *SWIGUNUSEDPARM(self),
     SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "archive_read_open_fd" "', argument " "3"" of type '" "size_t""'");
   } 
   arg3 = (size_t)(val3);
-  result = (int)archive_read_open_fd(arg1,arg2,arg3);
+  {
+    Py_BEGIN_ALLOW_THREADS
+    result = (int)archive_read_open_fd(arg1,arg2,arg3);
+    Py_END_ALLOW_THREADS
+  }
   resultobj = SWIG_From_int((int)(result));
   return resultobj;
 fail:
@@ -3582,7 +4665,11 @@ SWIGINTERN PyObject *_wrap_archive_read_close(PyObject *SWIGUNUSEDPARM(self), Py
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "archive_read_close" "', argument " "1"" of type '" "struct archive *""'"); 
   }
   arg1 = (struct archive *)(argp1);
-  result = (int)archive_read_close(arg1);
+  {
+    Py_BEGIN_ALLOW_THREADS
+    result = (int)archive_read_close(arg1);
+    Py_END_ALLOW_THREADS
+  }
   resultobj = SWIG_From_int((int)(result));
   return resultobj;
 fail:
@@ -3635,7 +4722,11 @@ SWIGINTERN PyObject *_wrap_archive_read_next_header2(PyObject *SWIGUNUSEDPARM(se
     SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "archive_read_next_header2" "', argument " "2"" of type '" "struct archive_entry *""'"); 
   }
   arg2 = (struct archive_entry *)(argp2);
-  result = (int)archive_read_next_header2(arg1,arg2);
+  {
+    Py_BEGIN_ALLOW_THREADS
+    result = (int)archive_read_next_header2(arg1,arg2);
+    Py_END_ALLOW_THREADS
+  }
   resultobj = SWIG_From_int((int)(result));
   return resultobj;
 fail:
@@ -3689,76 +4780,292 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_archive_read_data_skip(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_archive_read_set_format_option(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   struct archive *arg1 = (struct archive *) 0 ;
+  char *arg2 = (char *) 0 ;
+  char *arg3 = (char *) 0 ;
+  char *arg4 = (char *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
+  int res2 ;
+  char *buf2 = 0 ;
+  int alloc2 = 0 ;
+  int res3 ;
+  char *buf3 = 0 ;
+  int alloc3 = 0 ;
+  int res4 ;
+  char *buf4 = 0 ;
+  int alloc4 = 0 ;
   PyObject * obj0 = 0 ;
+  PyObject * obj1 = 0 ;
+  PyObject * obj2 = 0 ;
+  PyObject * obj3 = 0 ;
   int result;
   
-  if (!PyArg_ParseTuple(args,(char *)"O:archive_read_data_skip",&obj0)) SWIG_fail;
+  if (!PyArg_ParseTuple(args,(char *)"OOOO:archive_read_set_format_option",&obj0,&obj1,&obj2,&obj3)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_archive, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "archive_read_data_skip" "', argument " "1"" of type '" "struct archive *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "archive_read_set_format_option" "', argument " "1"" of type '" "struct archive *""'"); 
   }
   arg1 = (struct archive *)(argp1);
-  result = (int)archive_read_data_skip(arg1);
+  res2 = SWIG_AsCharPtrAndSize(obj1, &buf2, NULL, &alloc2);
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "archive_read_set_format_option" "', argument " "2"" of type '" "char const *""'");
+  }
+  arg2 = (char *)(buf2);
+  res3 = SWIG_AsCharPtrAndSize(obj2, &buf3, NULL, &alloc3);
+  if (!SWIG_IsOK(res3)) {
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "archive_read_set_format_option" "', argument " "3"" of type '" "char const *""'");
+  }
+  arg3 = (char *)(buf3);
+  res4 = SWIG_AsCharPtrAndSize(obj3, &buf4, NULL, &alloc4);
+  if (!SWIG_IsOK(res4)) {
+    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "archive_read_set_format_option" "', argument " "4"" of type '" "char const *""'");
+  }
+  arg4 = (char *)(buf4);
+  result = (int)archive_read_set_format_option(arg1,(char const *)arg2,(char const *)arg3,(char const *)arg4);
   resultobj = SWIG_From_int((int)(result));
+  if (alloc2 == SWIG_NEWOBJ) free((char*)buf2);
+  if (alloc3 == SWIG_NEWOBJ) free((char*)buf3);
+  if (alloc4 == SWIG_NEWOBJ) free((char*)buf4);
   return resultobj;
 fail:
+  if (alloc2 == SWIG_NEWOBJ) free((char*)buf2);
+  if (alloc3 == SWIG_NEWOBJ) free((char*)buf3);
+  if (alloc4 == SWIG_NEWOBJ) free((char*)buf4);
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_archive_read_data_into_fd(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_archive_read_set_filter_option(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   struct archive *arg1 = (struct archive *) 0 ;
-  int arg2 ;
+  char *arg2 = (char *) 0 ;
+  char *arg3 = (char *) 0 ;
+  char *arg4 = (char *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  int val2 ;
-  int ecode2 = 0 ;
+  int res2 ;
+  char *buf2 = 0 ;
+  int alloc2 = 0 ;
+  int res3 ;
+  char *buf3 = 0 ;
+  int alloc3 = 0 ;
+  int res4 ;
+  char *buf4 = 0 ;
+  int alloc4 = 0 ;
   PyObject * obj0 = 0 ;
   PyObject * obj1 = 0 ;
+  PyObject * obj2 = 0 ;
+  PyObject * obj3 = 0 ;
   int result;
   
-  if (!PyArg_ParseTuple(args,(char *)"OO:archive_read_data_into_fd",&obj0,&obj1)) SWIG_fail;
+  if (!PyArg_ParseTuple(args,(char *)"OOOO:archive_read_set_filter_option",&obj0,&obj1,&obj2,&obj3)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_archive, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "archive_read_data_into_fd" "', argument " "1"" of type '" "struct archive *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "archive_read_set_filter_option" "', argument " "1"" of type '" "struct archive *""'"); 
   }
   arg1 = (struct archive *)(argp1);
-  ecode2 = SWIG_AsVal_int(obj1, &val2);
-  if (!SWIG_IsOK(ecode2)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "archive_read_data_into_fd" "', argument " "2"" of type '" "int""'");
-  } 
-  arg2 = (int)(val2);
-  result = (int)archive_read_data_into_fd(arg1,arg2);
+  res2 = SWIG_AsCharPtrAndSize(obj1, &buf2, NULL, &alloc2);
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "archive_read_set_filter_option" "', argument " "2"" of type '" "char const *""'");
+  }
+  arg2 = (char *)(buf2);
+  res3 = SWIG_AsCharPtrAndSize(obj2, &buf3, NULL, &alloc3);
+  if (!SWIG_IsOK(res3)) {
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "archive_read_set_filter_option" "', argument " "3"" of type '" "char const *""'");
+  }
+  arg3 = (char *)(buf3);
+  res4 = SWIG_AsCharPtrAndSize(obj3, &buf4, NULL, &alloc4);
+  if (!SWIG_IsOK(res4)) {
+    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "archive_read_set_filter_option" "', argument " "4"" of type '" "char const *""'");
+  }
+  arg4 = (char *)(buf4);
+  result = (int)archive_read_set_filter_option(arg1,(char const *)arg2,(char const *)arg3,(char const *)arg4);
   resultobj = SWIG_From_int((int)(result));
+  if (alloc2 == SWIG_NEWOBJ) free((char*)buf2);
+  if (alloc3 == SWIG_NEWOBJ) free((char*)buf3);
+  if (alloc4 == SWIG_NEWOBJ) free((char*)buf4);
   return resultobj;
 fail:
+  if (alloc2 == SWIG_NEWOBJ) free((char*)buf2);
+  if (alloc3 == SWIG_NEWOBJ) free((char*)buf3);
+  if (alloc4 == SWIG_NEWOBJ) free((char*)buf4);
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_archive_read_support_filter_all(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_archive_read_set_option(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   struct archive *arg1 = (struct archive *) 0 ;
+  char *arg2 = (char *) 0 ;
+  char *arg3 = (char *) 0 ;
+  char *arg4 = (char *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
+  int res2 ;
+  char *buf2 = 0 ;
+  int alloc2 = 0 ;
+  int res3 ;
+  char *buf3 = 0 ;
+  int alloc3 = 0 ;
+  int res4 ;
+  char *buf4 = 0 ;
+  int alloc4 = 0 ;
   PyObject * obj0 = 0 ;
+  PyObject * obj1 = 0 ;
+  PyObject * obj2 = 0 ;
+  PyObject * obj3 = 0 ;
   int result;
   
-  if (!PyArg_ParseTuple(args,(char *)"O:archive_read_support_filter_all",&obj0)) SWIG_fail;
+  if (!PyArg_ParseTuple(args,(char *)"OOOO:archive_read_set_option",&obj0,&obj1,&obj2,&obj3)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_archive, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "archive_read_support_filter_all" "', argument " "1"" of type '" "struct archive *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "archive_read_set_option" "', argument " "1"" of type '" "struct archive *""'"); 
   }
   arg1 = (struct archive *)(argp1);
-  result = (int)archive_read_support_filter_all(arg1);
-  resultobj = SWIG_From_int((int)(result));
-  return resultobj;
+  res2 = SWIG_AsCharPtrAndSize(obj1, &buf2, NULL, &alloc2);
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "archive_read_set_option" "', argument " "2"" of type '" "char const *""'");
+  }
+  arg2 = (char *)(buf2);
+  res3 = SWIG_AsCharPtrAndSize(obj2, &buf3, NULL, &alloc3);
+  if (!SWIG_IsOK(res3)) {
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "archive_read_set_option" "', argument " "3"" of type '" "char const *""'");
+  }
+  arg3 = (char *)(buf3);
+  res4 = SWIG_AsCharPtrAndSize(obj3, &buf4, NULL, &alloc4);
+  if (!SWIG_IsOK(res4)) {
+    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "archive_read_set_option" "', argument " "4"" of type '" "char const *""'");
+  }
+  arg4 = (char *)(buf4);
+  result = (int)archive_read_set_option(arg1,(char const *)arg2,(char const *)arg3,(char const *)arg4);
+  resultobj = SWIG_From_int((int)(result));
+  if (alloc2 == SWIG_NEWOBJ) free((char*)buf2);
+  if (alloc3 == SWIG_NEWOBJ) free((char*)buf3);
+  if (alloc4 == SWIG_NEWOBJ) free((char*)buf4);
+  return resultobj;
+fail:
+  if (alloc2 == SWIG_NEWOBJ) free((char*)buf2);
+  if (alloc3 == SWIG_NEWOBJ) free((char*)buf3);
+  if (alloc4 == SWIG_NEWOBJ) free((char*)buf4);
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_archive_read_set_options(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  struct archive *arg1 = (struct archive *) 0 ;
+  char *arg2 = (char *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  int res2 ;
+  char *buf2 = 0 ;
+  int alloc2 = 0 ;
+  PyObject * obj0 = 0 ;
+  PyObject * obj1 = 0 ;
+  int result;
+  
+  if (!PyArg_ParseTuple(args,(char *)"OO:archive_read_set_options",&obj0,&obj1)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_archive, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "archive_read_set_options" "', argument " "1"" of type '" "struct archive *""'"); 
+  }
+  arg1 = (struct archive *)(argp1);
+  res2 = SWIG_AsCharPtrAndSize(obj1, &buf2, NULL, &alloc2);
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "archive_read_set_options" "', argument " "2"" of type '" "char const *""'");
+  }
+  arg2 = (char *)(buf2);
+  result = (int)archive_read_set_options(arg1,(char const *)arg2);
+  resultobj = SWIG_From_int((int)(result));
+  if (alloc2 == SWIG_NEWOBJ) free((char*)buf2);
+  return resultobj;
+fail:
+  if (alloc2 == SWIG_NEWOBJ) free((char*)buf2);
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_archive_read_data_skip(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  struct archive *arg1 = (struct archive *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject * obj0 = 0 ;
+  int result;
+  
+  if (!PyArg_ParseTuple(args,(char *)"O:archive_read_data_skip",&obj0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_archive, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "archive_read_data_skip" "', argument " "1"" of type '" "struct archive *""'"); 
+  }
+  arg1 = (struct archive *)(argp1);
+  {
+    Py_BEGIN_ALLOW_THREADS
+    result = (int)archive_read_data_skip(arg1);
+    Py_END_ALLOW_THREADS
+  }
+  resultobj = SWIG_From_int((int)(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_archive_read_data_into_fd(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  struct archive *arg1 = (struct archive *) 0 ;
+  int arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  int val2 ;
+  int ecode2 = 0 ;
+  PyObject * obj0 = 0 ;
+  PyObject * obj1 = 0 ;
+  int result;
+  
+  if (!PyArg_ParseTuple(args,(char *)"OO:archive_read_data_into_fd",&obj0,&obj1)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_archive, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "archive_read_data_into_fd" "', argument " "1"" of type '" "struct archive *""'"); 
+  }
+  arg1 = (struct archive *)(argp1);
+  ecode2 = SWIG_AsVal_int(obj1, &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "archive_read_data_into_fd" "', argument " "2"" of type '" "int""'");
+  } 
+  arg2 = (int)(val2);
+  {
+    Py_BEGIN_ALLOW_THREADS
+    result = (int)archive_read_data_into_fd(arg1,arg2);
+    Py_END_ALLOW_THREADS
+  }
+  resultobj = SWIG_From_int((int)(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_archive_read_support_filter_all(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  struct archive *arg1 = (struct archive *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject * obj0 = 0 ;
+  int result;
+  
+  if (!PyArg_ParseTuple(args,(char *)"O:archive_read_support_filter_all",&obj0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_archive, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "archive_read_support_filter_all" "', argument " "1"" of type '" "struct archive *""'"); 
+  }
+  arg1 = (struct archive *)(argp1);
+  result = (int)archive_read_support_filter_all(arg1);
+  resultobj = SWIG_From_int((int)(result));
+  return resultobj;
 fail:
   return NULL;
 }
@@ -4297,7 +5604,11 @@ SWIGINTERN PyObject *_wrap_archive_write_free(PyObject *SWIGUNUSEDPARM(self), Py
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "archive_write_free" "', argument " "1"" of type '" "struct archive *""'"); 
   }
   arg1 = (struct archive *)(argp1);
-  result = (int)archive_write_free(arg1);
+  {
+    Py_BEGIN_ALLOW_THREADS
+    result = (int)archive_write_free(arg1);
+    Py_END_ALLOW_THREADS
+  }
   resultobj = SWIG_From_int((int)(result));
   return resultobj;
 fail:
@@ -4384,7 +5695,11 @@ SWIGINTERN PyObject *_wrap_archive_write_open_fd(PyObject *SWIGUNUSEDPARM(self),
     SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "archive_write_open_fd" "', argument " "2"" of type '" "int""'");
   } 
   arg2 = (int)(val2);
-  result = (int)archive_write_open_fd(arg1,arg2);
+  {
+    Py_BEGIN_ALLOW_THREADS
+    result = (int)archive_write_open_fd(arg1,arg2);
+    Py_END_ALLOW_THREADS
+  }
   resultobj = SWIG_From_int((int)(result));
   return resultobj;
 fail:
@@ -4416,7 +5731,11 @@ SWIGINTERN PyObject *_wrap_archive_write_open_filename(PyObject *SWIGUNUSEDPARM(
     SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "archive_write_open_filename" "', argument " "2"" of type '" "char const *""'");
   }
   arg2 = (char *)(buf2);
-  result = (int)archive_write_open_filename(arg1,(char const *)arg2);
+  {
+    Py_BEGIN_ALLOW_THREADS
+    result = (int)archive_write_open_filename(arg1,(char const *)arg2);
+    Py_END_ALLOW_THREADS
+  }
   resultobj = SWIG_From_int((int)(result));
   if (alloc2 == SWIG_NEWOBJ) free((char*)buf2);
   return resultobj;
@@ -4518,7 +5837,121 @@ SWIGINTERN PyObject *_wrap_archive_write_close(PyObject *SWIGUNUSEDPARM(self), P
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "archive_write_close" "', argument " "1"" of type '" "struct archive *""'"); 
   }
   arg1 = (struct archive *)(argp1);
-  result = (int)archive_write_close(arg1);
+  {
+    Py_BEGIN_ALLOW_THREADS
+    result = (int)archive_write_close(arg1);
+    Py_END_ALLOW_THREADS
+  }
+  resultobj = SWIG_From_int((int)(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_archive_write_disk_new(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  struct archive *result = 0 ;
+  
+  if (!PyArg_ParseTuple(args,(char *)":archive_write_disk_new")) SWIG_fail;
+  result = (struct archive *)archive_write_disk_new();
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_archive, 0 |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_archive_write_disk_set_options(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  struct archive *arg1 = (struct archive *) 0 ;
+  int arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  int val2 ;
+  int ecode2 = 0 ;
+  PyObject * obj0 = 0 ;
+  PyObject * obj1 = 0 ;
+  int result;
+  
+  if (!PyArg_ParseTuple(args,(char *)"OO:archive_write_disk_set_options",&obj0,&obj1)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_archive, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "archive_write_disk_set_options" "', argument " "1"" of type '" "struct archive *""'"); 
+  }
+  arg1 = (struct archive *)(argp1);
+  ecode2 = SWIG_AsVal_int(obj1, &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "archive_write_disk_set_options" "', argument " "2"" of type '" "int""'");
+  } 
+  arg2 = (int)(val2);
+  result = (int)archive_write_disk_set_options(arg1,arg2);
+  resultobj = SWIG_From_int((int)(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_archive_write_disk_set_standard_lookup(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  struct archive *arg1 = (struct archive *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject * obj0 = 0 ;
+  int result;
+  
+  if (!PyArg_ParseTuple(args,(char *)"O:archive_write_disk_set_standard_lookup",&obj0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_archive, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "archive_write_disk_set_standard_lookup" "', argument " "1"" of type '" "struct archive *""'"); 
+  }
+  arg1 = (struct archive *)(argp1);
+  result = (int)archive_write_disk_set_standard_lookup(arg1);
+  resultobj = SWIG_From_int((int)(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_archive_read_extract2(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  struct archive *arg1 = (struct archive *) 0 ;
+  struct archive_entry *arg2 = (struct archive_entry *) 0 ;
+  struct archive *arg3 = (struct archive *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  void *argp3 = 0 ;
+  int res3 = 0 ;
+  PyObject * obj0 = 0 ;
+  PyObject * obj1 = 0 ;
+  PyObject * obj2 = 0 ;
+  int result;
+  
+  if (!PyArg_ParseTuple(args,(char *)"OOO:archive_read_extract2",&obj0,&obj1,&obj2)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_archive, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "archive_read_extract2" "', argument " "1"" of type '" "struct archive *""'"); 
+  }
+  arg1 = (struct archive *)(argp1);
+  res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_archive_entry, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "archive_read_extract2" "', argument " "2"" of type '" "struct archive_entry *""'"); 
+  }
+  arg2 = (struct archive_entry *)(argp2);
+  res3 = SWIG_ConvertPtr(obj2, &argp3,SWIGTYPE_p_archive, 0 |  0 );
+  if (!SWIG_IsOK(res3)) {
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "archive_read_extract2" "', argument " "3"" of type '" "struct archive *""'"); 
+  }
+  arg3 = (struct archive *)(argp3);
+  {
+    Py_BEGIN_ALLOW_THREADS
+    result = (int)archive_read_extract2(arg1,arg2,arg3);
+    Py_END_ALLOW_THREADS
+  }
   resultobj = SWIG_From_int((int)(result));
   return resultobj;
 fail:
@@ -4549,7 +5982,11 @@ SWIGINTERN PyObject *_wrap_archive_write_header(PyObject *SWIGUNUSEDPARM(self),
     SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "archive_write_header" "', argument " "2"" of type '" "struct archive_entry *""'"); 
   }
   arg2 = (struct archive_entry *)(argp2);
-  result = (int)archive_write_header(arg1,arg2);
+  {
+    Py_BEGIN_ALLOW_THREADS
+    result = (int)archive_write_header(arg1,arg2);
+    Py_END_ALLOW_THREADS
+  }
   resultobj = SWIG_From_int((int)(result));
   return resultobj;
 fail:
@@ -4571,7 +6008,42 @@ SWIGINTERN PyObject *_wrap_archive_write_finish_entry(PyObject *SWIGUNUSEDPARM(s
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "archive_write_finish_entry" "', argument " "1"" of type '" "struct archive *""'"); 
   }
   arg1 = (struct archive *)(argp1);
-  result = (int)archive_write_finish_entry(arg1);
+  {
+    Py_BEGIN_ALLOW_THREADS
+    result = (int)archive_write_finish_entry(arg1);
+    Py_END_ALLOW_THREADS
+  }
+  resultobj = SWIG_From_int((int)(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_archive_write_add_filter(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  struct archive *arg1 = (struct archive *) 0 ;
+  int arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  int val2 ;
+  int ecode2 = 0 ;
+  PyObject * obj0 = 0 ;
+  PyObject * obj1 = 0 ;
+  int result;
+  
+  if (!PyArg_ParseTuple(args,(char *)"OO:archive_write_add_filter",&obj0,&obj1)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_archive, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "archive_write_add_filter" "', argument " "1"" of type '" "struct archive *""'"); 
+  }
+  arg1 = (struct archive *)(argp1);
+  ecode2 = SWIG_AsVal_int(obj1, &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "archive_write_add_filter" "', argument " "2"" of type '" "int""'");
+  } 
+  arg2 = (int)(val2);
+  result = (int)archive_write_add_filter(arg1,arg2);
   resultobj = SWIG_From_int((int)(result));
   return resultobj;
 fail:
@@ -4733,25 +6205,233 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_archive_write_set_format(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_archive_write_set_format_option(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   struct archive *arg1 = (struct archive *) 0 ;
-  int arg2 ;
+  char *arg2 = (char *) 0 ;
+  char *arg3 = (char *) 0 ;
+  char *arg4 = (char *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  int val2 ;
-  int ecode2 = 0 ;
+  int res2 ;
+  char *buf2 = 0 ;
+  int alloc2 = 0 ;
+  int res3 ;
+  char *buf3 = 0 ;
+  int alloc3 = 0 ;
+  int res4 ;
+  char *buf4 = 0 ;
+  int alloc4 = 0 ;
   PyObject * obj0 = 0 ;
   PyObject * obj1 = 0 ;
+  PyObject * obj2 = 0 ;
+  PyObject * obj3 = 0 ;
   int result;
   
-  if (!PyArg_ParseTuple(args,(char *)"OO:archive_write_set_format",&obj0,&obj1)) SWIG_fail;
+  if (!PyArg_ParseTuple(args,(char *)"OOOO:archive_write_set_format_option",&obj0,&obj1,&obj2,&obj3)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_archive, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "archive_write_set_format" "', argument " "1"" of type '" "struct archive *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "archive_write_set_format_option" "', argument " "1"" of type '" "struct archive *""'"); 
   }
   arg1 = (struct archive *)(argp1);
-  ecode2 = SWIG_AsVal_int(obj1, &val2);
+  res2 = SWIG_AsCharPtrAndSize(obj1, &buf2, NULL, &alloc2);
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "archive_write_set_format_option" "', argument " "2"" of type '" "char const *""'");
+  }
+  arg2 = (char *)(buf2);
+  res3 = SWIG_AsCharPtrAndSize(obj2, &buf3, NULL, &alloc3);
+  if (!SWIG_IsOK(res3)) {
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "archive_write_set_format_option" "', argument " "3"" of type '" "char const *""'");
+  }
+  arg3 = (char *)(buf3);
+  res4 = SWIG_AsCharPtrAndSize(obj3, &buf4, NULL, &alloc4);
+  if (!SWIG_IsOK(res4)) {
+    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "archive_write_set_format_option" "', argument " "4"" of type '" "char const *""'");
+  }
+  arg4 = (char *)(buf4);
+  result = (int)archive_write_set_format_option(arg1,(char const *)arg2,(char const *)arg3,(char const *)arg4);
+  resultobj = SWIG_From_int((int)(result));
+  if (alloc2 == SWIG_NEWOBJ) free((char*)buf2);
+  if (alloc3 == SWIG_NEWOBJ) free((char*)buf3);
+  if (alloc4 == SWIG_NEWOBJ) free((char*)buf4);
+  return resultobj;
+fail:
+  if (alloc2 == SWIG_NEWOBJ) free((char*)buf2);
+  if (alloc3 == SWIG_NEWOBJ) free((char*)buf3);
+  if (alloc4 == SWIG_NEWOBJ) free((char*)buf4);
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_archive_write_set_filter_option(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  struct archive *arg1 = (struct archive *) 0 ;
+  char *arg2 = (char *) 0 ;
+  char *arg3 = (char *) 0 ;
+  char *arg4 = (char *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  int res2 ;
+  char *buf2 = 0 ;
+  int alloc2 = 0 ;
+  int res3 ;
+  char *buf3 = 0 ;
+  int alloc3 = 0 ;
+  int res4 ;
+  char *buf4 = 0 ;
+  int alloc4 = 0 ;
+  PyObject * obj0 = 0 ;
+  PyObject * obj1 = 0 ;
+  PyObject * obj2 = 0 ;
+  PyObject * obj3 = 0 ;
+  int result;
+  
+  if (!PyArg_ParseTuple(args,(char *)"OOOO:archive_write_set_filter_option",&obj0,&obj1,&obj2,&obj3)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_archive, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "archive_write_set_filter_option" "', argument " "1"" of type '" "struct archive *""'"); 
+  }
+  arg1 = (struct archive *)(argp1);
+  res2 = SWIG_AsCharPtrAndSize(obj1, &buf2, NULL, &alloc2);
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "archive_write_set_filter_option" "', argument " "2"" of type '" "char const *""'");
+  }
+  arg2 = (char *)(buf2);
+  res3 = SWIG_AsCharPtrAndSize(obj2, &buf3, NULL, &alloc3);
+  if (!SWIG_IsOK(res3)) {
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "archive_write_set_filter_option" "', argument " "3"" of type '" "char const *""'");
+  }
+  arg3 = (char *)(buf3);
+  res4 = SWIG_AsCharPtrAndSize(obj3, &buf4, NULL, &alloc4);
+  if (!SWIG_IsOK(res4)) {
+    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "archive_write_set_filter_option" "', argument " "4"" of type '" "char const *""'");
+  }
+  arg4 = (char *)(buf4);
+  result = (int)archive_write_set_filter_option(arg1,(char const *)arg2,(char const *)arg3,(char const *)arg4);
+  resultobj = SWIG_From_int((int)(result));
+  if (alloc2 == SWIG_NEWOBJ) free((char*)buf2);
+  if (alloc3 == SWIG_NEWOBJ) free((char*)buf3);
+  if (alloc4 == SWIG_NEWOBJ) free((char*)buf4);
+  return resultobj;
+fail:
+  if (alloc2 == SWIG_NEWOBJ) free((char*)buf2);
+  if (alloc3 == SWIG_NEWOBJ) free((char*)buf3);
+  if (alloc4 == SWIG_NEWOBJ) free((char*)buf4);
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_archive_write_set_option(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  struct archive *arg1 = (struct archive *) 0 ;
+  char *arg2 = (char *) 0 ;
+  char *arg3 = (char *) 0 ;
+  char *arg4 = (char *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  int res2 ;
+  char *buf2 = 0 ;
+  int alloc2 = 0 ;
+  int res3 ;
+  char *buf3 = 0 ;
+  int alloc3 = 0 ;
+  int res4 ;
+  char *buf4 = 0 ;
+  int alloc4 = 0 ;
+  PyObject * obj0 = 0 ;
+  PyObject * obj1 = 0 ;
+  PyObject * obj2 = 0 ;
+  PyObject * obj3 = 0 ;
+  int result;
+  
+  if (!PyArg_ParseTuple(args,(char *)"OOOO:archive_write_set_option",&obj0,&obj1,&obj2,&obj3)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_archive, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "archive_write_set_option" "', argument " "1"" of type '" "struct archive *""'"); 
+  }
+  arg1 = (struct archive *)(argp1);
+  res2 = SWIG_AsCharPtrAndSize(obj1, &buf2, NULL, &alloc2);
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "archive_write_set_option" "', argument " "2"" of type '" "char const *""'");
+  }
+  arg2 = (char *)(buf2);
+  res3 = SWIG_AsCharPtrAndSize(obj2, &buf3, NULL, &alloc3);
+  if (!SWIG_IsOK(res3)) {
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "archive_write_set_option" "', argument " "3"" of type '" "char const *""'");
+  }
+  arg3 = (char *)(buf3);
+  res4 = SWIG_AsCharPtrAndSize(obj3, &buf4, NULL, &alloc4);
+  if (!SWIG_IsOK(res4)) {
+    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "archive_write_set_option" "', argument " "4"" of type '" "char const *""'");
+  }
+  arg4 = (char *)(buf4);
+  result = (int)archive_write_set_option(arg1,(char const *)arg2,(char const *)arg3,(char const *)arg4);
+  resultobj = SWIG_From_int((int)(result));
+  if (alloc2 == SWIG_NEWOBJ) free((char*)buf2);
+  if (alloc3 == SWIG_NEWOBJ) free((char*)buf3);
+  if (alloc4 == SWIG_NEWOBJ) free((char*)buf4);
+  return resultobj;
+fail:
+  if (alloc2 == SWIG_NEWOBJ) free((char*)buf2);
+  if (alloc3 == SWIG_NEWOBJ) free((char*)buf3);
+  if (alloc4 == SWIG_NEWOBJ) free((char*)buf4);
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_archive_write_set_options(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  struct archive *arg1 = (struct archive *) 0 ;
+  char *arg2 = (char *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  int res2 ;
+  char *buf2 = 0 ;
+  int alloc2 = 0 ;
+  PyObject * obj0 = 0 ;
+  PyObject * obj1 = 0 ;
+  int result;
+  
+  if (!PyArg_ParseTuple(args,(char *)"OO:archive_write_set_options",&obj0,&obj1)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_archive, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "archive_write_set_options" "', argument " "1"" of type '" "struct archive *""'"); 
+  }
+  arg1 = (struct archive *)(argp1);
+  res2 = SWIG_AsCharPtrAndSize(obj1, &buf2, NULL, &alloc2);
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "archive_write_set_options" "', argument " "2"" of type '" "char const *""'");
+  }
+  arg2 = (char *)(buf2);
+  result = (int)archive_write_set_options(arg1,(char const *)arg2);
+  resultobj = SWIG_From_int((int)(result));
+  if (alloc2 == SWIG_NEWOBJ) free((char*)buf2);
+  return resultobj;
+fail:
+  if (alloc2 == SWIG_NEWOBJ) free((char*)buf2);
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_archive_write_set_format(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  struct archive *arg1 = (struct archive *) 0 ;
+  int arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  int val2 ;
+  int ecode2 = 0 ;
+  PyObject * obj0 = 0 ;
+  PyObject * obj1 = 0 ;
+  int result;
+  
+  if (!PyArg_ParseTuple(args,(char *)"OO:archive_write_set_format",&obj0,&obj1)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_archive, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "archive_write_set_format" "', argument " "1"" of type '" "struct archive *""'"); 
+  }
+  arg1 = (struct archive *)(argp1);
+  ecode2 = SWIG_AsVal_int(obj1, &val2);
   if (!SWIG_IsOK(ecode2)) {
     SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "archive_write_set_format" "', argument " "2"" of type '" "int""'");
   } 
@@ -5254,6 +6934,28 @@ fail:
 }
 
 
+SWIGINTERN PyObject *_wrap_archive_entry_sparse_count(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  struct archive_entry *arg1 = (struct archive_entry *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject * obj0 = 0 ;
+  int result;
+  
+  if (!PyArg_ParseTuple(args,(char *)"O:archive_entry_sparse_count",&obj0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_archive_entry, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "archive_entry_sparse_count" "', argument " "1"" of type '" "struct archive_entry *""'"); 
+  }
+  arg1 = (struct archive_entry *)(argp1);
+  result = (int)archive_entry_sparse_count(arg1);
+  resultobj = SWIG_From_int((int)(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
 SWIGINTERN PyObject *_wrap_archive_entry_set_pathname(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   struct archive_entry *arg1 = (struct archive_entry *) 0 ;
@@ -5271,14 +6973,469 @@ SWIGINTERN PyObject *_wrap_archive_entry_set_pathname(PyObject *SWIGUNUSEDPARM(s
   if (!SWIG_IsOK(res1)) {
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "archive_entry_set_pathname" "', argument " "1"" of type '" "struct archive_entry *""'"); 
   }
-  arg1 = (struct archive_entry *)(argp1);
+  arg1 = (struct archive_entry *)(argp1);
+  res2 = SWIG_AsCharPtrAndSize(obj1, &buf2, NULL, &alloc2);
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "archive_entry_set_pathname" "', argument " "2"" of type '" "char const *""'");
+  }
+  arg2 = (char *)(buf2);
+  archive_entry_set_pathname(arg1,(char const *)arg2);
+  resultobj = SWIG_Py_Void();
+  if (alloc2 == SWIG_NEWOBJ) free((char*)buf2);
+  return resultobj;
+fail:
+  if (alloc2 == SWIG_NEWOBJ) free((char*)buf2);
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_archive_entry_set_size(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  struct archive_entry *arg1 = (struct archive_entry *) 0 ;
+  int64_t arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject * obj0 = 0 ;
+  PyObject * obj1 = 0 ;
+  
+  if (!PyArg_ParseTuple(args,(char *)"OO:archive_entry_set_size",&obj0,&obj1)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_archive_entry, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "archive_entry_set_size" "', argument " "1"" of type '" "struct archive_entry *""'"); 
+  }
+  arg1 = (struct archive_entry *)(argp1);
+  {
+    if (PyLong_Check(obj1))
+    arg2 = (int64_t) PyLong_AsLong(obj1);
+    else if (PyInt_Check(obj1))
+    arg2 = (int64_t) PyInt_AsLong(obj1);
+    else if (PyFloat_Check(obj1))
+    arg2 = (int64_t) PyFloat_AsDouble(obj1);
+    else {
+      PyErr_SetString(PyExc_TypeError,"Expected a large number");
+      return NULL;
+    }
+  }
+  archive_entry_set_size(arg1,arg2);
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_archive_entry_set_mtime(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  struct archive_entry *arg1 = (struct archive_entry *) 0 ;
+  time_t arg2 ;
+  long arg3 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  long val3 ;
+  int ecode3 = 0 ;
+  PyObject * obj0 = 0 ;
+  PyObject * obj1 = 0 ;
+  PyObject * obj2 = 0 ;
+  
+  if (!PyArg_ParseTuple(args,(char *)"OOO:archive_entry_set_mtime",&obj0,&obj1,&obj2)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_archive_entry, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "archive_entry_set_mtime" "', argument " "1"" of type '" "struct archive_entry *""'"); 
+  }
+  arg1 = (struct archive_entry *)(argp1);
+  {
+    if (PyLong_Check(obj1))
+    arg2 = (time_t) PyLong_AsLong(obj1);
+    else if (PyInt_Check(obj1))
+    arg2 = (time_t) PyInt_AsLong(obj1);
+    else if (PyFloat_Check(obj1))
+    arg2 = (time_t) PyFloat_AsDouble(obj1);
+    else {
+      PyErr_SetString(PyExc_TypeError,"Expected a large number");
+      return NULL;
+    }
+  }
+  ecode3 = SWIG_AsVal_long(obj2, &val3);
+  if (!SWIG_IsOK(ecode3)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "archive_entry_set_mtime" "', argument " "3"" of type '" "long""'");
+  } 
+  arg3 = (long)(val3);
+  archive_entry_set_mtime(arg1,arg2,arg3);
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_archive_entry_set_filetype(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  struct archive_entry *arg1 = (struct archive_entry *) 0 ;
+  unsigned int arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  unsigned int val2 ;
+  int ecode2 = 0 ;
+  PyObject * obj0 = 0 ;
+  PyObject * obj1 = 0 ;
+  
+  if (!PyArg_ParseTuple(args,(char *)"OO:archive_entry_set_filetype",&obj0,&obj1)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_archive_entry, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "archive_entry_set_filetype" "', argument " "1"" of type '" "struct archive_entry *""'"); 
+  }
+  arg1 = (struct archive_entry *)(argp1);
+  ecode2 = SWIG_AsVal_unsigned_SS_int(obj1, &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "archive_entry_set_filetype" "', argument " "2"" of type '" "unsigned int""'");
+  } 
+  arg2 = (unsigned int)(val2);
+  archive_entry_set_filetype(arg1,arg2);
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_archive_entry_set_perm(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  struct archive_entry *arg1 = (struct archive_entry *) 0 ;
+  mode_t arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  unsigned short val2 ;
+  int ecode2 = 0 ;
+  PyObject * obj0 = 0 ;
+  PyObject * obj1 = 0 ;
+  
+  if (!PyArg_ParseTuple(args,(char *)"OO:archive_entry_set_perm",&obj0,&obj1)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_archive_entry, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "archive_entry_set_perm" "', argument " "1"" of type '" "struct archive_entry *""'"); 
+  }
+  arg1 = (struct archive_entry *)(argp1);
+  ecode2 = SWIG_AsVal_unsigned_SS_short(obj1, &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "archive_entry_set_perm" "', argument " "2"" of type '" "mode_t""'");
+  } 
+  arg2 = (mode_t)(val2);
+  archive_entry_set_perm(arg1,arg2);
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_archive_filter_bytes(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  struct archive *arg1 = (struct archive *) 0 ;
+  int arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  int val2 ;
+  int ecode2 = 0 ;
+  PyObject * obj0 = 0 ;
+  PyObject * obj1 = 0 ;
+  int64_t result;
+  
+  if (!PyArg_ParseTuple(args,(char *)"OO:archive_filter_bytes",&obj0,&obj1)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_archive, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "archive_filter_bytes" "', argument " "1"" of type '" "struct archive *""'"); 
+  }
+  arg1 = (struct archive *)(argp1);
+  ecode2 = SWIG_AsVal_int(obj1, &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "archive_filter_bytes" "', argument " "2"" of type '" "int""'");
+  } 
+  arg2 = (int)(val2);
+  result = archive_filter_bytes(arg1,arg2);
+  {
+    resultobj = PyLong_FromLong((long)result);
+  }
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_archive_filter_code(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  struct archive *arg1 = (struct archive *) 0 ;
+  int arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  int val2 ;
+  int ecode2 = 0 ;
+  PyObject * obj0 = 0 ;
+  PyObject * obj1 = 0 ;
+  int result;
+  
+  if (!PyArg_ParseTuple(args,(char *)"OO:archive_filter_code",&obj0,&obj1)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_archive, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "archive_filter_code" "', argument " "1"" of type '" "struct archive *""'"); 
+  }
+  arg1 = (struct archive *)(argp1);
+  ecode2 = SWIG_AsVal_int(obj1, &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "archive_filter_code" "', argument " "2"" of type '" "int""'");
+  } 
+  arg2 = (int)(val2);
+  result = (int)archive_filter_code(arg1,arg2);
+  resultobj = SWIG_From_int((int)(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_archive_filter_count(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  struct archive *arg1 = (struct archive *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject * obj0 = 0 ;
+  int result;
+  
+  if (!PyArg_ParseTuple(args,(char *)"O:archive_filter_count",&obj0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_archive, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "archive_filter_count" "', argument " "1"" of type '" "struct archive *""'"); 
+  }
+  arg1 = (struct archive *)(argp1);
+  result = (int)archive_filter_count(arg1);
+  resultobj = SWIG_From_int((int)(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_archive_errno(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  struct archive *arg1 = (struct archive *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject * obj0 = 0 ;
+  int result;
+  
+  if (!PyArg_ParseTuple(args,(char *)"O:archive_errno",&obj0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_archive, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "archive_errno" "', argument " "1"" of type '" "struct archive *""'"); 
+  }
+  arg1 = (struct archive *)(argp1);
+  result = (int)archive_errno(arg1);
+  resultobj = SWIG_From_int((int)(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_archive_error_string(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  struct archive *arg1 = (struct archive *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject * obj0 = 0 ;
+  char *result = 0 ;
+  
+  if (!PyArg_ParseTuple(args,(char *)"O:archive_error_string",&obj0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_archive, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "archive_error_string" "', argument " "1"" of type '" "struct archive *""'"); 
+  }
+  arg1 = (struct archive *)(argp1);
+  result = (char *)archive_error_string(arg1);
+  resultobj = SWIG_FromCharPtr((const char *)result);
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_archive_read_data_into_str(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  struct archive *arg1 = (struct archive *) 0 ;
+  int arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  int val2 ;
+  int ecode2 = 0 ;
+  PyObject * obj0 = 0 ;
+  PyObject * obj1 = 0 ;
+  PyObject *result = 0 ;
+  
+  if (!PyArg_ParseTuple(args,(char *)"OO:archive_read_data_into_str",&obj0,&obj1)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_archive, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "archive_read_data_into_str" "', argument " "1"" of type '" "struct archive *""'"); 
+  }
+  arg1 = (struct archive *)(argp1);
+  ecode2 = SWIG_AsVal_int(obj1, &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "archive_read_data_into_str" "', argument " "2"" of type '" "int""'");
+  } 
+  arg2 = (int)(val2);
+  result = (PyObject *)archive_read_data_into_str(arg1,arg2);
+  resultobj = result;
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_archive_read_data_into_buffer(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  struct archive *arg1 = (struct archive *) 0 ;
+  PyObject *arg2 = (PyObject *) 0 ;
+  int arg3 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  int val3 ;
+  int ecode3 = 0 ;
+  PyObject * obj0 = 0 ;
+  PyObject * obj1 = 0 ;
+  PyObject * obj2 = 0 ;
+  PyObject *result = 0 ;
+  
+  if (!PyArg_ParseTuple(args,(char *)"OOO:archive_read_data_into_buffer",&obj0,&obj1,&obj2)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_archive, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "archive_read_data_into_buffer" "', argument " "1"" of type '" "struct archive *""'"); 
+  }
+  arg1 = (struct archive *)(argp1);
+  arg2 = obj1;
+  ecode3 = SWIG_AsVal_int(obj2, &val3);
+  if (!SWIG_IsOK(ecode3)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "archive_read_data_into_buffer" "', argument " "3"" of type '" "int""'");
+  } 
+  arg3 = (int)(val3);
+  result = (PyObject *)archive_read_data_into_buffer(arg1,arg2,arg3);
+  resultobj = result;
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_archive_read_data_block_into_view(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  struct archive *arg1 = (struct archive *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject * obj0 = 0 ;
+  PyObject *result = 0 ;
+  
+  if (!PyArg_ParseTuple(args,(char *)"O:archive_read_data_block_into_view",&obj0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_archive, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "archive_read_data_block_into_view" "', argument " "1"" of type '" "struct archive *""'"); 
+  }
+  arg1 = (struct archive *)(argp1);
+  result = (PyObject *)archive_read_data_block_into_view(arg1);
+  resultobj = result;
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_archive_read_next_header_fields(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  struct archive *arg1 = (struct archive *) 0 ;
+  struct archive_entry *arg2 = (struct archive_entry *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  PyObject * obj0 = 0 ;
+  PyObject * obj1 = 0 ;
+  PyObject *result = 0 ;
+  
+  if (!PyArg_ParseTuple(args,(char *)"OO:archive_read_next_header_fields",&obj0,&obj1)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_archive, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "archive_read_next_header_fields" "', argument " "1"" of type '" "struct archive *""'"); 
+  }
+  arg1 = (struct archive *)(argp1);
+  res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_archive_entry, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "archive_read_next_header_fields" "', argument " "2"" of type '" "struct archive_entry *""'"); 
+  }
+  arg2 = (struct archive_entry *)(argp2);
+  result = (PyObject *)archive_read_next_header_fields(arg1,arg2);
+  resultobj = result;
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_archive_write_data_from_str(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  struct archive *arg1 = (struct archive *) 0 ;
+  PyObject *arg2 = (PyObject *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject * obj0 = 0 ;
+  PyObject * obj1 = 0 ;
+  PyObject *result = 0 ;
+  
+  if (!PyArg_ParseTuple(args,(char *)"OO:archive_write_data_from_str",&obj0,&obj1)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_archive, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "archive_write_data_from_str" "', argument " "1"" of type '" "struct archive *""'"); 
+  }
+  arg1 = (struct archive *)(argp1);
+  arg2 = obj1;
+  result = (PyObject *)archive_write_data_from_str(arg1,arg2);
+  resultobj = result;
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_archive_read_extract_all(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  struct archive *arg1 = (struct archive *) 0 ;
+  char *arg2 = (char *) 0 ;
+  int arg3 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  int res2 ;
+  char *buf2 = 0 ;
+  int alloc2 = 0 ;
+  int val3 ;
+  int ecode3 = 0 ;
+  PyObject * obj0 = 0 ;
+  PyObject * obj1 = 0 ;
+  PyObject * obj2 = 0 ;
+  PyObject *result = 0 ;
+  
+  if (!PyArg_ParseTuple(args,(char *)"OOO:archive_read_extract_all",&obj0,&obj1,&obj2)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_archive, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "archive_read_extract_all" "', argument " "1"" of type '" "struct archive *""'"); 
+  }
+  arg1 = (struct archive *)(argp1);
   res2 = SWIG_AsCharPtrAndSize(obj1, &buf2, NULL, &alloc2);
   if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "archive_entry_set_pathname" "', argument " "2"" of type '" "char const *""'");
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "archive_read_extract_all" "', argument " "2"" of type '" "char const *""'");
   }
   arg2 = (char *)(buf2);
-  archive_entry_set_pathname(arg1,(char const *)arg2);
-  resultobj = SWIG_Py_Void();
+  ecode3 = SWIG_AsVal_int(obj2, &val3);
+  if (!SWIG_IsOK(ecode3)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "archive_read_extract_all" "', argument " "3"" of type '" "int""'");
+  } 
+  arg3 = (int)(val3);
+  result = (PyObject *)archive_read_extract_all(arg1,(char const *)arg2,arg3);
+  resultobj = result;
   if (alloc2 == SWIG_NEWOBJ) free((char*)buf2);
   return resultobj;
 fail:
@@ -5287,238 +7444,392 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_archive_entry_set_size(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_archive_write_data_from_fd(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
-  struct archive_entry *arg1 = (struct archive_entry *) 0 ;
-  int64_t arg2 ;
+  struct archive *arg1 = (struct archive *) 0 ;
+  int arg2 ;
+  int64_t arg3 ;
+  int arg4 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
+  int val2 ;
+  int ecode2 = 0 ;
+  int val4 ;
+  int ecode4 = 0 ;
   PyObject * obj0 = 0 ;
   PyObject * obj1 = 0 ;
+  PyObject * obj2 = 0 ;
+  PyObject * obj3 = 0 ;
+  PyObject *result = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OO:archive_entry_set_size",&obj0,&obj1)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_archive_entry, 0 |  0 );
+  if (!PyArg_ParseTuple(args,(char *)"OOOO:archive_write_data_from_fd",&obj0,&obj1,&obj2,&obj3)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_archive, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "archive_entry_set_size" "', argument " "1"" of type '" "struct archive_entry *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "archive_write_data_from_fd" "', argument " "1"" of type '" "struct archive *""'"); 
   }
-  arg1 = (struct archive_entry *)(argp1);
+  arg1 = (struct archive *)(argp1);
+  ecode2 = SWIG_AsVal_int(obj1, &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "archive_write_data_from_fd" "', argument " "2"" of type '" "int""'");
+  } 
+  arg2 = (int)(val2);
   {
-    if (PyLong_Check(obj1))
-    arg2 = (int64_t) PyLong_AsLong(obj1);
-    else if (PyInt_Check(obj1))
-    arg2 = (int64_t) PyInt_AsLong(obj1);
-    else if (PyFloat_Check(obj1))
-    arg2 = (int64_t) PyFloat_AsDouble(obj1);
+    if (PyLong_Check(obj2))
+    arg3 = (int64_t) PyLong_AsLong(obj2);
+    else if (PyInt_Check(obj2))
+    arg3 = (int64_t) PyInt_AsLong(obj2);
+    else if (PyFloat_Check(obj2))
+    arg3 = (int64_t) PyFloat_AsDouble(obj2);
     else {
       PyErr_SetString(PyExc_TypeError,"Expected a large number");
       return NULL;
     }
   }
-  archive_entry_set_size(arg1,arg2);
-  resultobj = SWIG_Py_Void();
+  ecode4 = SWIG_AsVal_int(obj3, &val4);
+  if (!SWIG_IsOK(ecode4)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode4), "in method '" "archive_write_data_from_fd" "', argument " "4"" of type '" "int""'");
+  } 
+  arg4 = (int)(val4);
+  result = (PyObject *)archive_write_data_from_fd(arg1,arg2,arg3,arg4);
+  resultobj = result;
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_archive_entry_set_mtime(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_archive_read_open_pyobject(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
-  struct archive_entry *arg1 = (struct archive_entry *) 0 ;
-  time_t arg2 ;
-  long arg3 ;
+  struct archive *arg1 = (struct archive *) 0 ;
+  PyObject *arg2 = (PyObject *) 0 ;
+  int arg3 ;
+  int arg4 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  long val3 ;
+  int val3 ;
   int ecode3 = 0 ;
+  int val4 ;
+  int ecode4 = 0 ;
   PyObject * obj0 = 0 ;
   PyObject * obj1 = 0 ;
   PyObject * obj2 = 0 ;
+  PyObject * obj3 = 0 ;
+  int result;
   
-  if (!PyArg_ParseTuple(args,(char *)"OOO:archive_entry_set_mtime",&obj0,&obj1,&obj2)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_archive_entry, 0 |  0 );
+  if (!PyArg_ParseTuple(args,(char *)"OOOO:archive_read_open_pyobject",&obj0,&obj1,&obj2,&obj3)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_archive, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "archive_entry_set_mtime" "', argument " "1"" of type '" "struct archive_entry *""'"); 
-  }
-  arg1 = (struct archive_entry *)(argp1);
-  {
-    if (PyLong_Check(obj1))
-    arg2 = (time_t) PyLong_AsLong(obj1);
-    else if (PyInt_Check(obj1))
-    arg2 = (time_t) PyInt_AsLong(obj1);
-    else if (PyFloat_Check(obj1))
-    arg2 = (time_t) PyFloat_AsDouble(obj1);
-    else {
-      PyErr_SetString(PyExc_TypeError,"Expected a large number");
-      return NULL;
-    }
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "archive_read_open_pyobject" "', argument " "1"" of type '" "struct archive *""'"); 
   }
-  ecode3 = SWIG_AsVal_long(obj2, &val3);
+  arg1 = (struct archive *)(argp1);
+  arg2 = obj1;
+  ecode3 = SWIG_AsVal_int(obj2, &val3);
   if (!SWIG_IsOK(ecode3)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "archive_entry_set_mtime" "', argument " "3"" of type '" "long""'");
+    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "archive_read_open_pyobject" "', argument " "3"" of type '" "int""'");
   } 
-  arg3 = (long)(val3);
-  archive_entry_set_mtime(arg1,arg2,arg3);
-  resultobj = SWIG_Py_Void();
+  arg3 = (int)(val3);
+  ecode4 = SWIG_AsVal_int(obj3, &val4);
+  if (!SWIG_IsOK(ecode4)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode4), "in method '" "archive_read_open_pyobject" "', argument " "4"" of type '" "int""'");
+  } 
+  arg4 = (int)(val4);
+  result = (int)archive_read_open_pyobject(arg1,arg2,arg3,arg4);
+  resultobj = SWIG_From_int((int)(result));
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_archive_entry_set_filetype(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_archive_write_open_pyobject(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
-  struct archive_entry *arg1 = (struct archive_entry *) 0 ;
-  unsigned int arg2 ;
+  struct archive *arg1 = (struct archive *) 0 ;
+  PyObject *arg2 = (PyObject *) 0 ;
+  int arg3 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  unsigned int val2 ;
-  int ecode2 = 0 ;
+  int val3 ;
+  int ecode3 = 0 ;
   PyObject * obj0 = 0 ;
   PyObject * obj1 = 0 ;
+  PyObject * obj2 = 0 ;
+  int result;
   
-  if (!PyArg_ParseTuple(args,(char *)"OO:archive_entry_set_filetype",&obj0,&obj1)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_archive_entry, 0 |  0 );
+  if (!PyArg_ParseTuple(args,(char *)"OOO:archive_write_open_pyobject",&obj0,&obj1,&obj2)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_archive, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "archive_entry_set_filetype" "', argument " "1"" of type '" "struct archive_entry *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "archive_write_open_pyobject" "', argument " "1"" of type '" "struct archive *""'"); 
   }
-  arg1 = (struct archive_entry *)(argp1);
-  ecode2 = SWIG_AsVal_unsigned_SS_int(obj1, &val2);
-  if (!SWIG_IsOK(ecode2)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "archive_entry_set_filetype" "', argument " "2"" of type '" "unsigned int""'");
+  arg1 = (struct archive *)(argp1);
+  arg2 = obj1;
+  ecode3 = SWIG_AsVal_int(obj2, &val3);
+  if (!SWIG_IsOK(ecode3)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "archive_write_open_pyobject" "', argument " "3"" of type '" "int""'");
   } 
-  arg2 = (unsigned int)(val2);
-  archive_entry_set_filetype(arg1,arg2);
-  resultobj = SWIG_Py_Void();
+  arg3 = (int)(val3);
+  result = (int)archive_write_open_pyobject(arg1,arg2,arg3);
+  resultobj = SWIG_From_int((int)(result));
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_archive_entry_set_perm(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_archive_read_open_pybuffer(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
-  struct archive_entry *arg1 = (struct archive_entry *) 0 ;
-  mode_t arg2 ;
+  struct archive *arg1 = (struct archive *) 0 ;
+  PyObject *arg2 = (PyObject *) 0 ;
+  size_t arg3 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  unsigned short val2 ;
-  int ecode2 = 0 ;
+  size_t val3 ;
+  int ecode3 = 0 ;
   PyObject * obj0 = 0 ;
   PyObject * obj1 = 0 ;
+  PyObject * obj2 = 0 ;
+  int result;
   
-  if (!PyArg_ParseTuple(args,(char *)"OO:archive_entry_set_perm",&obj0,&obj1)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_archive_entry, 0 |  0 );
+  if (!PyArg_ParseTuple(args,(char *)"OOO:archive_read_open_pybuffer",&obj0,&obj1,&obj2)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_archive, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "archive_entry_set_perm" "', argument " "1"" of type '" "struct archive_entry *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "archive_read_open_pybuffer" "', argument " "1"" of type '" "struct archive *""'"); 
   }
-  arg1 = (struct archive_entry *)(argp1);
-  ecode2 = SWIG_AsVal_unsigned_SS_short(obj1, &val2);
-  if (!SWIG_IsOK(ecode2)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "archive_entry_set_perm" "', argument " "2"" of type '" "mode_t""'");
+  arg1 = (struct archive *)(argp1);
+  arg2 = obj1;
+  ecode3 = SWIG_AsVal_size_t(obj2, &val3);
+  if (!SWIG_IsOK(ecode3)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "archive_read_open_pybuffer" "', argument " "3"" of type '" "size_t""'");
   } 
-  arg2 = (mode_t)(val2);
-  archive_entry_set_perm(arg1,arg2);
-  resultobj = SWIG_Py_Void();
+  arg3 = (size_t)(val3);
+  result = (int)archive_read_open_pybuffer(arg1,arg2,arg3);
+  resultobj = SWIG_From_int((int)(result));
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_archive_errno(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_membuf_new(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
-  struct archive *arg1 = (struct archive *) 0 ;
+  struct membuf *result = 0 ;
+  
+  if (!PyArg_ParseTuple(args,(char *)":membuf_new")) SWIG_fail;
+  result = (struct membuf *)membuf_new();
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_membuf, 0 |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_membuf_free(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  struct membuf *arg1 = (struct membuf *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   PyObject * obj0 = 0 ;
-  int result;
   
-  if (!PyArg_ParseTuple(args,(char *)"O:archive_errno",&obj0)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_archive, 0 |  0 );
+  if (!PyArg_ParseTuple(args,(char *)"O:membuf_free",&obj0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_membuf, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "archive_errno" "', argument " "1"" of type '" "struct archive *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "membuf_free" "', argument " "1"" of type '" "struct membuf *""'"); 
   }
-  arg1 = (struct archive *)(argp1);
-  result = (int)archive_errno(arg1);
-  resultobj = SWIG_From_int((int)(result));
+  arg1 = (struct membuf *)(argp1);
+  membuf_free(arg1);
+  resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_archive_error_string(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_membuf_to_str(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
-  struct archive *arg1 = (struct archive *) 0 ;
+  struct membuf *arg1 = (struct membuf *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   PyObject * obj0 = 0 ;
-  char *result = 0 ;
+  PyObject *result = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)"O:archive_error_string",&obj0)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_archive, 0 |  0 );
+  if (!PyArg_ParseTuple(args,(char *)"O:membuf_to_str",&obj0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_membuf, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "archive_error_string" "', argument " "1"" of type '" "struct archive *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "membuf_to_str" "', argument " "1"" of type '" "struct membuf *""'"); 
   }
-  arg1 = (struct archive *)(argp1);
-  result = (char *)archive_error_string(arg1);
-  resultobj = SWIG_FromCharPtr((const char *)result);
+  arg1 = (struct membuf *)(argp1);
+  result = (PyObject *)membuf_to_str(arg1);
+  resultobj = result;
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_archive_read_data_into_str(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_archive_write_open_membuf(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   struct archive *arg1 = (struct archive *) 0 ;
-  int arg2 ;
+  struct membuf *arg2 = (struct membuf *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  int val2 ;
-  int ecode2 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
   PyObject * obj0 = 0 ;
   PyObject * obj1 = 0 ;
-  PyObject *result = 0 ;
+  int result;
   
-  if (!PyArg_ParseTuple(args,(char *)"OO:archive_read_data_into_str",&obj0,&obj1)) SWIG_fail;
+  if (!PyArg_ParseTuple(args,(char *)"OO:archive_write_open_membuf",&obj0,&obj1)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_archive, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "archive_read_data_into_str" "', argument " "1"" of type '" "struct archive *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "archive_write_open_membuf" "', argument " "1"" of type '" "struct archive *""'"); 
   }
   arg1 = (struct archive *)(argp1);
-  ecode2 = SWIG_AsVal_int(obj1, &val2);
+  res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_membuf, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "archive_write_open_membuf" "', argument " "2"" of type '" "struct membuf *""'"); 
+  }
+  arg2 = (struct membuf *)(argp2);
+  result = (int)archive_write_open_membuf(arg1,arg2);
+  resultobj = SWIG_From_int((int)(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_fadvise(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  int arg1 ;
+  long long arg2 ;
+  long long arg3 ;
+  int arg4 ;
+  int val1 ;
+  int ecode1 = 0 ;
+  long long val2 ;
+  int ecode2 = 0 ;
+  long long val3 ;
+  int ecode3 = 0 ;
+  int val4 ;
+  int ecode4 = 0 ;
+  PyObject * obj0 = 0 ;
+  PyObject * obj1 = 0 ;
+  PyObject * obj2 = 0 ;
+  PyObject * obj3 = 0 ;
+  int result;
+  
+  if (!PyArg_ParseTuple(args,(char *)"OOOO:fadvise",&obj0,&obj1,&obj2,&obj3)) SWIG_fail;
+  ecode1 = SWIG_AsVal_int(obj0, &val1);
+  if (!SWIG_IsOK(ecode1)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode1), "in method '" "fadvise" "', argument " "1"" of type '" "int""'");
+  } 
+  arg1 = (int)(val1);
+  ecode2 = SWIG_AsVal_long_SS_long(obj1, &val2);
   if (!SWIG_IsOK(ecode2)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "archive_read_data_into_str" "', argument " "2"" of type '" "int""'");
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "fadvise" "', argument " "2"" of type '" "long long""'");
   } 
-  arg2 = (int)(val2);
-  result = (PyObject *)archive_read_data_into_str(arg1,arg2);
-  resultobj = result;
+  arg2 = (long long)(val2);
+  ecode3 = SWIG_AsVal_long_SS_long(obj2, &val3);
+  if (!SWIG_IsOK(ecode3)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "fadvise" "', argument " "3"" of type '" "long long""'");
+  } 
+  arg3 = (long long)(val3);
+  ecode4 = SWIG_AsVal_int(obj3, &val4);
+  if (!SWIG_IsOK(ecode4)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode4), "in method '" "fadvise" "', argument " "4"" of type '" "int""'");
+  } 
+  arg4 = (int)(val4);
+  result = (int)fadvise(arg1,arg2,arg3,arg4);
+  resultobj = SWIG_From_int((int)(result));
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_archive_write_data_from_str(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_madvise_buffer(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
-  struct archive *arg1 = (struct archive *) 0 ;
-  PyObject *arg2 = (PyObject *) 0 ;
-  void *argp1 = 0 ;
-  int res1 = 0 ;
+  PyObject *arg1 = (PyObject *) 0 ;
+  long long arg2 ;
+  long long arg3 ;
+  int arg4 ;
+  long long val2 ;
+  int ecode2 = 0 ;
+  long long val3 ;
+  int ecode3 = 0 ;
+  int val4 ;
+  int ecode4 = 0 ;
+  PyObject * obj0 = 0 ;
+  PyObject * obj1 = 0 ;
+  PyObject * obj2 = 0 ;
+  PyObject * obj3 = 0 ;
+  int result;
+  
+  if (!PyArg_ParseTuple(args,(char *)"OOOO:madvise_buffer",&obj0,&obj1,&obj2,&obj3)) SWIG_fail;
+  arg1 = obj0;
+  ecode2 = SWIG_AsVal_long_SS_long(obj1, &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "madvise_buffer" "', argument " "2"" of type '" "long long""'");
+  } 
+  arg2 = (long long)(val2);
+  ecode3 = SWIG_AsVal_long_SS_long(obj2, &val3);
+  if (!SWIG_IsOK(ecode3)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "madvise_buffer" "', argument " "3"" of type '" "long long""'");
+  } 
+  arg3 = (long long)(val3);
+  ecode4 = SWIG_AsVal_int(obj3, &val4);
+  if (!SWIG_IsOK(ecode4)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode4), "in method '" "madvise_buffer" "', argument " "4"" of type '" "int""'");
+  } 
+  arg4 = (int)(val4);
+  result = (int)madvise_buffer(arg1,arg2,arg3,arg4);
+  resultobj = SWIG_From_int((int)(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_copy_fd_range(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  int arg1 ;
+  long long arg2 ;
+  int arg3 ;
+  long long arg4 ;
+  int val1 ;
+  int ecode1 = 0 ;
+  long long val2 ;
+  int ecode2 = 0 ;
+  int val3 ;
+  int ecode3 = 0 ;
+  long long val4 ;
+  int ecode4 = 0 ;
   PyObject * obj0 = 0 ;
   PyObject * obj1 = 0 ;
+  PyObject * obj2 = 0 ;
+  PyObject * obj3 = 0 ;
   PyObject *result = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OO:archive_write_data_from_str",&obj0,&obj1)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_archive, 0 |  0 );
-  if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "archive_write_data_from_str" "', argument " "1"" of type '" "struct archive *""'"); 
-  }
-  arg1 = (struct archive *)(argp1);
-  arg2 = obj1;
-  result = (PyObject *)archive_write_data_from_str(arg1,arg2);
+  if (!PyArg_ParseTuple(args,(char *)"OOOO:copy_fd_range",&obj0,&obj1,&obj2,&obj3)) SWIG_fail;
+  ecode1 = SWIG_AsVal_int(obj0, &val1);
+  if (!SWIG_IsOK(ecode1)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode1), "in method '" "copy_fd_range" "', argument " "1"" of type '" "int""'");
+  } 
+  arg1 = (int)(val1);
+  ecode2 = SWIG_AsVal_long_SS_long(obj1, &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "copy_fd_range" "', argument " "2"" of type '" "long long""'");
+  } 
+  arg2 = (long long)(val2);
+  ecode3 = SWIG_AsVal_int(obj2, &val3);
+  if (!SWIG_IsOK(ecode3)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "copy_fd_range" "', argument " "3"" of type '" "int""'");
+  } 
+  arg3 = (int)(val3);
+  ecode4 = SWIG_AsVal_long_SS_long(obj3, &val4);
+  if (!SWIG_IsOK(ecode4)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode4), "in method '" "copy_fd_range" "', argument " "4"" of type '" "long long""'");
+  } 
+  arg4 = (long long)(val4);
+  result = (PyObject *)copy_fd_range(arg1,arg2,arg3,arg4);
   resultobj = result;
   return resultobj;
 fail:
@@ -5539,6 +7850,10 @@ static PyMethodDef SwigMethods[] = {
 	 { (char *)"archive_read_next_header2", _wrap_archive_read_next_header2, METH_VARARGS, NULL},
 	 { (char *)"archive_entry_stat", _wrap_archive_entry_stat, METH_VARARGS, NULL},
 	 { (char *)"archive_read_header_position", _wrap_archive_read_header_position, METH_VARARGS, NULL},
+	 { (char *)"archive_read_set_format_option", _wrap_archive_read_set_format_option, METH_VARARGS, NULL},
+	 { (char *)"archive_read_set_filter_option", _wrap_archive_read_set_filter_option, METH_VARARGS, NULL},
+	 { (char *)"archive_read_set_option", _wrap_archive_read_set_option, METH_VARARGS, NULL},
+	 { (char *)"archive_read_set_options", _wrap_archive_read_set_options, METH_VARARGS, NULL},
 	 { (char *)"archive_read_data_skip", _wrap_archive_read_data_skip, METH_VARARGS, NULL},
 	 { (char *)"archive_read_data_into_fd", _wrap_archive_read_data_into_fd, METH_VARARGS, NULL},
 	 { (char *)"archive_read_support_filter_all", _wrap_archive_read_support_filter_all, METH_VARARGS, NULL},
@@ -5573,8 +7888,13 @@ static PyMethodDef SwigMethods[] = {
 	 { (char *)"archive_write_open_filename_w", _wrap_archive_write_open_filename_w, METH_VARARGS, NULL},
 	 { (char *)"archive_write_open_memory", _wrap_archive_write_open_memory, METH_VARARGS, NULL},
 	 { (char *)"archive_write_close", _wrap_archive_write_close, METH_VARARGS, NULL},
+	 { (char *)"archive_write_disk_new", _wrap_archive_write_disk_new, METH_VARARGS, NULL},
+	 { (char *)"archive_write_disk_set_options", _wrap_archive_write_disk_set_options, METH_VARARGS, NULL},
+	 { (char *)"archive_write_disk_set_standard_lookup", _wrap_archive_write_disk_set_standard_lookup, METH_VARARGS, NULL},
+	 { (char *)"archive_read_extract2", _wrap_archive_read_extract2, METH_VARARGS, NULL},
 	 { (char *)"archive_write_header", _wrap_archive_write_header, METH_VARARGS, NULL},
 	 { (char *)"archive_write_finish_entry", _wrap_archive_write_finish_entry, METH_VARARGS, NULL},
+	 { (char *)"archive_write_add_filter", _wrap_archive_write_add_filter, METH_VARARGS, NULL},
 	 { (char *)"archive_write_add_filter_bzip2", _wrap_archive_write_add_filter_bzip2, METH_VARARGS, NULL},
 	 { (char *)"archive_write_add_filter_compress", _wrap_archive_write_add_filter_compress, METH_VARARGS, NULL},
 	 { (char *)"archive_write_add_filter_gzip", _wrap_archive_write_add_filter_gzip, METH_VARARGS, NULL},
@@ -5582,6 +7902,10 @@ static PyMethodDef SwigMethods[] = {
 	 { (char *)"archive_write_add_filter_lzma", _wrap_archive_write_add_filter_lzma, METH_VARARGS, NULL},
 	 { (char *)"archive_write_add_filter_none", _wrap_archive_write_add_filter_none, METH_VARARGS, NULL},
 	 { (char *)"archive_write_add_filter_xz", _wrap_archive_write_add_filter_xz, METH_VARARGS, NULL},
+	 { (char *)"archive_write_set_format_option", _wrap_archive_write_set_format_option, METH_VARARGS, NULL},
+	 { (char *)"archive_write_set_filter_option", _wrap_archive_write_set_filter_option, METH_VARARGS, NULL},
+	 { (char *)"archive_write_set_option", _wrap_archive_write_set_option, METH_VARARGS, NULL},
+	 { (char *)"archive_write_set_options", _wrap_archive_write_set_options, METH_VARARGS, NULL},
 	 { (char *)"archive_write_set_format", _wrap_archive_write_set_format, METH_VARARGS, NULL},
 	 { (char *)"archive_write_set_format_by_name", _wrap_archive_write_set_format_by_name, METH_VARARGS, NULL},
 	 { (char *)"archive_write_set_format_ar_bsd", _wrap_archive_write_set_format_ar_bsd, METH_VARARGS, NULL},
@@ -5605,15 +7929,34 @@ static PyMethodDef SwigMethods[] = {
 	 { (char *)"archive_entry_mtime", _wrap_archive_entry_mtime, METH_VARARGS, NULL},
 	 { (char *)"archive_entry_filetype", _wrap_archive_entry_filetype, METH_VARARGS, NULL},
 	 { (char *)"archive_entry_perm", _wrap_archive_entry_perm, METH_VARARGS, NULL},
+	 { (char *)"archive_entry_sparse_count", _wrap_archive_entry_sparse_count, METH_VARARGS, NULL},
 	 { (char *)"archive_entry_set_pathname", _wrap_archive_entry_set_pathname, METH_VARARGS, NULL},
 	 { (char *)"archive_entry_set_size", _wrap_archive_entry_set_size, METH_VARARGS, NULL},
 	 { (char *)"archive_entry_set_mtime", _wrap_archive_entry_set_mtime, METH_VARARGS, NULL},
 	 { (char *)"archive_entry_set_filetype", _wrap_archive_entry_set_filetype, METH_VARARGS, NULL},
 	 { (char *)"archive_entry_set_perm", _wrap_archive_entry_set_perm, METH_VARARGS, NULL},
+	 { (char *)"archive_filter_bytes", _wrap_archive_filter_bytes, METH_VARARGS, NULL},
+	 { (char *)"archive_filter_code", _wrap_archive_filter_code, METH_VARARGS, NULL},
+	 { (char *)"archive_filter_count", _wrap_archive_filter_count, METH_VARARGS, NULL},
 	 { (char *)"archive_errno", _wrap_archive_errno, METH_VARARGS, NULL},
 	 { (char *)"archive_error_string", _wrap_archive_error_string, METH_VARARGS, NULL},
 	 { (char *)"archive_read_data_into_str", _wrap_archive_read_data_into_str, METH_VARARGS, NULL},
+	 { (char *)"archive_read_data_into_buffer", _wrap_archive_read_data_into_buffer, METH_VARARGS, NULL},
+	 { (char *)"archive_read_data_block_into_view", _wrap_archive_read_data_block_into_view, METH_VARARGS, NULL},
+	 { (char *)"archive_read_next_header_fields", _wrap_archive_read_next_header_fields, METH_VARARGS, NULL},
 	 { (char *)"archive_write_data_from_str", _wrap_archive_write_data_from_str, METH_VARARGS, NULL},
+	 { (char *)"archive_read_extract_all", _wrap_archive_read_extract_all, METH_VARARGS, NULL},
+	 { (char *)"archive_write_data_from_fd", _wrap_archive_write_data_from_fd, METH_VARARGS, NULL},
+	 { (char *)"archive_read_open_pyobject", _wrap_archive_read_open_pyobject, METH_VARARGS, NULL},
+	 { (char *)"archive_write_open_pyobject", _wrap_archive_write_open_pyobject, METH_VARARGS, NULL},
+	 { (char *)"archive_read_open_pybuffer", _wrap_archive_read_open_pybuffer, METH_VARARGS, NULL},
+	 { (char *)"membuf_new", _wrap_membuf_new, METH_VARARGS, NULL},
+	 { (char *)"membuf_free", _wrap_membuf_free, METH_VARARGS, NULL},
+	 { (char *)"membuf_to_str", _wrap_membuf_to_str, METH_VARARGS, NULL},
+	 { (char *)"archive_write_open_membuf", _wrap_archive_write_open_membuf, METH_VARARGS, NULL},
+	 { (char *)"fadvise", _wrap_fadvise, METH_VARARGS, NULL},
+	 { (char *)"madvise_buffer", _wrap_madvise_buffer, METH_VARARGS, NULL},
+	 { (char *)"copy_fd_range", _wrap_copy_fd_range, METH_VARARGS, NULL},
 	 { NULL, NULL, 0, NULL }
 };
 
@@ -5627,6 +7970,7 @@ static swig_type_info _swigt__p_archive_open_callback = {"_p_archive_open_callba
 static swig_type_info _swigt__p_archive_write_callback = {"_p_archive_write_callback", "archive_write_callback *", 0, 0, (void*)0, 0};
 static swig_type_info _swigt__p_char = {"_p_char", "char *", 0, 0, (void*)0, 0};
 static swig_type_info _swigt__p_int64_t = {"_p_int64_t", "int64_t *", 0, 0, (void*)0, 0};
+static swig_type_info _swigt__p_membuf = {"_p_membuf", "struct membuf *", 0, 0, (void*)0, 0};
 static swig_type_info _swigt__p_size_t = {"_p_size_t", "size_t *", 0, 0, (void*)0, 0};
 static swig_type_info _swigt__p_stat = {"_p_stat", "struct stat *", 0, 0, (void*)0, 0};
 static swig_type_info _swigt__p_time_t = {"_p_time_t", "time_t *", 0, 0, (void*)0, 0};
@@ -5641,6 +7985,7 @@ static swig_type_info *swig_type_initial[] = {
   &_swigt__p_archive_write_callback,
   &_swigt__p_char,
   &_swigt__p_int64_t,
+  &_swigt__p_membuf,
   &_swigt__p_size_t,
   &_swigt__p_stat,
   &_swigt__p_time_t,
@@ -5655,6 +8000,7 @@ static swig_cast_info _swigc__p_archive_open_callback[] = {  {&_swigt__p_archive
 static swig_cast_info _swigc__p_archive_write_callback[] = {  {&_swigt__p_archive_write_callback, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_char[] = {  {&_swigt__p_char, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_int64_t[] = {  {&_swigt__p_int64_t, 0, 0, 0},{0, 0, 0, 0}};
+static swig_cast_info _swigc__p_membuf[] = {  {&_swigt__p_membuf, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_size_t[] = {  {&_swigt__p_size_t, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_stat[] = {  {&_swigt__p_stat, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_time_t[] = {  {&_swigt__p_time_t, 0, 0, 0},{0, 0, 0, 0}};
@@ -5669,6 +8015,7 @@ static swig_cast_info *swig_cast_initial[] = {
   _swigc__p_archive_write_callback,
   _swigc__p_char,
   _swigc__p_int64_t,
+  _swigc__p_membuf,
   _swigc__p_size_t,
   _swigc__p_stat,
   _swigc__p_time_t,
@@ -5687,18 +8034,18 @@ static swig_const_info swig_const_table[] = {
 #endif
 /* -----------------------------------------------------------------------------
  * Type initialization:
- * This problem is tough by the requirement that no dynamic 
- * memory is used. Also, since swig_type_info structures store pointers to 
+ * This problem is tough by the requirement that no dynamic
+ * memory is used. Also, since swig_type_info structures store pointers to
  * swig_cast_info structures and swig_cast_info structures store pointers back
- * to swig_type_info structures, we need some lookup code at initialization. 
- * The idea is that swig generates all the structures that are needed. 
- * The runtime then collects these partially filled structures. 
- * The SWIG_InitializeModule function takes these initial arrays out of 
+ * to swig_type_info structures, we need some lookup code at initialization.
+ * The idea is that swig generates all the structures that are needed.
+ * The runtime then collects these partially filled structures.
+ * The SWIG_InitializeModule function takes these initial arrays out of
  * swig_module, and does all the lookup, filling in the swig_module.types
  * array with the correct data and linking the correct swig_cast_info
  * structures together.
  *
- * The generated swig_type_info structures are assigned staticly to an initial 
+ * The generated swig_type_info structures are assigned statically to an initial
  * array. We just loop through that array, and handle each type individually.
  * First we lookup if this type has been already loaded, and if so, use the
  * loaded structure instead of the generated one. Then we have to fill in the
@@ -5708,17 +8055,17 @@ static swig_const_info swig_const_table[] = {
  * a column is one of the swig_cast_info structures for that type.
  * The cast_initial array is actually an array of arrays, because each row has
  * a variable number of columns. So to actually build the cast linked list,
- * we find the array of casts associated with the type, and loop through it 
+ * we find the array of casts associated with the type, and loop through it
  * adding the casts to the list. The one last trick we need to do is making
  * sure the type pointer in the swig_cast_info struct is correct.
  *
- * First off, we lookup the cast->type name to see if it is already loaded. 
+ * First off, we lookup the cast->type name to see if it is already loaded.
  * There are three cases to handle:
  *  1) If the cast->type has already been loaded AND the type we are adding
  *     casting info to has not been loaded (it is in this module), THEN we
  *     replace the cast->type pointer with the type pointer that has already
  *     been loaded.
- *  2) If BOTH types (the one we are adding casting info to, and the 
+ *  2) If BOTH types (the one we are adding casting info to, and the
  *     cast->type) are loaded, THEN the cast info has already been loaded by
  *     the previous module so we just ignore it.
  *  3) Finally, if cast->type has not already been loaded, then we add that
@@ -5742,9 +8089,7 @@ SWIGRUNTIME void
 SWIG_InitializeModule(void *clientdata) {
   size_t i;
   swig_module_info *module_head, *iter;
-  int found, init;
-  
-  clientdata = clientdata;
+  int init;
   
   /* check to see if the circular list has been setup, if not, set it up */
   if (swig_module.next==0) {
@@ -5763,27 +8108,23 @@ SWIG_InitializeModule(void *clientdata) {
     /* This is the first module loaded for this interpreter */
     /* so set the swig module into the interpreter */
     SWIG_SetModule(clientdata, &swig_module);
-    module_head = &swig_module;
   } else {
     /* the interpreter has loaded a SWIG module, but has it loaded this one? */
-    found=0;
     iter=module_head;
     do {
       if (iter==&swig_module) {
-        found=1;
-        break;
+        /* Our module is already in the list, so there's nothing more to do. */
+        return;
       }
       iter=iter->next;
     } while (iter!= module_head);
     
-    /* if the is found in the list, then all is done and we may leave */
-    if (found) return;
-    /* otherwise we must add out module into the list */
+    /* otherwise we must add our module into the list */
     swig_module.next = module_head->next;
     module_head->next = &swig_module;
   }
   
-  /* When multiple interpeters are used, a module could have already been initialized in
+  /* When multiple interpreters are used, a module could have already been initialized in
        a different interpreter, but not yet have a pointer in this interpreter.
        In this case, we do not want to continue adding types... everything should be
        set up already */
@@ -6030,7 +8371,7 @@ extern "C" {
       var = var->next;
     }
     if (res == NULL && !PyErr_Occurred()) {
-      PyErr_SetString(PyExc_NameError,"Unknown C global variable");
+      PyErr_Format(PyExc_AttributeError, "Unknown C global variable '%s'", n);
     }
     return res;
   }
@@ -6047,7 +8388,7 @@ extern "C" {
       var = var->next;
     }
     if (res == 1 && !PyErr_Occurred()) {
-      PyErr_SetString(PyExc_NameError,"Unknown C global variable");
+      PyErr_Format(PyExc_AttributeError, "Unknown C global variable '%s'", n);
     }
     return res;
   }
@@ -6059,7 +8400,6 @@ extern "C" {
     static int type_init = 0;
     if (!type_init) {
       const PyTypeObject tmp = {
-        /* PyObject header changed in Python 3 */
 #if PY_VERSION_HEX >= 0x03000000
         PyVarObject_HEAD_INIT(NULL, 0)
 #else
@@ -6097,10 +8437,19 @@ extern "C" {
         0,                                  /* tp_del */
 #endif
 #if PY_VERSION_HEX >= 0x02060000
-        0,                                  /* tp_version */
+        0,                                  /* tp_version_tag */
+#endif
+#if PY_VERSION_HEX >= 0x03040000
+        0,                                  /* tp_finalize */
 #endif
 #ifdef COUNT_ALLOCS
-        0,0,0,0                             /* tp_alloc -> tp_next */
+        0,                                  /* tp_allocs */
+        0,                                  /* tp_frees */
+        0,                                  /* tp_maxalloc */
+#if PY_VERSION_HEX >= 0x02050000
+        0,                                  /* tp_prev */
+#endif
+        0                                   /* tp_next */
 #endif
       };
       varlink_type = tmp;
@@ -6189,7 +8538,9 @@ extern "C" {
     size_t i;
     for (i = 0; methods[i].ml_name; ++i) {
       const char *c = methods[i].ml_doc;
-      if (c && (c = strstr(c, "swig_ptr: "))) {
+      if (!c) continue;
+      c = strstr(c, "swig_ptr: ");
+      if (c) {
         int j;
         swig_const_info *ci = 0;
         const char *name = c + 10;
@@ -6280,17 +8631,18 @@ SWIG_init(void) {
   static PyGetSetDef thisown_getset_def = {
     (char *)"thisown", SwigPyBuiltin_GetterClosure, SwigPyBuiltin_SetterClosure, NULL, &thisown_getset_closure
   };
-  PyObject *metatype_args;
   PyTypeObject *builtin_pytype;
   int builtin_base_count;
   swig_type_info *builtin_basetype;
   PyObject *tuple;
   PyGetSetDescrObject *static_getset;
   PyTypeObject *metatype;
+  PyTypeObject *swigpyobject;
   SwigPyClientData *cd;
   PyObject *public_interface, *public_symbol;
   PyObject *this_descr;
   PyObject *thisown_descr;
+  PyObject *self = 0;
   int i;
   
   (void)builtin_pytype;
@@ -6298,15 +8650,11 @@ SWIG_init(void) {
   (void)builtin_basetype;
   (void)tuple;
   (void)static_getset;
+  (void)self;
   
-  /* metatype is used to implement static member variables. */
-  metatype_args = Py_BuildValue("(s(O){})", "SwigPyObjectType", &PyType_Type);
-  assert(metatype_args);
-  metatype = (PyTypeObject *) PyType_Type.tp_call((PyObject *) &PyType_Type, metatype_args, NULL);
+  /* Metaclass is used to implement static member variables */
+  metatype = SwigPyObjectType();
   assert(metatype);
-  Py_DECREF(metatype_args);
-  metatype->tp_setattro = (setattrofunc) &SwigPyObjectType_setattro;
-  assert(PyType_Ready(metatype) >= 0);
 #endif
   
   /* Fix SwigMethods to carry the callback ptrs when needed */
@@ -6317,18 +8665,22 @@ SWIG_init(void) {
 #else
   m = Py_InitModule((char *) SWIG_name, SwigMethods);
 #endif
+  
   md = d = PyModule_GetDict(m);
+  (void)md;
   
   SWIG_InitializeModule(0);
   
 #ifdef SWIGPYTHON_BUILTIN
+  swigpyobject = SwigPyObject_TypeOnce();
+  
   SwigPyObject_stype = SWIG_MangledTypeQuery("_p_SwigPyObject");
   assert(SwigPyObject_stype);
   cd = (SwigPyClientData*) SwigPyObject_stype->clientdata;
   if (!cd) {
     SwigPyObject_stype->clientdata = &SwigPyObject_clientdata;
-    SwigPyObject_clientdata.pytype = SwigPyObject_TypeOnce();
-  } else if (SwigPyObject_TypeOnce()->tp_basicsize != cd->pytype->tp_basicsize) {
+    SwigPyObject_clientdata.pytype = swigpyobject;
+  } else if (swigpyobject->tp_basicsize != cd->pytype->tp_basicsize) {
     PyErr_SetString(PyExc_RuntimeError, "Import error: attempted to load two incompatible swig-generated modules.");
 # if PY_VERSION_HEX >= 0x03000000
     return NULL;
@@ -6359,6 +8711,9 @@ SWIG_init(void) {
   
   SWIG_InstallConstants(d,swig_const_table);
   
+  
+  PyEval_InitThreads();
+  
   SWIG_Python_SetConstant(d, "ARCHIVE_VERSION_NUMBER",SWIG_From_int((int)(3000001)));
   SWIG_Python_SetConstant(d, "ARCHIVE_VERSION_STRING",SWIG_FromCharPtr("libarchive 3.0.1b"));
   SWIG_Python_SetConstant(d, "ARCHIVE_EOF",SWIG_From_int((int)(1)));
@@ -6377,6 +8732,11 @@ SWIG_init(void) {
   SWIG_Python_SetConstant(d, "ARCHIVE_FILTER_UU",SWIG_From_int((int)(7)));
   SWIG_Python_SetConstant(d, "ARCHIVE_FILTER_RPM",SWIG_From_int((int)(8)));
   SWIG_Python_SetConstant(d, "ARCHIVE_FILTER_LZIP",SWIG_From_int((int)(9)));
+  SWIG_Python_SetConstant(d, "ARCHIVE_FILTER_LRZIP",SWIG_From_int((int)(10)));
+  SWIG_Python_SetConstant(d, "ARCHIVE_FILTER_LZOP",SWIG_From_int((int)(11)));
+  SWIG_Python_SetConstant(d, "ARCHIVE_FILTER_GRZIP",SWIG_From_int((int)(12)));
+  SWIG_Python_SetConstant(d, "ARCHIVE_FILTER_LZ4",SWIG_From_int((int)(13)));
+  SWIG_Python_SetConstant(d, "ARCHIVE_FILTER_ZSTD",SWIG_From_int((int)(14)));
   SWIG_Python_SetConstant(d, "ARCHIVE_FORMAT_BASE_MASK",SWIG_From_int((int)(0xff0000)));
   SWIG_Python_SetConstant(d, "ARCHIVE_FORMAT_CPIO",SWIG_From_int((int)(0x10000)));
   SWIG_Python_SetConstant(d, "ARCHIVE_FORMAT_CPIO_POSIX",SWIG_From_int((int)((0x10000|1))));
@@ -6421,6 +8781,11 @@ SWIG_init(void) {
   SWIG_Python_SetConstant(d, "ARCHIVE_EXTRACT_NO_OVERWRITE_NEWER",SWIG_From_int((int)((0x0800))));
   SWIG_Python_SetConstant(d, "ARCHIVE_EXTRACT_SPARSE",SWIG_From_int((int)((0x1000))));
   SWIG_Python_SetConstant(d, "ARCHIVE_EXTRACT_MAC_METADATA",SWIG_From_int((int)((0x2000))));
+  SWIG_Python_SetConstant(d, "ARCHIVE_EXTRACT_SECURE_NOABSOLUTEPATHS",SWIG_From_int((int)((0x10000))));
+  SWIG_Python_SetConstant(d, "POSIX_FADV_SEQUENTIAL",SWIG_From_int((int)(POSIX_FADV_SEQUENTIAL)));
+  SWIG_Python_SetConstant(d, "POSIX_FADV_WILLNEED",SWIG_From_int((int)(POSIX_FADV_WILLNEED)));
+  SWIG_Python_SetConstant(d, "MADV_SEQUENTIAL",SWIG_From_int((int)(MADV_SEQUENTIAL)));
+  SWIG_Python_SetConstant(d, "MADV_WILLNEED",SWIG_From_int((int)(MADV_WILLNEED)));
 #if PY_VERSION_HEX >= 0x03000000
   return m;
 #else
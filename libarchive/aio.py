@@ -0,0 +1,293 @@
+# Copyright (c) 2011, SmartFile <btimby@smartfile.com>
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#     * Redistributions of source code must retain the above copyright
+#       notice, this list of conditions and the following disclaimer.
+#     * Redistributions in binary form must reproduce the above copyright
+#       notice, this list of conditions and the following disclaimer in the
+#       documentation and/or other materials provided with the distribution.
+#     * Neither the name of the organization nor the
+#       names of its contributors may be used to endorse or promote products
+#       derived from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER BE LIABLE FOR ANY
+# DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES
+# (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND
+# ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+'''Archive access for trollius (or asyncio) applications.
+
+Every blocking libarchive call runs in a bounded thread pool, the methods here
+return futures to be yielded from coroutines:
+
+    @trollius.coroutine
+    def send_entries(path, writer):
+        a = yield From(AsyncArchive.open(path))
+        while True:
+            entry = yield From(a.next_entry())
+            if entry is None:
+                break
+            stream = yield From(a.readstream(entry))
+            yield From(stream.copy_to(writer))
+        yield From(a.close())
+
+The archive itself can be a StreamReader (to read it from a socket) or a
+StreamWriter (to write it to one), e.g. in an upload server:
+
+    a = yield From(AsyncArchive.open(reader))
+
+Calls on one archive are serialized, different archives are processed
+concurrently up to the size of the executor.'''
+
+import threading
+
+try:
+    import asyncio
+except ImportError:
+    import trollius as asyncio
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from libarchive import Archive, SeekableArchive, Entry, COPY_BUFFER_SIZE, SPOOL_SIZE
+
+# Number of threads running blocking libarchive calls for all archives.
+MAX_WORKERS = 16
+
+_executor = None
+_executor_lock = threading.Lock()
+
+# asyncio.async() was renamed, and async became a keyword.
+ensure_future = getattr(asyncio, 'ensure_future', None) or getattr(asyncio, 'async')
+
+
+def get_executor():
+    '''Returns the executor shared by all archives, creating it on first use.'''
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(MAX_WORKERS)
+        return _executor
+
+
+def _chain(loop, first, then):
+    '''Returns a future for the result of then(result of first). then may return a
+    future (or coroutine) to continue the chain, or a plain value.'''
+    done = asyncio.Future(loop=loop)
+
+    def finish(f):
+        if done.cancelled():
+            return
+        if f.cancelled():
+            done.cancel()
+        elif f.exception() is not None:
+            done.set_exception(f.exception())
+        else:
+            done.set_result(f.result())
+
+    def step(f):
+        if done.cancelled():
+            return
+        if f.cancelled():
+            done.cancel()
+            return
+        if f.exception() is not None:
+            done.set_exception(f.exception())
+            return
+        try:
+            result = then(f.result())
+        except Exception as e:
+            done.set_exception(e)
+            return
+        if asyncio.iscoroutine(result) or isinstance(result, asyncio.Future):
+            ensure_future(result, loop=loop).add_done_callback(finish)
+        else:
+            done.set_result(result)
+
+    ensure_future(first, loop=loop).add_done_callback(step)
+    return done
+
+
+def _pump(loop, read, write):
+    '''Calls write(data) for each chunk returned by read() until it returns an empty
+    string. Both return futures. Returns a future for the number of bytes copied.'''
+    total = [0]
+
+    def copy(data):
+        if not data:
+            return total[0]
+        total[0] += len(data)
+        return _chain(loop, write(data), lambda result: _chain(loop, read(), copy))
+
+    return _chain(loop, read(), copy)
+
+
+def _call_in_loop(loop, func, *args):
+    '''Runs func(*args) in the loop and waits for its result, which may be a future
+    (or coroutine). Must not be called from the loop's own thread.'''
+    done = Future()
+
+    def finish(f):
+        if f.cancelled():
+            done.set_exception(asyncio.CancelledError())
+        elif f.exception() is not None:
+            done.set_exception(f.exception())
+        else:
+            done.set_result(f.result())
+
+    def call():
+        try:
+            result = func(*args)
+        except Exception as e:
+            done.set_exception(e)
+            return
+        if asyncio.iscoroutine(result) or isinstance(result, asyncio.Future):
+            ensure_future(result, loop=loop).add_done_callback(finish)
+        else:
+            done.set_result(result)
+
+    loop.call_soon_threadsafe(call)
+    return done.result()
+
+
+class StreamSource(object):
+    '''File-like object reading from an asyncio.StreamReader, for archives read in
+    the executor. Each read() waits for the loop to deliver the data.'''
+    def __init__(self, reader, loop):
+        self.reader = reader
+        self.loop = loop
+
+    def read(self, size=-1):
+        return _call_in_loop(self.loop, self.reader.read, size)
+
+
+class StreamSink(object):
+    '''File-like object writing to an asyncio.StreamWriter, for archives written in
+    the executor. Each write() waits for the writer to drain.'''
+    def __init__(self, writer, loop):
+        self.writer = writer
+        self.loop = loop
+
+    def _write(self, data):
+        self.writer.write(data)
+        return self.writer.drain()
+
+    def write(self, data):
+        _call_in_loop(self.loop, self._write, data)
+
+
+class AsyncArchive(object):
+    '''Wraps an Archive (or SeekableArchive), see the module documentation.'''
+    def __init__(self, archive, loop=None, executor=None):
+        self.archive = archive
+        self.loop = loop or asyncio.get_event_loop()
+        self.executor = executor or get_executor()
+        self._lock = threading.Lock()
+        self._iter = None
+
+    @classmethod
+    def open(cls, f, loop=None, executor=None, archive_class=Archive, **kwargs):
+        '''Opens the archive in the executor. f can also be an asyncio.StreamReader to
+        read from, or an asyncio.StreamWriter to write to (pass mode='w' and a format).
+        Returns a future for the AsyncArchive.'''
+        loop = loop or asyncio.get_event_loop()
+        executor = executor or get_executor()
+        if isinstance(f, asyncio.StreamReader):
+            f = StreamSource(f, loop)
+        elif isinstance(f, asyncio.StreamWriter):
+            f = StreamSink(f, loop)
+        future = loop.run_in_executor(executor, lambda: archive_class(f, **kwargs))
+        return _chain(loop, future, lambda archive: cls(archive, loop, executor))
+
+    def run(self, func, *args):
+        '''Runs func(*args) in the executor, never concurrently with another call on
+        this archive. Returns a future.'''
+        def call():
+            with self._lock:
+                return func(*args)
+        return self.loop.run_in_executor(self.executor, call)
+
+    def next_entry(self):
+        '''Returns a future for the next entry, None at the end of the archive.'''
+        if self._iter is None:
+            self._iter = iter(self.archive)
+        return self.run(next, self._iter, None)
+
+    def read(self, size):
+        '''Returns a future for up to size bytes of the current entry.'''
+        return self.run(self.archive.read, size)
+
+    def readstream(self, member):
+        '''Returns a future for an AsyncEntryReadStream. member is the entry to read
+        (or its name) for a SeekableArchive, otherwise the current entry or its size.'''
+        if isinstance(member, Entry) and not isinstance(self.archive, SeekableArchive):
+            member = member.size
+        future = self.run(self.archive.readstream, member)
+        return _chain(self.loop, future, lambda stream: AsyncEntryReadStream(self, stream))
+
+    def writestream(self, pathname, size=None, spool_size=SPOOL_SIZE):
+        '''Returns a future for an AsyncEntryWriteStream for a new entry.'''
+        future = self.run(self.archive.writestream, pathname, size, spool_size)
+        return _chain(self.loop, future, lambda stream: AsyncEntryWriteStream(self, stream))
+
+    def write_from(self, pathname, reader, size=None, chunk_size=COPY_BUFFER_SIZE):
+        '''Adds an entry with the contents read from an asyncio.StreamReader until EOF.
+        Returns a future for the number of bytes written.'''
+        def copy(stream):
+            def close(total):
+                return _chain(self.loop, stream.close(), lambda result: total)
+            copied = _pump(self.loop, lambda: reader.read(chunk_size), stream.write)
+            return _chain(self.loop, copied, close)
+        return _chain(self.loop, self.writestream(pathname, size), copy)
+
+    def extractall(self, path=None, *args):
+        return self.run(self.archive.extractall, path, *args)
+
+    def close(self):
+        return self.run(self.archive.close)
+
+
+class AsyncEntryReadStream(object):
+    '''Reads an entry's data through the executor.'''
+    def __init__(self, archive, stream):
+        self.archive = archive
+        self.stream = stream
+
+    def read(self, bytes=-1):
+        '''Returns a future for up to bytes bytes, an empty string at the end.'''
+        return self.archive.run(lambda: self.stream.read(bytes) or '')
+
+    def copy_to(self, writer, chunk_size=COPY_BUFFER_SIZE):
+        '''Writes the rest of the entry to an asyncio.StreamWriter, waiting for the
+        writer to drain in between. Returns a future for the number of bytes copied.'''
+        def write(data):
+            writer.write(data)
+            return writer.drain()
+        return _pump(self.archive.loop, lambda: self.read(chunk_size), write)
+
+    def close(self):
+        return self.archive.run(self.stream.close)
+
+
+class AsyncEntryWriteStream(object):
+    '''Writes an entry's data through the executor.'''
+    def __init__(self, archive, stream):
+        self.archive = archive
+        self.stream = stream
+
+    def write(self, data):
+        return self.archive.run(self.stream.write, data)
+
+    def copy_from(self, reader, chunk_size=COPY_BUFFER_SIZE):
+        '''Writes everything read from an asyncio.StreamReader. Returns a future for
+        the number of bytes copied.'''
+        return _pump(self.archive.loop, lambda: reader.read(chunk_size), self.write)
+
+    def close(self):
+        return self.archive.run(self.stream.close)
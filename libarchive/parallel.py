@@ -0,0 +1,429 @@
+# Copyright (c) 2011, SmartFile <btimby@smartfile.com>
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#     * Redistributions of source code must retain the above copyright
+#       notice, this list of conditions and the following disclaimer.
+#     * Redistributions in binary form must reproduce the above copyright
+#       notice, this list of conditions and the following disclaimer in the
+#       documentation and/or other materials provided with the distribution.
+#     * Neither the name of the organization nor the
+#       names of its contributors may be used to endorse or promote products
+#       derived from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER BE LIABLE FOR ANY
+# DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES
+# (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND
+# ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+'''Concurrent operations on archives.
+
+Every task opens its own Archive, libarchive handles are never shared between
+threads. Libarchive releases the GIL while it decompresses and writes to disk,
+so a thread pool is enough to keep several cores busy.
+
+A single gzip compressed archive can only be decompressed in parallel if it is
+made of independent gzip members whose sizes are known up front. This module
+uses the BGZF layout for that: every member is at most 64K and records its own
+size in a 'BC' extra field. Such files are still valid gzip files, and are what
+ParallelGzipWriter produces.'''
+
+import os, time, errno, struct, threading, zlib
+from multiprocessing import cpu_count
+from multiprocessing.pool import ThreadPool
+from libarchive import Archive, EXTRACT_FLAGS, FORMAT_EXTENSIONS, FILTER_EXTENSIONS
+from libarchive import guess_format, _pread
+
+GZIP_MAGIC = '\x1f\x8b\x08'
+FHCRC, FEXTRA, FNAME, FCOMMENT = 2, 4, 8, 16
+
+# Uncompressed bytes per block, chosen by BGZF so that a block never exceeds 64K.
+BLOCK_DATA_SIZE = 0xff00
+
+# Compressed bytes handed to a worker at once, a task spans many blocks.
+TASK_SIZE = 1024 * 1024
+
+# Number of tasks per worker that may be decompressed ahead of the reader.
+TASKS_AHEAD = 2
+
+
+class ExtractResult(object):
+    '''The outcome of extracting one archive. error is the exception raised, if any.'''
+    def __init__(self, path, dest):
+        self.path = path
+        self.dest = dest
+        self.entries = 0
+        self.bytes = 0
+        self.seconds = 0.0
+        self.error = None
+
+    def __repr__(self):
+        return '<ExtractResult %s: %s>' % (self.path, self.error or '%d entries' % self.entries)
+
+    @property
+    def ok(self):
+        return self.error is None
+
+    @property
+    def throughput(self):
+        '''Bytes extracted per second.'''
+        if not self.seconds:
+            return 0.0
+        return self.bytes / self.seconds
+
+
+def _dest_name(path):
+    '''Strips the archive extensions from the file name, foo.tar.gz becomes foo.'''
+    name, ext = os.path.splitext(os.path.basename(path))
+    if ext in FILTER_EXTENSIONS:
+        name, ext = os.path.splitext(name)
+    if ext not in FORMAT_EXTENSIONS:
+        name += ext
+    return name
+
+
+def _extract(args):
+    path, dest, flags = args
+    result = ExtractResult(path, dest)
+    start = time.time()
+    try:
+        a = Archive(path)
+        try:
+            result.entries, result.bytes = a.extractall(dest, flags)
+        finally:
+            a.close()
+    except Exception as e:
+        result.error = e
+    result.seconds = time.time() - start
+    return result
+
+
+def extract_many(paths, dest, workers=None, flags=EXTRACT_FLAGS, subdirs=True):
+    '''Extracts the archives at paths into the directory dest using a pool of workers
+    (one per core by default). Each archive is extracted in its own subdirectory named
+    after the archive unless subdirs is False. Returns a list of ExtractResult in the
+    order of paths, a failing archive does not stop the others.'''
+    tasks = []
+    used = set()
+    for path in paths:
+        target = dest
+        if subdirs:
+            name = _dest_name(path)
+            i = 1
+            while name in used:
+                i += 1
+                name = '%s-%d' % (_dest_name(path), i)
+            used.add(name)
+            target = os.path.join(dest, name)
+        tasks.append((path, target, flags))
+    if workers is None:
+        workers = cpu_count()
+    if workers <= 1 or len(tasks) <= 1:
+        return map(_extract, tasks)
+    # Created once here, workers would race to create it.
+    if not os.path.isdir(dest):
+        os.makedirs(dest)
+    pool = ThreadPool(min(workers, len(tasks)))
+    try:
+        return pool.map(_extract, tasks, chunksize=1)
+    finally:
+        pool.close()
+        pool.join()
+
+
+def compress_block(data, level=6):
+    '''Compresses up to BLOCK_DATA_SIZE bytes of data into a gzip member which records
+    its own size.'''
+    c = zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS)
+    payload = c.compress(data) + c.flush()
+    size = 18 + len(payload) + 8
+    if size > 0x10000:
+        raise ValueError('Block too large, compress at most %d bytes.' % BLOCK_DATA_SIZE)
+    header = struct.pack('<3sBLBBH2sHH', GZIP_MAGIC, FEXTRA, 0, 0, 255, 6, 'BC', 2, size - 1)
+    trailer = struct.pack('<2L', zlib.crc32(data) & 0xffffffff, len(data) & 0xffffffff)
+    return header + payload + trailer
+
+
+def decompress_block(data):
+    '''Decompresses a single gzip member and checks its CRC and size.'''
+    if data[:3] != GZIP_MAGIC:
+        raise ValueError('Not a gzip member.')
+    flags = ord(data[3])
+    i = 10
+    if flags & FEXTRA:
+        i += 2 + struct.unpack('<H', data[10:12])[0]
+    if flags & FNAME:
+        i = data.index('\x00', i) + 1
+    if flags & FCOMMENT:
+        i = data.index('\x00', i) + 1
+    if flags & FHCRC:
+        i += 2
+    try:
+        out = zlib.decompress(data[i:-8], -zlib.MAX_WBITS)
+    except zlib.error as e:
+        raise ValueError('Corrupt gzip member: %s.' % e)
+    crc, size = struct.unpack('<2L', data[-8:])
+    if zlib.crc32(out) & 0xffffffff != crc or len(out) & 0xffffffff != size:
+        raise ValueError('Corrupt gzip member.')
+    return out
+
+
+def _block_size(header):
+    '''Returns the size of the member starting with header, None if it does not
+    record it.'''
+    if len(header) < 12 or header[:3] != GZIP_MAGIC or not ord(header[3]) & FEXTRA:
+        return None
+    extra = header[12:12 + struct.unpack('<H', header[10:12])[0]]
+    i = 0
+    while i + 4 <= len(extra):
+        id, length = struct.unpack('<2sH', extra[i:i + 4])
+        if id == 'BC' and length == 2:
+            return struct.unpack('<H', extra[i + 4:i + 6])[0] + 1
+        i += 4 + length
+    return None
+
+
+def gzip_blocks(fd):
+    '''Yields (offset, size) of the members of a block gzip file. Raises ValueError
+    at a member that does not record its size.'''
+    offset = 0
+    filesize = os.fstat(fd).st_size
+    while offset < filesize:
+        header = _pread(fd, offset, 12)
+        if len(header) == 12 and ord(header[3]) & FEXTRA:
+            header += _pread(fd, offset + 12, struct.unpack('<H', header[10:12])[0])
+        size = _block_size(header)
+        if size is None:
+            raise ValueError('Gzip member at %d has no size.' % offset)
+        yield offset, size
+        offset += size
+
+
+def is_block_gzip(path):
+    '''Returns True if the first gzip member of the file at path records its size.'''
+    try:
+        with open(path, 'rb') as f:
+            return _block_size(f.read(512)) is not None
+    except (IOError, OSError):
+        return False
+
+
+def _decompress_task(task):
+    data, sizes = task
+    out = []
+    i = 0
+    for size in sizes:
+        out.append(decompress_block(data[i:i + size]))
+        i += size
+    return ''.join(out)
+
+
+class ParallelGzipArchive(Archive):
+    '''A read-only Archive for block gzip files. The blocks are decompressed by a pool
+    of workers and the output is fed, in order, to libarchive through a pipe. Reading
+    is forward-only, like Archive.'''
+    def __init__(self, path, workers=None, **kwargs):
+        if workers is None:
+            workers = cpu_count()
+        self._workers = workers
+        self._source = os.open(path, os.O_RDONLY)
+        self._ahead = threading.Semaphore(workers * TASKS_AHEAD)
+        self._closing = False
+        self._error = None
+        r, self._pipe = os.pipe()
+        self._feeder = threading.Thread(target=self._feed)
+        self._feeder.daemon = True
+        self._feeder.start()
+        # The pipe carries the decompressed archive.
+        kwargs.setdefault('format', guess_format(path)[0])
+        kwargs['filter'] = None
+        kwargs['mode'] = 'r'
+        f = os.fdopen(r, 'rb')
+        try:
+            super(ParallelGzipArchive, self).__init__(f, **kwargs)
+        except Exception:
+            self._shutdown(f)
+            raise
+        self.filename = path
+
+    def _tasks(self):
+        sizes, start = [], 0
+        try:
+            for offset, size in gzip_blocks(self._source):
+                if self._closing:
+                    return
+                if sizes and offset + size - start > TASK_SIZE:
+                    yield self._task(start, sizes)
+                    sizes, start = [], offset
+                sizes.append(size)
+        except Exception as e:
+            # Stops the feed, the reader will see the archive end early.
+            self._error = e
+            return
+        if sizes:
+            yield self._task(start, sizes)
+
+    def _task(self, start, sizes):
+        # Bounds the memory used by tasks the reader has not consumed yet.
+        self._ahead.acquire()
+        return _pread(self._source, start, sum(sizes)), sizes
+
+    def _feed(self):
+        pool = ThreadPool(self._workers)
+        try:
+            for data in pool.imap(_decompress_task, self._tasks(), chunksize=1):
+                written = 0
+                while written < len(data) and not self._closing:
+                    written += os.write(self._pipe, buffer(data, written))
+                self._ahead.release()
+                if self._closing:
+                    break
+        except OSError as e:
+            # The reader went away.
+            if e.errno != errno.EPIPE:
+                self._error = e
+        except Exception as e:
+            self._error = e
+        finally:
+            os.close(self._pipe)
+            self._closing = True
+            for i in range(self._workers * TASKS_AHEAD):
+                self._ahead.release()
+            pool.terminate()
+
+    def close(self, _defer=False):
+        super(ParallelGzipArchive, self).close(_defer)
+        if getattr(self, '_a', None) is not None:
+            # Still open, a stream is in use.
+            return
+        self._shutdown(self.f)
+
+    def _shutdown(self, f):
+        '''Stops the feed and releases the pipe and source file. Raises the error that
+        stopped the feed, if any.'''
+        if self._feeder is None:
+            return
+        self._closing = True
+        f.close()
+        if self._feeder is not threading.current_thread():
+            self._feeder.join()
+        self._feeder = None
+        os.close(self._source)
+        if self._error is not None:
+            raise self._error
+
+
+def open_archive(path, workers=None, **kwargs):
+    '''Opens the archive at path for reading. Block gzip files are decompressed in
+    parallel by a ParallelGzipArchive, others are opened as an Archive.'''
+    if workers != 1 and is_block_gzip(path):
+        return ParallelGzipArchive(path, workers, **kwargs)
+    return Archive(path, **kwargs)
+
+
+def _compress_task(task):
+    data, level = task
+    return ''.join(compress_block(data[i:i + BLOCK_DATA_SIZE], level)
+                   for i in xrange(0, len(data), BLOCK_DATA_SIZE))
+
+
+class ParallelGzipWriter(Archive):
+    '''A write-only Archive producing a block gzip file. libarchive writes the
+    uncompressed archive into a pipe, a collector thread cuts it into chunks that a
+    pool of workers compresses concurrently. The output can be read by any gzip tool
+    and decompressed in parallel by ParallelGzipArchive.'''
+    def __init__(self, f, workers=None, level=6, **kwargs):
+        if workers is None:
+            workers = cpu_count()
+        self._workers = workers
+        self._level = level
+        if isinstance(f, basestring):
+            kwargs.setdefault('format', guess_format(f)[0] or 'tar')
+            self._out = open(f, 'wb')
+            self._own = True
+        else:
+            kwargs.setdefault('format', 'tar')
+            self._out = f
+            self._own = False
+        self._ahead = threading.Semaphore(workers * TASKS_AHEAD)
+        self._error = None
+        self._pipe, w = os.pipe()
+        self._collector = threading.Thread(target=self._collect)
+        self._collector.daemon = True
+        self._collector.start()
+        kwargs['filter'] = None
+        kwargs['mode'] = 'w'
+        pipe = os.fdopen(w, 'wb')
+        try:
+            super(ParallelGzipWriter, self).__init__(pipe, **kwargs)
+        except Exception:
+            self._shutdown(pipe)
+            raise
+
+    def _chunks(self):
+        while True:
+            data = []
+            size = 0
+            while size < TASK_SIZE:
+                chunk = os.read(self._pipe, TASK_SIZE - size)
+                if not chunk:
+                    break
+                data.append(chunk)
+                size += len(chunk)
+            if not data:
+                return
+            # Bounds the memory used by chunks that were not written out yet.
+            self._ahead.acquire()
+            yield ''.join(data), self._level
+            if size < TASK_SIZE:
+                return
+
+    def _collect(self):
+        pool = ThreadPool(self._workers)
+        try:
+            for data in pool.imap(_compress_task, self._chunks(), chunksize=1):
+                self._out.write(data)
+                self._ahead.release()
+            # An empty block marks the end, like BGZF.
+            self._out.write(compress_block(''))
+            self._out.flush()
+        except Exception as e:
+            self._error = e
+            # Keep the writer from blocking on a full pipe.
+            for i in range(self._workers * TASKS_AHEAD):
+                self._ahead.release()
+            while os.read(self._pipe, TASK_SIZE):
+                pass
+        finally:
+            os.close(self._pipe)
+            pool.terminate()
+
+    def close(self, _defer=False):
+        super(ParallelGzipWriter, self).close(_defer)
+        if getattr(self, '_a', None) is not None:
+            # Still open, a stream is in use.
+            return
+        self._shutdown(self.f)
+
+    def _shutdown(self, f):
+        '''Waits for the compressed output to be written. Raises the error that stopped
+        the collector, if any.'''
+        if self._collector is None:
+            return
+        f.close()
+        if self._collector is not threading.current_thread():
+            self._collector.join()
+        self._collector = None
+        if self._own:
+            self._out.close()
+        elif self._error is None:
+            self._out.flush()
+        if self._error is not None:
+            raise self._error
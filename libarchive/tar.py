@@ -23,7 +23,7 @@
 # (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
 # SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
-import time
+import os, time
 from libarchive import is_archive, Entry, SeekableArchive
 from tarfile import DEFAULT_FORMAT, USTAR_FORMAT, GNU_FORMAT, PAX_FORMAT, ENCODING
 from tarfile import REGTYPE, AREGTYPE, LNKTYPE, SYMTYPE, DIRTYPE, FIFOTYPE, CONTTYPE, CHRTYPE, BLKTYPE, GNUTYPE_SPARSE
@@ -44,8 +44,9 @@ def open(**kwargs):
 
 
 class TarInfo(Entry):
-    def __init__(self, name):
-        super(TarInfo, self).__init__(pathname=name)
+    def __init__(self, name=None, **kwargs):
+        kwargs.setdefault('pathname', name)
+        super(TarInfo, self).__init__(**kwargs)
 
     fromtarfile = Entry.from_archive
 
@@ -76,7 +77,8 @@ class TarInfo(Entry):
 
 
 class TarFile(SeekableArchive):
-    def __init__(self, name=None, mode='r', fileobj=None, format=DEFAULT_FORMAT, tarinfo=TarInfo, encoding=ENCODING):
+    def __init__(self, name=None, mode='r', fileobj=None, format=DEFAULT_FORMAT, tarinfo=TarInfo, encoding=ENCODING, options=None,
+                 mmap=False):
         if name:
             f = name
         elif fileobj:
@@ -85,7 +87,8 @@ class TarFile(SeekableArchive):
             format = FORMAT_CONVERSION.get(format)
         except KeyError:
             raise Exception('Invalid tar format: %s' % format)
-        super(TarFile, self).__init__(f, mode=mode, format=format, entry_class=tarinfo, encoding=encoding)
+        super(TarFile, self).__init__(f, mode=mode, format=format, entry_class=tarinfo, encoding=encoding,
+                                      options=options, mmap=mmap)
 
     getmember   = SeekableArchive.getentry
     list        = SeekableArchive.printlist
@@ -96,7 +99,7 @@ class TarFile(SeekableArchive):
         return list(self)
 
     def getnames(self):
-        return list(self.iterpaths)
+        return list(self.iterpaths())
 
     def next(self):
         pass # TODO: how to do this?
@@ -110,6 +113,14 @@ class TarFile(SeekableArchive):
             f = os.path.join(path, member.pathname)
         return self.readpath(member, f)
 
+    def extractall(self, path='.', members=None):
+        if members is None:
+            # Let libarchive extract everything in one pass.
+            SeekableArchive.extractall(self, path)
+            return
+        for member in members:
+            self.extract(member, path)
+
     def add(self, name, arcname, recursive=True, exclude=None, filter=None):
         pass # TODO: implement this.
 
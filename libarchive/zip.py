@@ -23,15 +23,114 @@
 # (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
 # SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
-import os, time
-from libarchive import is_archive, Entry, SeekableArchive
+import os, time, struct
+from collections import namedtuple
+from libarchive import _libarchive, is_archive, Entry, SeekableArchive, _pread, _bytes_at
 from zipfile import ZIP_STORED, ZIP_DEFLATED
 
+# End of central directory record, zip64 locator and record, central file header.
+END_RECORD = struct.Struct('<4s4H2LH')
+END_SIGNATURE = 'PK\x05\x06'
+ZIP64_LOCATOR = struct.Struct('<4sLQL')
+ZIP64_LOCATOR_SIGNATURE = 'PK\x06\x07'
+ZIP64_RECORD = struct.Struct('<4sQ2H2L4Q')
+ZIP64_RECORD_SIGNATURE = 'PK\x06\x06'
+CENTRAL_HEADER = struct.Struct('<4s4B4HL2L5H2L')
+CENTRAL_SIGNATURE = 'PK\x01\x02'
+LOCAL_HEADER = struct.Struct('<4s5H3L2H')
+LOCAL_SIGNATURE = 'PK\x03\x04'
+# The end record is followed by a comment of up to 64K.
+MAX_COMMENT = 0xffff
+
+CentralDirectoryEntry = namedtuple('CentralDirectoryEntry', (
+    'filename', 'flag_bits', 'compress_type', 'date_time', 'CRC', 'compress_size',
+    'file_size', 'header_offset', 'external_attr'))
+
 
 def is_zipfile(filename):
     return is_archive(filename, formats=('zip', ))
 
 
+def _zip64_extra(extra, values):
+    '''Replaces the 0xffffffff placeholders in values (file size, compressed size and
+    header offset) with the ones from the zip64 extra field.'''
+    i = 0
+    while i + 4 <= len(extra):
+        id, size = struct.unpack('<2H', extra[i:i + 4])
+        if id == 1:
+            data = extra[i + 4:i + 4 + size]
+            values = list(values)
+            for j, value in enumerate(values):
+                if value == 0xffffffff and len(data) >= 8:
+                    values[j] = struct.unpack('<Q', data[:8])[0]
+                    data = data[8:]
+            break
+        i += 4 + size
+    return values
+
+
+def read_central_directory(f, encoding='CP437'):
+    '''Reads the central directory at the end of a zip file, without touching any of
+    the members. f is an open file, its position is left unchanged, or the contents
+    of the zip file in memory (a str, bytearray, memoryview or mmap). Returns a list
+    of CentralDirectoryEntry, raises ValueError if f is not a zip file. Names flagged
+    as UTF-8 are decoded as such, others using encoding.'''
+    if not hasattr(f, 'fileno'):
+        return _read_central_directory(lambda offset, size: _bytes_at(f, offset, size), len(f), encoding)
+    fd = f.fileno()
+    position = os.lseek(fd, 0, os.SEEK_CUR)
+    try:
+        return _read_central_directory(lambda offset, size: _pread(fd, offset, size),
+                                       os.fstat(fd).st_size, encoding)
+    finally:
+        os.lseek(fd, position, os.SEEK_SET)
+
+
+def _read_central_directory(pread, filesize, encoding):
+    start = max(0, filesize - END_RECORD.size - MAX_COMMENT)
+    tail = pread(start, filesize - start)
+    i = tail.rfind(END_SIGNATURE)
+    if i < 0 or len(tail) - i < END_RECORD.size:
+        raise ValueError('No zip end of central directory record found.')
+    end = start + i
+    count, cdsize, cdoffset = END_RECORD.unpack(tail[i:i + END_RECORD.size])[4:7]
+    cdend = end
+    if end >= ZIP64_LOCATOR.size:
+        locator = pread(end - ZIP64_LOCATOR.size, ZIP64_LOCATOR.size)
+        if locator[:4] == ZIP64_LOCATOR_SIGNATURE:
+            record = pread(ZIP64_LOCATOR.unpack(locator)[2], ZIP64_RECORD.size)
+            if len(record) < ZIP64_RECORD.size or record[:4] != ZIP64_RECORD_SIGNATURE:
+                raise ValueError('Corrupt zip64 end of central directory record.')
+            count, cdsize, cdoffset = ZIP64_RECORD.unpack(record)[7:10]
+            cdend = end - ZIP64_LOCATOR.size - ZIP64_RECORD.size
+    # Data prepended to the archive (self-extracting zips) shifts all offsets.
+    concat = cdend - cdsize - cdoffset
+    if concat < 0:
+        raise ValueError('Corrupt zip central directory.')
+    directory = pread(cdoffset + concat, cdsize)
+    entries = []
+    i = 0
+    for n in xrange(count):
+        header = directory[i:i + CENTRAL_HEADER.size]
+        if len(header) < CENTRAL_HEADER.size or header[:4] != CENTRAL_SIGNATURE:
+            raise ValueError('Corrupt zip central directory.')
+        header = CENTRAL_HEADER.unpack(header)
+        flag_bits, compress_type, dostime, dosdate, crc = header[5:10]
+        namelen, extralen, commentlen = header[12:15]
+        i += CENTRAL_HEADER.size
+        filename = directory[i:i + namelen]
+        extra = directory[i + namelen:i + namelen + extralen]
+        i += namelen + extralen + commentlen
+        file_size, compress_size, header_offset = _zip64_extra(extra, (header[11], header[10], header[18]))
+        date_time = ((dosdate >> 9) + 1980, (dosdate >> 5) & 0xf, dosdate & 0x1f,
+                     dostime >> 11, (dostime >> 5) & 0x3f, (dostime & 0x1f) * 2)
+        entries.append(CentralDirectoryEntry(
+            filename.decode('utf-8' if flag_bits & 0x800 else encoding), flag_bits,
+            compress_type, date_time, crc, compress_size, file_size,
+            header_offset + concat, header[17]))
+    return entries
+
+
 class ZipEntry(Entry):
     def __init__(self, *args, **kwargs):
         super(ZipEntry, self).__init__(*args, **kwargs)
@@ -87,17 +186,56 @@ class ZipEntry(Entry):
 
 
 class ZipFile(SeekableArchive):
-    def __init__(self, f, mode='r', compression=ZIP_DEFLATED, allowZip64=False):
-        super(ZipFile, self).__init__(f, mode=mode, format='zip', entry_class=ZipEntry, encoding='CP437')
+    def __init__(self, f, mode='r', compression=ZIP_DEFLATED, allowZip64=False, options=None, mmap=False):
         if mode == 'w' and compression == ZIP_STORED:
             # Disable compression for writing.
-            _libarchive.archive_write_set_format_option(self.archive._a, "zip", "compression", "store")
+            if isinstance(options, basestring):
+                options += ',zip:compression=store'
+            else:
+                options = dict(options or {}, **{'zip:compression': 'store'})
         self.compression = compression
+        # Central directory entries of stored members by name, see _stored_span().
+        self._stored = None
+        super(ZipFile, self).__init__(f, mode=mode, format='zip', entry_class=ZipEntry, encoding='CP437',
+                                      options=options, mmap=mmap)
 
     getinfo     = SeekableArchive.getentry
 
     def namelist(self):
-        return list(self.iterpaths)
+        if self.mode == 'r' and not self.eof:
+            # Read the names from the central directory instead of scanning the members.
+            try:
+                f = self.f if self._buffer is None else self._buffer
+                return [e.filename for e in read_central_directory(f, self.encoding)]
+            except (AttributeError, IOError, OSError, ValueError, struct.error):
+                pass
+        return list(self.iterpaths())
+
+    def _stored_span(self):
+        '''Finds the data of stored members through the central directory.'''
+        if self._buffer is None and self._fd is None:
+            return None
+        if self._stored is None:
+            self._stored = {}
+            try:
+                f = self.f if self._buffer is None else self._buffer
+                for e in read_central_directory(f, self.encoding):
+                    if e.filename in self._stored:
+                        # Can't tell duplicates apart.
+                        self._stored[e.filename] = None
+                    elif e.compress_type == ZIP_STORED and not e.flag_bits & 1:
+                        self._stored[e.filename] = e
+            except (IOError, OSError, ValueError, struct.error):
+                pass
+        pathname = _libarchive.archive_entry_pathname(self._e)
+        e = self._stored.get(pathname and pathname.decode(self.encoding))
+        if e is None:
+            return None
+        header = self._read_at(e.header_offset, LOCAL_HEADER.size)
+        if len(header) < LOCAL_HEADER.size or header[:4] != LOCAL_SIGNATURE:
+            return None
+        namelen, extralen = LOCAL_HEADER.unpack(header)[9:11]
+        return e.header_offset + LOCAL_HEADER.size + namelen + extralen, e.compress_size
 
     def infolist(self):
         return list(self)
@@ -117,19 +255,22 @@ class ZipFile(SeekableArchive):
             path = os.getcwd()
         return self.readpath(name, os.path.join(path, name))
 
-    def extractall(self, path, names=None, pwd=None):
+    def extractall(self, path=None, names=None, pwd=None):
         if pwd:
             raise NotImplemented('Encryption not supported.')
+        if not path:
+            path = os.getcwd()
         if not names:
-            names = self.namelist()
-        if names:
-            for name in names:
-                self.extract(name, path)
+            # Let libarchive extract everything in one pass.
+            SeekableArchive.extractall(self, path)
+            return
+        for name in names:
+            self.extract(name, path)
 
     def read(self, name, pwd=None):
         if pwd:
             raise NotImplemented('Encryption not supported.')
-        return self.read(name)
+        return super(ZipFile, self).read(name)
 
     def writestr(self, member, data, compress_type=None):
         if compress_type != self.compression:
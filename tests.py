@@ -26,10 +26,18 @@
 # (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
 # SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
-import os, unittest, tempfile, random, string, subprocess
+import os, io, mmap, socket, warnings, unittest, tempfile, random, string, subprocess, tarfile, zipfile, gzip, StringIO
 
-from libarchive import is_archive_name, is_archive
-from libarchive.zip import is_zipfile, ZipFile, ZipEntry
+from libarchive import Archive, Entry, is_archive_name, is_archive, sniff_format, classify, SeekableArchive, EntryTable, INDEX_SUFFIX
+from libarchive import FILTERS
+from libarchive.zip import is_zipfile, ZipFile, ZipEntry, read_central_directory
+from libarchive.tar import TarFile
+from libarchive.parallel import extract_many, open_archive, compress_block, ParallelGzipArchive, ParallelGzipWriter
+from libarchive.parallel import BLOCK_DATA_SIZE
+try:
+    from libarchive import aio
+except ImportError:
+    aio = None
 
 TMPDIR = tempfile.mkdtemp()
 ZIPCMD = '/usr/bin/zip'
@@ -87,8 +95,425 @@ class TestIsArchiveTar(unittest.TestCase):
         pass
 
 
+def make_temp_tar(name, mode='w'):
+    path = os.path.join(TMPDIR, name)
+    make_temp_files()
+    t = tarfile.open(path, mode)
+    for fname in FILENAMES:
+        t.add(os.path.join(TMPDIR, fname), fname)
+    t.close()
+    return path
+
+
+class TestSniffFormat(unittest.TestCase):
+    def test_formats(self):
+        make_temp_archive()
+        paths = {
+            ZIPPATH: ('zip', None),
+            make_temp_tar('test.tar'): ('gnu', None),
+            make_temp_tar('test.tar.gz', 'w:gz'): ('gnu', 'gz'),
+            make_temp_tar('test.tar.bz2', 'w:bz2'): ('gnu', 'bz2'),
+            os.path.join(TMPDIR, FILENAMES[0]): (None, None),
+        }
+        self.assertEqual(classify(paths), paths)
+        # Open files are left where they were.
+        f = file(ZIPPATH)
+        f.seek(10)
+        self.assertEqual(sniff_format(f), ('zip', None))
+        self.assertEqual(f.tell(), 10)
+        f.close()
+
+    def test_filters(self):
+        make_temp_files()
+        for filter in FILTERS:
+            path = os.path.join(TMPDIR, 'sniff-%s.tar' % filter)
+            a = Archive(path, 'w', format='tar', filter=filter)
+            for name in FILENAMES:
+                a.writepath(os.path.join(TMPDIR, name), name)
+            a.close()
+            # The fast path agrees with libarchive's bidding.
+            self.assertEqual(sniff_format(path)[1], filter)
+            self.assertEqual(sniff_format(path)[0] is not None, is_archive(path))
+
+
+class TestSeek(unittest.TestCase):
+    def _read_out_of_order(self, path):
+        a = SeekableArchive(path)
+        for fname in FILENAMES + list(reversed(FILENAMES)):
+            self.assertEqual(a.read(fname), file(os.path.join(TMPDIR, fname)).read())
+        # Reading the same entry twice rereads its data.
+        self.assertEqual(a.read(FILENAMES[0]), a.read(FILENAMES[0]))
+        self.assertEqual([e.pathname for e in a], FILENAMES)
+        # So does reading the last entry after a scan to the end of the archive.
+        b = SeekableArchive(path)
+        self.assertEqual(len(list(b)), len(FILENAMES))
+        self.assertEqual(b.read(FILENAMES[-1]), file(os.path.join(TMPDIR, FILENAMES[-1])).read())
+        b.close()
+        return a
+
+    def test_zip(self):
+        make_temp_archive()
+        a = self._read_out_of_order(ZIPPATH)
+        self.assertFalse(a._jump)
+        a.close()
+
+    def test_tar(self):
+        a = self._read_out_of_order(make_temp_tar('test.tar'))
+        self.assertTrue(a._jump)
+        # Readers opened at a header get blocks sized for the entry.
+        a.read(FILENAMES[-1])
+        self.assertTrue(a.blocksize < a._scan_blocksize)
+        a.close()
+
+    def test_tar_extractall(self):
+        path = tempfile.mkdtemp()
+        t = TarFile(make_temp_tar('test.tar'))
+        self.assertEqual(t.read(FILENAMES[-1]), file(os.path.join(TMPDIR, FILENAMES[-1])).read())
+        t.extractall(path)
+        self.assertEqual(sorted(os.listdir(path)), sorted(FILENAMES))
+        # The archive is still usable afterwards.
+        self.assertEqual(t.read(FILENAMES[0]), file(os.path.join(TMPDIR, FILENAMES[0])).read())
+        t.close()
+
+    def test_unsafe_extractall(self):
+        path, outside = tempfile.mkdtemp(), tempfile.mkdtemp()
+        tarpath = os.path.join(TMPDIR, 'unsafe.tar')
+        t = tarfile.open(tarpath, 'w')
+        rejected = ('../dotdot.txt', os.path.join(outside, 'absolute.txt'), os.path.join(outside, 'other.txt'))
+        for name in rejected + ('safe.txt', ):
+            info = tarfile.TarInfo(name)
+            info.size = 4
+            t.addfile(info, StringIO.StringIO('data'))
+        t.close()
+        cwd = os.getcwd()
+        os.chdir(path)
+        try:
+            with warnings.catch_warnings(record=True) as caught:
+                warnings.simplefilter('always')
+                a = Archive(tarpath)
+                # Rejected entries are skipped, the rest is still extracted.
+                self.assertEqual(a.extractall(), (1, 4))
+                a.close()
+        finally:
+            os.chdir(cwd)
+        # Every skipped entry is reported.
+        self.assertEqual(len(caught), len(rejected))
+        for name, warning in zip(rejected, caught):
+            self.assertTrue(os.path.basename(name) in str(warning.message), str(warning.message))
+        self.assertEqual(os.listdir(path), ['safe.txt'])
+        self.assertEqual(os.listdir(outside), [])
+
+    def test_tar_gz(self):
+        a = self._read_out_of_order(make_temp_tar('test.tar.gz', 'w:gz'))
+        self.assertFalse(a._jump)
+        a.close()
+
+    def test_listing(self):
+        t = TarFile(make_temp_tar('test.tar'))
+        self.assertEqual(t.getnames(), FILENAMES)
+        s = StringIO.StringIO()
+        t.list(s)
+        self.assertEqual([l.split('\t')[2] for l in s.getvalue().splitlines()], FILENAMES)
+        t.close()
+
+    def test_entry_table(self):
+        a = SeekableArchive(make_temp_tar('test.tar'))
+        entries = list(a)
+        self.assertTrue(isinstance(a.entries, EntryTable))
+        # Entries still in use are shared, others are rebuilt from the columns.
+        self.assertTrue(a.entries[-1] is entries[-1])
+        rows = list(a.entries.rows())
+        del entries
+        entry = a.entries[0]
+        self.assertEqual((entry.pathname, entry.size, entry.mtime, entry.mode, entry.hpos), rows[0])
+        self.assertEqual([e.pathname for e in a.entries[1:]], FILENAMES[1:])
+        self.assertEqual(a.read(entry), file(os.path.join(TMPDIR, FILENAMES[0])).read())
+        a.close()
+
+
+def read_tree(path):
+    '''Returns {relative path: contents} for all files below path.'''
+    tree = {}
+    for root, dirs, files in os.walk(path):
+        for name in files:
+            fullpath = os.path.join(root, name)
+            tree[os.path.relpath(fullpath, path)] = file(fullpath).read()
+    return tree
+
+
+class TestExtractMany(unittest.TestCase):
+    def test_matches_serial(self):
+        paths = [make_temp_tar('many%d.tar.gz' % i, 'w:gz') for i in range(4)]
+        paths.append(os.path.join(TMPDIR, 'missing.tar'))
+        parallel, serial = tempfile.mkdtemp(), tempfile.mkdtemp()
+        results = extract_many(paths, parallel, workers=3)
+        self.assertEqual([r.path for r in results], paths)
+        self.assertTrue(all(r.ok for r in results[:-1]))
+        self.assertFalse(results[-1].ok)
+        for path, result in zip(paths, extract_many(paths, serial, workers=1)):
+            if result.ok:
+                self.assertEqual(result.entries, len(FILENAMES))
+                self.assertEqual(result.bytes, sum(len(file(os.path.join(TMPDIR, f)).read()) for f in FILENAMES))
+        self.assertEqual(sorted(os.listdir(parallel)), ['many%d' % i for i in range(4)])
+        self.assertEqual(read_tree(parallel), read_tree(serial))
+
+    def test_shared_dest(self):
+        paths = [make_temp_tar('shared%d.tar' % i) for i in range(8)]
+        dest = os.path.join(tempfile.mkdtemp(), 'missing')
+        results = extract_many(paths, dest, workers=8, subdirs=False)
+        self.assertTrue(all(r.ok for r in results))
+        self.assertEqual(sorted(os.listdir(dest)), sorted(FILENAMES))
+
+
+def make_block_gzip(path, data):
+    f = file(path, 'wb')
+    for i in range(0, len(data), BLOCK_DATA_SIZE):
+        f.write(compress_block(data[i:i + BLOCK_DATA_SIZE]))
+    f.close()
+    return path
+
+
+class TestParallelGzip(unittest.TestCase):
+    def test_read(self):
+        tar = file(make_temp_tar('test.tar')).read()
+        path = make_block_gzip(os.path.join(TMPDIR, 'block.tar.gz'), tar)
+        self.assertEqual(gzip.open(path).read(), tar)
+        a = open_archive(path, workers=2)
+        self.assertTrue(isinstance(a, ParallelGzipArchive))
+        for entry in a:
+            self.assertEqual(a.read(entry.size), file(os.path.join(TMPDIR, entry.pathname)).read())
+        a.close()
+        # Regular gzip files are opened as usual.
+        self.assertFalse(isinstance(open_archive(make_temp_tar('test.tar.gz', 'w:gz')), ParallelGzipArchive))
+
+    def test_corrupt(self):
+        tar = file(make_temp_tar('test.tar')).read()
+        data = file(make_block_gzip(os.path.join(TMPDIR, 'block.tar.gz'), tar)).read()
+        file(os.path.join(TMPDIR, 'corrupt.tar.gz'), 'wb').write(data[:-20] + '\x00' * 20)
+
+        def read():
+            a = open_archive(os.path.join(TMPDIR, 'corrupt.tar.gz'), workers=2)
+            try:
+                for entry in a:
+                    a.read(entry.size)
+            finally:
+                a.close()
+        self.assertRaises(ValueError, read)
+
+    def test_write(self):
+        path = os.path.join(TMPDIR, 'written.tar.gz')
+        data = ''.join(random.choice(string.printable) for i in range(BLOCK_DATA_SIZE * 3))
+        a = ParallelGzipWriter(path, workers=3)
+        for name in FILENAMES:
+            a.writepath(os.path.join(TMPDIR, name), name)
+        s = a.writestream('big', len(data))
+        s.write(data)
+        s.close()
+        a.close()
+        # Standard tools can read it.
+        t = tarfile.open(path)
+        self.assertEqual(t.getnames(), FILENAMES + ['big'])
+        self.assertEqual(t.extractfile('big').read(), data)
+        t.close()
+        a = open_archive(path, workers=2)
+        self.assertTrue(isinstance(a, ParallelGzipArchive))
+        self.assertEqual([e.pathname for e in a], FILENAMES + ['big'])
+        a.close()
+
+
+@unittest.skipIf(aio is None, 'asyncio or trollius is not installed.')
+class TestAsync(unittest.TestCase):
+    def test_write_read(self):
+        loop = aio.asyncio.new_event_loop()
+        path = os.path.join(TMPDIR, 'async.tar')
+        data = 'async data' * 1000
+        f = file(path, 'w')
+        a = aio.AsyncArchive(Archive(f, 'w', format='tar'), loop)
+        reader = aio.asyncio.StreamReader(loop=loop)
+        reader.feed_data(data)
+        reader.feed_eof()
+        self.assertEqual(loop.run_until_complete(a.write_from('data', reader, len(data))), len(data))
+        loop.run_until_complete(a.close())
+        f.close()
+        a = loop.run_until_complete(aio.AsyncArchive.open(path, loop=loop))
+        entry = loop.run_until_complete(a.next_entry())
+        self.assertEqual(entry.pathname, 'data')
+        stream = loop.run_until_complete(a.readstream(entry))
+        self.assertEqual(loop.run_until_complete(stream.read()), data)
+        self.assertEqual(loop.run_until_complete(a.next_entry()), None)
+        loop.run_until_complete(a.close())
+        a = loop.run_until_complete(aio.AsyncArchive.open(path, loop=loop, archive_class=SeekableArchive))
+        stream = loop.run_until_complete(a.readstream('data'))
+        self.assertEqual(loop.run_until_complete(stream.read()), data)
+        loop.run_until_complete(a.close())
+        loop.close()
+
+    def test_socket_streams(self):
+        asyncio, From = aio.asyncio, aio.asyncio.From
+        loop = asyncio.new_event_loop()
+        left, right = socket.socketpair()
+        reader, _ = loop.run_until_complete(asyncio.open_connection(sock=left, loop=loop))
+        _, writer = loop.run_until_complete(asyncio.open_connection(sock=right, loop=loop))
+        # More than the socket buffers hold, so the two sides have to take turns.
+        data = os.urandom(1024 * 1024)
+
+        @asyncio.coroutine
+        def send():
+            a = yield From(aio.AsyncArchive.open(writer, loop=loop, mode='w', format='tar'))
+            source = asyncio.StreamReader(loop=loop)
+            source.feed_data(data)
+            source.feed_eof()
+            yield From(a.write_from('data', source, len(data)))
+            yield From(a.close())
+            writer.close()
+
+        @asyncio.coroutine
+        def receive():
+            a = yield From(aio.AsyncArchive.open(reader, loop=loop))
+            entry = yield From(a.next_entry())
+            stream = yield From(a.readstream(entry))
+            received = yield From(stream.read())
+            end = yield From(a.next_entry())
+            yield From(a.close())
+            raise asyncio.Return((entry.pathname, received, end))
+
+        sent, received = loop.run_until_complete(asyncio.gather(send(), receive(), loop=loop))
+        self.assertEqual(received, ('data', data, None))
+        left.close()
+        loop.close()
+
+
 # TODO: incorporate tests from:
 # http://hg.python.org/cpython/file/a6e1d926cd98/Lib/test/test_zipfile.py
+class TestFileObject(unittest.TestCase):
+    def test_read(self):
+        data = file(make_temp_tar('test.tar.gz', 'w:gz')).read()
+        for f in (io.BytesIO(data), StringIO.StringIO(data)):
+            a = SeekableArchive(f)
+            for name in reversed(FILENAMES):
+                self.assertEqual(a.read(name), file(os.path.join(TMPDIR, name)).read())
+            a.close()
+
+    def test_write(self):
+        f = io.BytesIO()
+        a = Archive(f, 'w', format='tar', filter='gz')
+        for name in FILENAMES:
+            a.writepath(os.path.join(TMPDIR, name), name)
+        a.close()
+        t = tarfile.open(fileobj=io.BytesIO(f.getvalue()))
+        self.assertEqual(t.getnames(), FILENAMES)
+        t.close()
+
+    def test_error(self):
+        class Broken(object):
+            def read(self, size):
+                raise IOError('connection reset')
+        try:
+            Archive(Broken())
+        except Exception as e:
+            self.assertTrue('connection reset' in str(e))
+        else:
+            self.fail('No exception raised.')
+
+    def test_write_error(self):
+        class Broken(object):
+            def write(self, data):
+                raise IOError('disk full')
+        # Small entries only reach the file object when the archive is closed.
+        for size in (10, 100000):
+            a = Archive(Broken(), 'w', format='tar')
+            try:
+                a.write(Entry(pathname='data', mode=0100644, mtime=0), 'data' * size)
+                a.close()
+            except Exception as e:
+                self.assertTrue('disk full' in str(e))
+            else:
+                self.fail('No exception raised.')
+
+
+class TestMemory(unittest.TestCase):
+    def test_from_buffer(self):
+        make_temp_archive()
+        with file(ZIPPATH, 'rb') as f:
+            data = f.read()
+            m = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        for buf in (data, bytearray(data), memoryview(data), m):
+            a = SeekableArchive.from_buffer(buf)
+            for name in reversed(FILENAMES):
+                self.assertEqual(a.read(name), file(os.path.join(TMPDIR, name)).read())
+            a.close()
+        m.close()
+
+    def test_mmap(self):
+        a = SeekableArchive(make_temp_tar('test.tar'), mmap=True)
+        for name in reversed(FILENAMES):
+            stream = a.readstream(name)
+            self.assertEqual(stream.view().tobytes(), file(os.path.join(TMPDIR, name)).read())
+            stream.close()
+        a.close()
+        for compression in (zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED):
+            z = ZipFile(ZIPPATH, 'w', compression=compression)
+            for name in FILENAMES:
+                z.writepath(os.path.join(TMPDIR, name), name)
+            z.close()
+            z = ZipFile(ZIPPATH, mmap=True)
+            for entry in z:
+                view = z.readview()
+                if compression == zipfile.ZIP_STORED:
+                    self.assertEqual(view.tobytes(), file(os.path.join(TMPDIR, entry.pathname)).read())
+                else:
+                    self.assertEqual(view, None)
+            z.close()
+
+    def test_readpath_stored(self):
+        path = make_temp_tar('test.tar')
+        for kwargs in ({}, {'mmap': True}):
+            a = SeekableArchive(path, **kwargs)
+            for name in reversed(FILENAMES):
+                dest = os.path.join(TMPDIR, 'out', name)
+                a.readpath(name, dest)
+                self.assertEqual(file(dest).read(), file(os.path.join(TMPDIR, name)).read())
+            a.close()
+
+    def test_to_bytes(self):
+        a = Archive(None, 'w', format='tar', filter='gz')
+        for name in FILENAMES:
+            a.writepath(os.path.join(TMPDIR, name), name)
+        data = a.to_bytes()
+        self.assertEqual(a.to_bytes(), data)
+        a = Archive.from_buffer(data)
+        self.assertEqual([entry.pathname for entry in a], FILENAMES)
+        a.close()
+
+
+class TestFilters(unittest.TestCase):
+    def write(self, filter, **kwargs):
+        a = Archive(None, 'w', format='tar', filter=filter, **kwargs)
+        for name in FILENAMES:
+            a.writepath(os.path.join(TMPDIR, name), name)
+        return a.to_bytes()
+
+    def test_filters(self):
+        make_temp_files()
+        for filter in FILTERS:
+            a = Archive.from_buffer(self.write(filter), filter=filter)
+            self.assertEqual([entry.pathname for entry in a], FILENAMES)
+            a.close()
+
+    def test_filter_options(self):
+        make_temp_files()
+        fast = self.write('gz', filter_options={'compression-level': 1})
+        best = self.write('gz', filter_options={'compression-level': 9})
+        self.assertTrue(len(best) < len(fast))
+        self.assertRaises(Exception, self.write, 'gz', filter_options={'no-such-option': 1})
+
+    def test_options(self):
+        make_temp_files()
+        self.assertEqual(self.write('xz', options='xz:compression-level=1'),
+                         self.write('xz', options={'xz:compression-level': 1}))
+        self.assertRaises(Exception, self.write, None, options={'tar:no-such-option': 1})
+
+
 class TestZipRead(unittest.TestCase):
     def setUp(self):
         make_temp_archive()
@@ -105,6 +530,22 @@ class TestZipRead(unittest.TestCase):
             count += 1
         self.assertEqual(count, len(FILENAMES), 'Did not enumerate correct number of items in archive.')
 
+    def test_namelist(self):
+        z = ZipFile(ZIPPATH, 'r')
+        self.assertEqual(z.namelist(), FILENAMES)
+        # The central directory is read without disturbing the reader.
+        self.assertEqual(z.read(FILENAMES[0]), file(os.path.join(TMPDIR, FILENAMES[0])).read())
+        self.assertEqual(z.namelist(), FILENAMES)
+        z.close()
+        f = file(ZIPPATH)
+        expected = [(i.filename, i.compress_type, i.date_time, i.CRC, i.compress_size, i.file_size, i.header_offset)
+                    for i in zipfile.ZipFile(ZIPPATH).infolist()]
+        found = [(e.filename, e.compress_type, e.date_time, e.CRC, e.compress_size, e.file_size, e.header_offset)
+                 for e in read_central_directory(f)]
+        self.assertEqual(found, expected)
+        self.assertRaises(ValueError, read_central_directory, file(os.path.join(TMPDIR, FILENAMES[0])))
+        f.close()
+
     def test_deferred_close_by_archive(self):
         """ Test archive deferred close without a stream. """
         f = file(ZIPPATH, mode='r')
@@ -152,6 +593,90 @@ class TestZipRead(unittest.TestCase):
             names.append(e.filename)
         self.assertEqual(names, FILENAMES, 'File names differ in archive.')
 
+    def test_blocksize(self):
+        make_temp_archive()
+        z = ZipFile(ZIPPATH, 'r')
+        # Small files are read in one block.
+        self.assertEqual(z.blocksize, 64 * 1024)
+        self.assertEqual(z.read(FILENAMES[0]), file(os.path.join(TMPDIR, FILENAMES[0])).read())
+        z.close()
+        r, w = os.pipe()
+        os.close(w)
+        a = Archive(os.fdopen(r))
+        self.assertEqual(a.blocksize, 64 * 1024)
+        a.close()
+
+    def test_readinto(self):
+        f = file(ZIPPATH, mode='r')
+        z = ZipFile(f, 'r')
+        for fname in FILENAMES:
+            expected = file(os.path.join(TMPDIR, fname)).read()
+            stream = z.readstream(fname)
+            buffer = bytearray(4)
+            data = ''
+            while True:
+                count = stream.readinto(buffer)
+                if not count:
+                    break
+                data += str(buffer[:count])
+            self.assertEqual(data, expected)
+            self.assertEqual(stream.tell(), len(expected))
+        z.close()
+
+    def test_iter_blocks(self):
+        f = file(ZIPPATH, mode='r')
+        z = ZipFile(f, 'r')
+        for fname in FILENAMES:
+            expected = file(os.path.join(TMPDIR, fname)).read()
+            stream = z.readstream(fname)
+            data = ''
+            for offset, view in stream.iter_blocks():
+                self.assertEqual(offset, len(data))
+                data += view.tobytes()
+            self.assertEqual(data, expected)
+        z.close()
+
+    def test_getentry(self):
+        f = file(ZIPPATH, mode='r')
+        z = ZipFile(f, 'r')
+        entry = z.getinfo(FILENAMES[-1])
+        self.assertEqual(entry.filename, FILENAMES[-1])
+        self.assertEqual(len(z.entries), len(FILENAMES))
+        self.assertTrue(z.getinfo(FILENAMES[0]) is z.entries[0])
+        self.assertTrue(z.getinfo(entry) is entry)
+        self.assertRaises(KeyError, z.getinfo, 'missing')
+        z.close()
+
+    def test_index(self):
+        index = ZIPPATH + INDEX_SUFFIX
+        if os.path.exists(index):
+            os.remove(index)
+        a = SeekableArchive(ZIPPATH, index=True)
+        self.assertEqual([e.pathname for e in a], FILENAMES)
+        a.close()
+        self.assertTrue(os.path.exists(index))
+        a = SeekableArchive(ZIPPATH, index=True)
+        self.assertTrue(a.eof)
+        self.assertEqual([e.pathname for e in a.entries], FILENAMES)
+        for fname in reversed(FILENAMES):
+            self.assertEqual(a.read(fname), file(os.path.join(TMPDIR, fname)).read())
+        a.close()
+        # A modified archive invalidates the index.
+        st = os.stat(ZIPPATH)
+        os.utime(ZIPPATH, (st.st_atime, st.st_mtime + 10))
+        a = SeekableArchive(ZIPPATH, index=True)
+        self.assertFalse(a.eof)
+        a.close()
+
+    def test_extractall(self):
+        path = tempfile.mkdtemp()
+        z = ZipFile(file(ZIPPATH, mode='r'), 'r')
+        z.extractall(path)
+        z.close()
+        for fname in FILENAMES:
+            self.assertEqual(file(os.path.join(path, fname)).read(),
+                             file(os.path.join(TMPDIR, fname)).read())
+
     #~ def test_non_ascii(self):
         #~ pass
 
@@ -170,6 +695,40 @@ class TestZipWrite(unittest.TestCase):
             z.writepath(file(os.path.join(TMPDIR, fname), 'r'))
         z.close()
 
+    def test_writepath_contents(self):
+        f = file(ZIPPATH, mode='w')
+        z = ZipFile(f, 'w')
+        for fname in FILENAMES:
+            z.writepath(os.path.join(TMPDIR, fname), fname)
+        z.close()
+        z = ZipFile(file(ZIPPATH, mode='r'), 'r')
+        for fname in FILENAMES:
+            self.assertEqual(z.read(fname), file(os.path.join(TMPDIR, fname)).read())
+        z.close()
+
+    def test_writepath_offset(self):
+        path = os.path.join(TMPDIR, 'partial.bin')
+        file(path, 'wb').write(''.join(chr(i) for i in range(100)))
+        f = file(path, 'rb')
+        f.read(50)
+        z = ZipFile(file(ZIPPATH, mode='w'), 'w')
+        z.writepath(f, 'partial.bin')
+        z.close()
+        f.close()
+        z = ZipFile(file(ZIPPATH, mode='r'), 'r')
+        self.assertEqual(z.read('partial.bin'), ''.join(chr(i) for i in range(50, 100)))
+        z.close()
+
+    def test_stored(self):
+        f = io.BytesIO()
+        z = ZipFile(f, 'w', compression=zipfile.ZIP_STORED)
+        for fname in FILENAMES:
+            z.writepath(os.path.join(TMPDIR, fname), fname)
+        z.close()
+        z = zipfile.ZipFile(io.BytesIO(f.getvalue()))
+        self.assertEqual(set(i.compress_type for i in z.infolist()), set([zipfile.ZIP_STORED]))
+        z.close()
+
     def test_writestream(self):
         f = file(ZIPPATH, mode='w')
         z = ZipFile(f, 'w')
@@ -186,6 +745,19 @@ class TestZipWrite(unittest.TestCase):
             i.close()
         z.close()
 
+    def test_writestream_spooled(self):
+        f = file(ZIPPATH, mode='w')
+        z = ZipFile(f, 'w')
+        for fname in FILENAMES:
+            o = z.writestream(fname, spool_size=4)
+            o.write(file(os.path.join(TMPDIR, fname)).read())
+            o.close()
+        z.close()
+        z = ZipFile(file(ZIPPATH, mode='r'), 'r')
+        for fname in FILENAMES:
+            self.assertEqual(z.read(fname), file(os.path.join(TMPDIR, fname)).read())
+        z.close()
+
     def test_writestream_unbuffered(self):
         f = file(ZIPPATH, mode='w')
         z = ZipFile(f, 'w')